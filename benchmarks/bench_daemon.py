@@ -0,0 +1,80 @@
+"""Compare per-command latency with and without the daemon
+
+Usage:
+    python -m benchmarks.bench_daemon [--runs N] [--command "accounts list --format tsv"]
+
+Each run is a fresh `python -m ga_cli` process, as a shell script would
+start it. The command first runs in-process (GA_CLI_NO_DAEMON=1), then
+through a daemon started for the benchmark. The default command needs no
+credentials; pass an Admin API command to include auth and RPC set-up.
+"""
+
+import argparse
+import os
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+from ga_cli.daemon import DISABLE_ENV, control
+
+
+def run_command(args, use_daemon):
+    """Return the wall time of one ga-cli process"""
+    env = dict(os.environ)
+    if use_daemon:
+        env.pop(DISABLE_ENV, None)
+    else:
+        env[DISABLE_ENV] = '1'
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, '-m', 'ga_cli'] + args, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True,
+    )
+    return time.perf_counter() - start
+
+
+def measure(args, runs, use_daemon):
+    """Run a command repeatedly; the first run warms the OS caches and is dropped"""
+    run_command(args, use_daemon)
+    return [run_command(args, use_daemon) for _ in range(runs)]
+
+
+def report(label, samples):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(
+        f"{label:<12}{statistics.mean(samples) * 1000:>10.1f}"
+        f"{statistics.median(samples) * 1000:>10.1f}{p95 * 1000:>10.1f}"
+    )
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--command', default='config show',
+                        help='ga-cli command line to time (default: "config show")')
+    args = parser.parse_args()
+    command = shlex.split(args.command)
+
+    print(f"ga-cli {args.command}: {args.runs} runs, milliseconds")
+    print(f"{'mode':<12}{'mean':>10}{'median':>10}{'p95':>10}")
+    local = report('in-process', measure(command, args.runs, use_daemon=False))
+
+    started = control('status') is None
+    if started:
+        subprocess.run([sys.executable, '-m', 'ga_cli', 'daemon', 'start'],
+                       stdout=subprocess.DEVNULL, check=True)
+    try:
+        daemon = report('daemon', measure(command, args.runs, use_daemon=True))
+    finally:
+        if started:
+            subprocess.run([sys.executable, '-m', 'ga_cli', 'daemon', 'stop'],
+                           stdout=subprocess.DEVNULL, check=True)
+
+    print(f"speed-up: {local / daemon:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
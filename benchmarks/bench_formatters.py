@@ -0,0 +1,66 @@
+"""Compare list renderers on synthetic rows
+
+Usage:
+    python -m benchmarks.bench_formatters [--rows N]
+
+Reports rows/sec for the Rich table, TSV, CSV, JSON and NDJSON renderers.
+Output is written to os.devnull so only rendering cost is measured.
+"""
+
+import argparse
+import contextlib
+import os
+import time
+from ga_cli.formatters.json import format_json, format_ndjson
+from ga_cli.formatters.plain import format_csv, format_tsv
+from ga_cli.formatters.table import format_table
+
+
+def synthetic_rows(count):
+    """Rows shaped like `properties list` output"""
+    return [
+        {
+            'id': str(300000000 + i),
+            'name': f"Property {i}",
+            'type': 'PROPERTY_TYPE_ORDINARY',
+            'timezone': 'America/Los_Angeles',
+            'currency': 'USD',
+        }
+        for i in range(count)
+    ]
+
+
+RENDERERS = {
+    'table': lambda rows: format_table(rows, title='Benchmark'),
+    'tsv': format_tsv,
+    'csv': format_csv,
+    'json': format_json,
+    'ndjson': format_ndjson,
+}
+
+
+def measure(render, rows):
+    """Return rows/sec for one renderer"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        render(rows)
+        elapsed = time.perf_counter() - start
+    return len(rows) / elapsed if elapsed else float('inf')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=10000)
+    args = parser.parse_args()
+
+    rows = synthetic_rows(args.rows)
+    baseline = None
+    print(f"{'renderer':<10}{'rows/sec':>14}{'vs table':>10}")
+    for name, render in RENDERERS.items():
+        rate = measure(render, rows)
+        baseline = baseline or rate
+        print(f"{name:<10}{rate:>14,.0f}{rate / baseline:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Compare dict rows with namedtuple rows for property listings
+
+Usage:
+    python -m benchmarks.bench_rows [--rows N]
+
+Converts N Admin API Property messages into output rows, once with the
+per-row dicts commands used to build and once with ga_cli.rows. Reports
+conversion rows/sec, memory per retained row (as the table view and
+multi-account listings hold them) and rows/sec for conversion plus TSV
+rendering to os.devnull.
+"""
+
+import argparse
+import contextlib
+import gc
+import os
+import time
+import tracemalloc
+from google.analytics.admin_v1alpha.types import Property, PropertyType
+from ga_cli.formatters.plain import format_tsv
+from ga_cli.rows import property_row
+
+
+def dict_row(property):
+    """The dict row properties list built before row types"""
+    return {
+        'id': property.name.split('/')[-1] if '/' in property.name else property.name,
+        'name': property.display_name or 'N/A',
+        'type': property.property_type.name if property.property_type else 'N/A',
+        'timezone': property.time_zone or 'N/A',
+        'currency': property.currency_code or 'N/A',
+    }
+
+
+CONVERTERS = {'dict': dict_row, 'namedtuple': property_row}
+
+
+def synthetic_properties(count):
+    return [
+        Property(
+            name=f"properties/{300000000 + i}",
+            parent='accounts/100000',
+            display_name=f"Property {i}",
+            property_type=PropertyType.PROPERTY_TYPE_ORDINARY,
+            time_zone='America/Los_Angeles',
+            currency_code='USD',
+        )
+        for i in range(count)
+    ]
+
+
+def rows_per_second(func, count):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    return count / elapsed if elapsed else float('inf')
+
+
+def bytes_per_row(convert, properties):
+    """Memory held by a list of converted rows, per row"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rows = [convert(p) for p in properties]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rows
+    return (after - before) / len(properties)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50000)
+    args = parser.parse_args()
+
+    properties = synthetic_properties(args.rows)
+    print(f"{args.rows} properties")
+    print(f"{'row type':<12}{'convert/s':>14}{'bytes/row':>12}{'convert+tsv/s':>16}")
+    for name, convert in CONVERTERS.items():
+        converted = rows_per_second(lambda: [convert(p) for p in properties], args.rows)
+        size = bytes_per_row(convert, properties)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            rendered = rows_per_second(
+                lambda: format_tsv(convert(p) for p in properties), args.rows
+            )
+        print(f"{name:<12}{converted:>14,.0f}{size:>12,.0f}{rendered:>16,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+"""Benchmark the list commands end to end against a synthetic organization
+
+Usage:
+    python -m benchmarks.bench_suite [--accounts N] [--properties N] [--streams N]
+                                     [--latency MS] [--repeat N]
+                                     [--check | --save] [--baseline PATH] [--threshold PCT]
+
+Every list command runs through the real CLI, in every output format, with
+a benchmarks.fake_client.FakeAdminClient standing in for the Admin API.
+For each run the suite reports rows/sec, time to first row (first byte
+written to stdout) and peak traced memory, plus the cold start time of a
+fresh `ga-cli --help` process.
+
+--save stores the results as the baseline (benchmarks/baseline.json by
+default). --check compares against it and exits with status 1 when any
+measurement is worse by more than --threshold percent (default 20).
+Baselines only compare on the machine and with the sizes they were taken
+with; sizes are stored with them and checked.
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from benchmarks.fake_client import FIRST_ACCOUNT, FakeAdminClient, FakeAuth
+from ga_cli.decorators import LIST_FORMATS
+
+DEFAULT_BASELINE = Path(__file__).with_name('baseline.json')
+DEFAULT_THRESHOLD = 20.0  # percent
+
+CREDENTIALS = 'benchmark-credentials.json'
+
+# Differences below these are noise whatever the percentage
+ABSOLUTE_SLACK = {'rows_per_sec': 0.0, 'ttfr_ms': 2.0, 'peak_mib': 0.5, 'cold_start_ms': 25.0}
+
+# Measurements where a larger number is better
+HIGHER_IS_BETTER = {'rows_per_sec'}
+
+
+class _Sink(io.RawIOBase):
+    """Binary stdout replacement recording when the first byte arrives"""
+
+    def __init__(self):
+        self.first_write = None
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self.first_write is None:
+            self.first_write = time.perf_counter()
+        return len(data)
+
+
+def scenarios(client):
+    """(name, argv, rows) for every list command and output format"""
+    properties = client.accounts * client.properties_per_account
+    commands = [
+        ('accounts list', ['accounts', 'list'], client.accounts),
+        ('accounts tree', ['accounts', 'tree'], properties),
+        ('properties list', ['properties', 'list', str(FIRST_ACCOUNT)],
+         client.properties_per_account),
+        ('properties list --all-accounts', ['properties', 'list', '--all-accounts'], properties),
+        ('datastreams list', ['datastreams', 'list', client.first_property_id], client.streams_per_property),
+    ]
+    for name, argv, rows in commands:
+        for format_type in LIST_FORMATS:
+            if name == 'accounts tree' and format_type == 'ids':
+                continue
+            yield f"{name} --format {format_type}", argv + ['--format', format_type], rows
+    yield 'inventory crawl', ['inventory', 'crawl'], (
+        client.accounts + properties + properties * client.streams_per_property
+    )
+
+
+def invoke(client, argv):
+    """Run one command in-process; returns (seconds, seconds to first byte)"""
+    from ga_cli.cli import cli
+
+    sink = _Sink()
+    saved = sys.stdout, sys.stderr
+    sys.stdout = io.TextIOWrapper(sink, encoding='utf-8', write_through=True)
+    sys.stderr = io.StringIO()
+    start = time.perf_counter()
+    try:
+        cli.main(
+            ['--credentials', CREDENTIALS, '--no-cache'] + argv, prog_name='ga-cli',
+            obj={'auth_sessions': {CREDENTIALS: FakeAuth(client)}}, standalone_mode=False,
+        )
+        sys.stdout.flush()
+    finally:
+        elapsed = time.perf_counter() - start
+        sys.stdout, sys.stderr = saved
+    first = (sink.first_write or start + elapsed) - start
+    return elapsed, first
+
+
+def measure(client, argv, rows, repeat):
+    """Best-of-N timing and one traced run for peak memory"""
+    invoke(client, argv)  # warm imports and the client's page cache
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        timings.append(invoke(client, argv))
+    elapsed = min(t[0] for t in timings)
+    first = min(t[1] for t in timings)
+
+    gc.collect()
+    tracemalloc.start()
+    invoke(client, argv)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'rows_per_sec': round(rows / elapsed, 1),
+        'ttfr_ms': round(first * 1000, 2),
+        'peak_mib': round(peak / 2**20, 2),
+    }
+
+
+def cold_start(runs):
+    """Median wall time of `python -m ga_cli --help` in fresh processes"""
+    env = dict(os.environ, GA_CLI_NO_DAEMON='1')
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, '-m', 'ga_cli', '--help'], env=env, check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        times.append(time.perf_counter() - start)
+    return round(statistics.median(times) * 1000, 1)
+
+
+def compare(results, baseline, threshold):
+    """Lines describing measurements worse than the baseline by > threshold%"""
+    regressions = []
+    measured = dict(results['scenarios'])
+    measured['ga-cli --help'] = {'cold_start_ms': results['cold_start_ms']}
+    expected = dict(baseline['scenarios'])
+    expected['ga-cli --help'] = {'cold_start_ms': baseline['cold_start_ms']}
+    for name, values in measured.items():
+        for key, value in values.items():
+            base = expected.get(name, {}).get(key)
+            if base is None:
+                continue
+            if key in HIGHER_IS_BETTER:
+                worse = base - value
+            else:
+                worse = value - base
+            if worse > ABSOLUTE_SLACK[key] and base and worse / base * 100 > threshold:
+                regressions.append(f"{name}: {key} {value:g} vs baseline {base:g}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--accounts', type=int, default=100)
+    parser.add_argument('--properties', type=int, default=20, help='Properties per account')
+    parser.add_argument('--streams', type=int, default=3, help='Data streams per property')
+    parser.add_argument('--latency', type=float, default=0.0, help='Milliseconds per request')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--cold-start-runs', type=int, default=5)
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument('--check', action='store_true', help='Fail on regressions')
+    action.add_argument('--save', action='store_true', help='Store results as the baseline')
+    args = parser.parse_args()
+
+    # Keep the user's config, caches and logs out of the measurements
+    os.environ['HOME'] = tempfile.mkdtemp(prefix='ga-cli-bench-')
+
+    client = FakeAdminClient(args.accounts, args.properties, args.streams, args.latency / 1000)
+    sizes = {'accounts': args.accounts, 'properties': args.properties, 'streams': args.streams,
+             'latency_ms': args.latency}
+    results = {'sizes': sizes, 'scenarios': {}}
+
+    print(f"{'scenario':<48}{'rows':>8}{'rows/s':>12}{'first row ms':>14}{'peak MiB':>10}")
+    for name, argv, rows in scenarios(client):
+        values = measure(client, argv, rows, args.repeat)
+        results['scenarios'][name] = values
+        print(f"{name:<48}{rows:>8}{values['rows_per_sec']:>12,.0f}"
+              f"{values['ttfr_ms']:>14.2f}{values['peak_mib']:>10.2f}")
+
+    results['cold_start_ms'] = cold_start(args.cold_start_runs)
+    print(f"{'ga-cli --help cold start':<48}{results['cold_start_ms']:>34.1f} ms")
+
+    if args.save:
+        args.baseline.write_text(json.dumps(results, indent=2) + '\n')
+        print(f"Baseline saved to {args.baseline}")
+    elif args.check:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get('sizes') != sizes:
+            sys.exit(f"Baseline was taken with {baseline.get('sizes')}, not {sizes}")
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:g}% of {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
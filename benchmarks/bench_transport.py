@@ -0,0 +1,182 @@
+"""Compare gRPC and REST transport latency for list and get calls
+
+Usage:
+    python -m benchmarks.bench_transport [--runs N] [--accounts N] [--page-size N]
+
+Both transports talk to local stand-in servers answering ListAccounts and
+GetAccount with canned responses, so the numbers cover client-side
+serialization, framing and connection handling without network noise.
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import grpc
+from google.analytics.admin import AnalyticsAdminServiceClient
+from google.analytics.admin_v1alpha.services.analytics_admin_service.transports import (
+    AnalyticsAdminServiceGrpcTransport,
+    AnalyticsAdminServiceRestTransport,
+)
+from google.analytics.admin_v1alpha.types import (
+    Account,
+    GetAccountRequest,
+    ListAccountsRequest,
+    ListAccountsResponse,
+)
+from google.auth.credentials import AnonymousCredentials
+
+
+SERVICE = 'google.analytics.admin.v1alpha.AnalyticsAdminService'
+
+
+class FakeAccounts:
+    """Canned accounts, paged the way the Admin API pages them"""
+
+    def __init__(self, count):
+        self.accounts = [
+            Account(
+                name=f"accounts/{100000 + i}",
+                display_name=f"Benchmark Account {i}",
+                region_code='US',
+            )
+            for i in range(count)
+        ]
+        self.by_name = {account.name: account for account in self.accounts}
+
+    def page(self, page_size, page_token):
+        start = int(page_token or 0)
+        end = start + (page_size or 50)
+        return ListAccountsResponse(
+            accounts=self.accounts[start:end],
+            next_page_token=str(end) if end < len(self.accounts) else '',
+        )
+
+    def get(self, name):
+        return self.by_name[name]
+
+
+def start_grpc_server(fake):
+    """Serve ListAccounts and GetAccount over insecure gRPC; returns (server, target)"""
+    handler = grpc.method_handlers_generic_handler(SERVICE, {
+        'ListAccounts': grpc.unary_unary_rpc_method_handler(
+            lambda request, context: fake.page(request.page_size, request.page_token),
+            request_deserializer=ListAccountsRequest.deserialize,
+            response_serializer=ListAccountsResponse.serialize,
+        ),
+        'GetAccount': grpc.unary_unary_rpc_method_handler(
+            lambda request, context: fake.get(request.name),
+            request_deserializer=GetAccountRequest.deserialize,
+            response_serializer=Account.serialize,
+        ),
+    })
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+    return server, f"127.0.0.1:{port}"
+
+
+def start_rest_server(fake):
+    """Serve the same calls as proto JSON over HTTP/1.1; returns (server, host)"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are separate writes; Nagle would hold the body back
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/v1alpha/accounts':
+                query = parse_qs(url.query)
+                response = fake.page(
+                    int(query.get('pageSize', ['0'])[0]), query.get('pageToken', [''])[0]
+                )
+                body = ListAccountsResponse.to_json(response)
+            else:
+                body = Account.to_json(fake.get(url.path[len('/v1alpha/'):]))
+            payload = body.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"127.0.0.1:{server.server_address[1]}"
+
+
+def grpc_client(target):
+    return AnalyticsAdminServiceClient(
+        transport=AnalyticsAdminServiceGrpcTransport(channel=grpc.insecure_channel(target))
+    )
+
+
+def rest_client(host):
+    return AnalyticsAdminServiceClient(
+        transport=AnalyticsAdminServiceRestTransport(
+            host=host, credentials=AnonymousCredentials(), url_scheme='http'
+        )
+    )
+
+
+def measure(call, runs):
+    """Time a call repeatedly after one warm-up run"""
+    call()
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def report(label, samples):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(
+        f"{label:<22}{statistics.mean(samples) * 1000:>10.2f}"
+        f"{statistics.median(samples) * 1000:>10.2f}{p95 * 1000:>10.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=50)
+    parser.add_argument('--accounts', type=int, default=500,
+                        help='Accounts returned by the list call (default: 500)')
+    parser.add_argument('--page-size', type=int, default=200)
+    args = parser.parse_args()
+
+    fake = FakeAccounts(args.accounts)
+    grpc_server, grpc_target = start_grpc_server(fake)
+    rest_server, rest_host = start_rest_server(fake)
+    clients = {'grpc': grpc_client(grpc_target), 'rest': rest_client(rest_host)}
+    name = fake.accounts[0].name
+
+    print(f"{args.accounts} accounts, page size {args.page_size}, {args.runs} runs, milliseconds")
+    print(f"{'call':<22}{'mean':>10}{'median':>10}{'p95':>10}")
+    try:
+        for transport, client in clients.items():
+            def list_all():
+                return list(client.list_accounts(request={'page_size': args.page_size}))
+
+            def get_one():
+                return client.get_account(name=name)
+
+            report(f"{transport} list", measure(list_all, args.runs))
+            report(f"{transport} get", measure(get_one, args.runs))
+    finally:
+        grpc_server.stop(None)
+        rest_server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""Synthetic Admin API client for benchmarks
+
+``FakeAdminClient`` serves a generated organization (N accounts, each with
+P properties, each with S data streams) through the methods the list
+commands call. Responses are real Admin API response messages, paged
+by the request's page_size and page_token and returned through pager-like
+objects, so row extraction, pagination and rendering run as they do
+against the API. An optional per-request latency stands in for the network.
+"""
+
+import time
+from types import SimpleNamespace
+from google.analytics.admin_v1alpha.types import (
+    Account,
+    AccountSummary,
+    DataStream,
+    ListAccountsResponse,
+    ListAccountSummariesResponse,
+    ListDataStreamsResponse,
+    ListPropertiesResponse,
+    Property,
+    PropertySummary,
+    PropertyType,
+)
+
+FIRST_ACCOUNT = 100000
+FIRST_PROPERTY = 300000000
+FIRST_STREAM = 5000000000
+
+
+class FakeAdminClient:
+    """Stand-in for AnalyticsAdminServiceClient over a generated organization
+
+    Args:
+        accounts: Number of accounts
+        properties_per_account: Properties under each account
+        streams_per_property: Data streams under each property
+        latency: Seconds each request takes, as if sent over the network
+    """
+
+    def __init__(self, accounts=100, properties_per_account=10, streams_per_property=3,
+                 latency=0.0):
+        self.accounts = accounts
+        self.properties_per_account = properties_per_account
+        self.streams_per_property = streams_per_property
+        self.latency = latency
+        self._pages = {}
+
+    @property
+    def first_property_id(self):
+        return str(FIRST_PROPERTY)
+
+    def list_accounts(self, request=None, timeout=None):
+        return self._serve(request, 'accounts', None, self._accounts, ListAccountsResponse)
+
+    def list_account_summaries(self, request=None, timeout=None):
+        return self._serve(
+            request, 'account_summaries', None, self._summaries, ListAccountSummariesResponse
+        )
+
+    def list_properties(self, request=None, timeout=None):
+        account = int(request['filter'].rsplit('/', 1)[-1])
+        return self._serve(request, 'properties', account, self._properties, ListPropertiesResponse)
+
+    def list_data_streams(self, request=None, timeout=None):
+        prop = int(request['parent'].rsplit('/', 1)[-1])
+        return self._serve(request, 'data_streams', prop, self._streams, ListDataStreamsResponse)
+
+    def _serve(self, request, field, parent, generate, response_type):
+        """Return one page as a pager whose ``pages`` yields only that page
+
+        Pages are built once and reused, so repeated runs measure the
+        command rather than the generator.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        page_size = request.get('page_size') or 50
+        offset = int(request.get('page_token') or 0)
+        key = (field, parent, page_size, offset)
+        response = self._pages.get(key)
+        if response is None:
+            items = generate(parent)
+            end = offset + page_size
+            response = response_type(**{
+                field: items[offset:end],
+                'next_page_token': str(end) if end < len(items) else '',
+            })
+            self._pages[key] = response
+        return SimpleNamespace(pages=iter([response]))
+
+    def _accounts(self, parent):
+        return [self._account(FIRST_ACCOUNT + i) for i in range(self.accounts)]
+
+    def _account(self, number):
+        return Account(
+            name=f"accounts/{number}",
+            display_name=f"Account {number}",
+            region_code='US',
+            create_time={'seconds': 1672531200},
+            update_time={'seconds': 1675209600},
+        )
+
+    def _property_numbers(self, account):
+        first = FIRST_PROPERTY + (account - FIRST_ACCOUNT) * self.properties_per_account
+        return range(first, first + self.properties_per_account)
+
+    def _properties(self, account):
+        return [self._property(account, number) for number in self._property_numbers(account)]
+
+    def _property(self, account, number):
+        return Property(
+            name=f"properties/{number}",
+            parent=f"accounts/{account}",
+            display_name=f"Property {number}",
+            property_type=PropertyType.PROPERTY_TYPE_ORDINARY,
+            time_zone='America/Los_Angeles',
+            currency_code='USD',
+            industry_category='TECHNOLOGY',
+            create_time={'seconds': 1672531200},
+        )
+
+    def _summaries(self, parent):
+        return [
+            AccountSummary(
+                account=f"accounts/{FIRST_ACCOUNT + i}",
+                display_name=f"Account {FIRST_ACCOUNT + i}",
+                property_summaries=[
+                    PropertySummary(
+                        property=f"properties/{number}",
+                        display_name=f"Property {number}",
+                        property_type=PropertyType.PROPERTY_TYPE_ORDINARY,
+                    )
+                    for number in self._property_numbers(FIRST_ACCOUNT + i)
+                ],
+            )
+            for i in range(self.accounts)
+        ]
+
+    def _streams(self, prop):
+        first = FIRST_STREAM + (prop - FIRST_PROPERTY) * self.streams_per_property
+        return [
+            DataStream(
+                name=f"properties/{prop}/dataStreams/{number}",
+                type_=DataStream.DataStreamType.WEB_DATA_STREAM,
+                display_name=f"Web {number}",
+                web_stream_data={
+                    'measurement_id': f"G-{number:010d}",
+                    'default_uri': f"https://{number}.example.com",
+                },
+                create_time={'seconds': 1672531200},
+            )
+            for number in range(first, first + self.streams_per_property)
+        ]
+
+
+class FakeAuth:
+    """AuthManager stand-in handing out a FakeAdminClient"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def get_client(self, timeout=None):
+        return self.client
@@ -3,7 +3,7 @@
 block_cipher = None
 
 a = Analysis(
-    ['ga_cli/cli.py'],
+    ['ga_cli/__main__.py'],
     pathex=[],
     binaries=[],
     datas=[
@@ -21,6 +21,12 @@ a = Analysis(
         'ga_cli.commands.properties',
         'ga_cli.commands.datastreams',
         'ga_cli.commands.config',
+        'ga_cli.commands.inventory',
+        'ga_cli.commands.daemon',
+        'ga_cli.commands.shell',
+        'ga_cli.cli',
+        'google.analytics.admin',
+        'google.oauth2.service_account',
     ],
     hookspath=[],
     hooksconfig={},
@@ -1,3 +1,8 @@
 """Google Analytics CLI - Manage GA4 from the command line"""
 
+import time
+
 __version__ = "0.1.4"
+
+# When the package was first imported; --profile reports start-up from here
+STARTED = time.perf_counter()
@@ -0,0 +1,23 @@
+"""Command-line entry point
+
+Hands the command line to a running daemon when there is one, and only
+otherwise imports the CLI and runs it in this process.
+"""
+
+import sys
+
+
+def main():
+    from ga_cli.daemon import forward
+
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from ga_cli.cli import cli
+
+    cli(prog_name='ga-cli')
+
+
+if __name__ == '__main__':
+    main()
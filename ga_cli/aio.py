@@ -0,0 +1,100 @@
+"""Asyncio execution engine for fan-out commands
+
+Commands stay synchronous Click callbacks. ``iterate_async`` drives an async
+generator on a private event loop and hands its items back one at a time,
+so the async engine plugs into the same streaming output path as the
+thread pool engine.
+"""
+
+import asyncio
+from ga_cli.tracing import current_page
+
+
+def iterate_async(agen_factory):
+    """Yield the items of an async generator from synchronous code
+
+    The event loop only runs while the next item is awaited; background
+    tasks spawned by the generator make progress during those waits.
+
+    Args:
+        agen_factory: Zero-argument callable returning the async generator.
+            It is invoked inside the loop, so clients created by the
+            generator bind to the right loop.
+    """
+    loop = asyncio.new_event_loop()
+    agen = agen_factory()
+    try:
+        while True:
+            try:
+                item = loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                break
+            yield item
+    finally:
+        loop.run_until_complete(agen.aclose())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+async def afirst_page(pager, field):
+    """Return the response an async GAPIC pager has already fetched
+
+    Async counterpart of ``ga_cli.pagination.first_page``.
+    """
+    pages = getattr(pager, 'pages', None)
+    if pages is None:
+        from ga_cli.pagination import first_page
+        return first_page(pager, field)
+
+    async for response in pages:
+        return response
+
+
+async def aiter_pages(fetch_page, field):
+    """Yield items page by page, resuming from the last page token
+
+    Async counterpart of ``ga_cli.pagination.iter_pages``; ``fetch_page`` is
+    a coroutine function taking a page token.
+    """
+    page_token = ''
+    page = 0
+    while True:
+        page += 1
+        token = current_page.set(page)
+        try:
+            response = await fetch_page(page_token)
+        finally:
+            current_page.reset(token)
+        for item in getattr(response, field):
+            yield item
+        page_token = response.next_page_token
+        if not page_token:
+            return
+
+
+async def amap_bounded(func, items, concurrency):
+    """Run a coroutine function over items with at most ``concurrency`` in flight
+
+    Async counterpart of ``ga_cli.concurrency.map_bounded``: errors are
+    captured per item and results are yielded in input order.
+
+    Yields:
+        (item, result, error) tuples
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item):
+        async with semaphore:
+            return await func(item)
+
+    items = list(items)
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        for item, task in zip(items, tasks):
+            try:
+                yield item, await task, None
+            except Exception as e:
+                yield item, None, e
+    finally:
+        for task in tasks:
+            task.cancel()
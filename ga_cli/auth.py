@@ -1,8 +1,43 @@
 """Authentication manager for Google Analytics Admin API"""
 
-from google.analytics.admin import AnalyticsAdminServiceClient
-from google.oauth2 import service_account
+import importlib
 import os
+import sys
+
+
+# The Admin API client pulls in gRPC and protobuf, which dominates start-up
+# time. These names resolve on first attribute access (PEP 562) so commands
+# that never issue an RPC do not pay for them.
+_LAZY_IMPORTS = {
+    'AnalyticsAdminServiceClient': ('google.analytics.admin', 'AnalyticsAdminServiceClient'),
+    'AnalyticsAdminServiceAsyncClient': (
+        'google.analytics.admin', 'AnalyticsAdminServiceAsyncClient'
+    ),
+    'service_account': ('google.oauth2', 'service_account'),
+}
+
+
+# Scopes the Admin API client requests; also part of the token cache key
+ADMIN_SCOPES = (
+    'https://www.googleapis.com/auth/analytics.edit',
+    'https://www.googleapis.com/auth/analytics.manage.users',
+    'https://www.googleapis.com/auth/analytics.manage.users.readonly',
+    'https://www.googleapis.com/auth/analytics.readonly',
+)
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name):
+    """Resolve a lazily imported name through the module namespace"""
+    return getattr(sys.modules[__name__], name)
 
 
 class AuthManager:
@@ -36,24 +71,67 @@ class AuthManager:
             self._client = None
         return False
 
-    def get_client(self, timeout=30):
+    def get_client(self, timeout=None):
         """Get authenticated Analytics Admin API client
 
         Args:
-            timeout: Request timeout in seconds (default: 30)
+            timeout: Per-RPC timeout in seconds for requests made through the
+                returned client (default: --timeout or [transport] timeout)
 
         Returns:
-            AnalyticsAdminServiceClient: Authenticated client instance
+            AnalyticsAdminServiceClient: Authenticated client instance, wrapped
+            in a TimeoutClient when a timeout is given
         """
         if self._client is None:
-            if self.credentials_path:
-                credentials = service_account.Credentials.from_service_account_file(
-                    self.credentials_path
-                )
-                self._client = AnalyticsAdminServiceClient(
-                    credentials=credentials,
-                    client_options={'api_endpoint': 'analyticsadmin.googleapis.com'}
-                )
-            else:
-                self._client = AnalyticsAdminServiceClient()
+            self._client = self._create_client(_lazy('AnalyticsAdminServiceClient'))
+        if timeout is not None:
+            from ga_cli.transport import TimeoutClient
+
+            return TimeoutClient(self._client, timeout)
         return self._client
+
+    def get_async_client(self):
+        """Create an asyncio Analytics Admin API client
+
+        A new client is returned on every call because its channel is bound
+        to the running event loop; call this from inside that loop and close
+        the client with ``async with`` when done.
+
+        Returns:
+            AnalyticsAdminServiceAsyncClient: Authenticated async client
+        """
+        return self._create_client(_lazy('AnalyticsAdminServiceAsyncClient'))
+
+    def _create_client(self, client_class):
+        """Instantiate a client class with the configured credentials
+
+        With ``[auth] token_cache`` enabled, access tokens are shared with
+        other invocations through ``~/.ga-cli/tokens.json``; under --profile,
+        token refreshes are timed. Transport, endpoint and channel options
+        come from ``transport_settings``.
+        """
+        from ga_cli.transport import transport_settings
+
+        transport = transport_settings.client_transport(client_class)
+        client_options = {'api_endpoint': transport_settings.endpoint}
+        if self.credentials_path:
+            credentials = _lazy('service_account').Credentials.from_service_account_file(
+                self.credentials_path
+            )
+            from ga_cli.profiling import profiler
+            from ga_cli.token_cache import token_cache_enabled
+
+            if token_cache_enabled():
+                from ga_cli.token_cache import with_token_cache
+
+                credentials = with_token_cache(credentials, self.credentials_path, ADMIN_SCOPES)
+            elif profiler.enabled:
+                from ga_cli.token_cache import TimedCredentials, scoped_credentials
+
+                credentials = TimedCredentials(scoped_credentials(credentials, ADMIN_SCOPES))
+            return client_class(
+                credentials=credentials,
+                transport=transport,
+                client_options=client_options
+            )
+        return client_class(transport=transport, client_options=client_options)
@@ -0,0 +1,446 @@
+"""On-disk response cache for read-only Admin API calls"""
+
+import functools
+import hashlib
+import importlib
+import json
+import os
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Tuple
+from ga_cli.logging_config import logger
+from ga_cli.metrics import metrics
+
+
+DEFAULT_TTL = 300  # seconds
+DEFAULT_MAX_SIZE_MB = 50
+
+# Cached responses are stored as proto-plus JSON and rebuilt from this module
+MESSAGE_TYPES_MODULE = 'google.analytics.admin_v1alpha.types'
+
+
+class ResponseCache:
+    """File-backed cache of Admin API responses
+
+    Entries are keyed by credentials, RPC name and the parent/resource the
+    call was made for, expire after a TTL, and are evicted oldest-first when
+    the cache directory grows beyond its size budget. Long-lived processes
+    (the daemon, the shell) can also keep decoded entries in memory with
+    ``enable_memory``, skipping the file read and proto decoding on hits.
+
+    Usage:
+        response_cache.configure(enabled=True, refresh=False)
+        response_cache.set_namespace(credentials_path)
+
+        items = response_cache.get('list_properties', account_id)
+        if items is None:
+            items = fetch()
+            response_cache.set('list_properties', (account_id,), items)
+    """
+
+    def __init__(self, cache_dir=None):
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self.namespace = 'default'
+        self.enabled = True
+        self.refresh = False
+        self.ttl = DEFAULT_TTL
+        self.max_bytes = DEFAULT_MAX_SIZE_MB * 1024 * 1024
+        self._memory: Optional[Dict[Path, Tuple[float, Any]]] = None
+        self._size = None
+
+    @property
+    def cache_dir(self):
+        """Directory holding cache entries (defaults to ~/.ga-cli/cache)"""
+        return self._cache_dir or Path.home() / '.ga-cli' / 'cache'
+
+    def configure(self, enabled=True, refresh=False, ttl=None, max_size_mb=None):
+        """Apply per-invocation settings, falling back to the config file
+
+        Args:
+            enabled: False disables both reads and writes (--no-cache)
+            refresh: True skips reads but still stores fresh responses (--refresh)
+            ttl: Entry lifetime in seconds (config: [cache] ttl)
+            max_size_mb: Size budget for the cache directory (config: [cache] max_size_mb)
+
+        Invalid config values are logged and the defaults kept.
+        """
+        from ga_cli.config import ConfigManager
+
+        config_manager = ConfigManager()
+        if ttl is None:
+            ttl = config_manager.get('cache', 'ttl', fallback=DEFAULT_TTL)
+        if max_size_mb is None:
+            max_size_mb = config_manager.get('cache', 'max_size_mb', fallback=DEFAULT_MAX_SIZE_MB)
+        configured = config_manager.get('cache', 'enabled', fallback='true')
+
+        self.enabled = enabled and str(configured).lower() not in ('false', '0', 'no', 'off')
+        self.refresh = refresh
+        try:
+            self.ttl = int(ttl)
+        except ValueError:
+            logger.warning(f"Ignoring invalid cache ttl: {ttl}")
+            self.ttl = DEFAULT_TTL
+        try:
+            self.max_bytes = int(float(max_size_mb) * 1024 * 1024)
+        except ValueError:
+            logger.warning(f"Ignoring invalid cache max_size_mb: {max_size_mb}")
+            self.max_bytes = DEFAULT_MAX_SIZE_MB * 1024 * 1024
+
+    def enable_memory(self):
+        """Keep decoded entries in memory for the life of the process
+
+        The entry file stays authoritative: a memory hit is only served
+        while the file exists, so invalidation by other processes is seen.
+        """
+        if self._memory is None:
+            self._memory = {}
+
+    def set_namespace(self, credentials_path):
+        """Scope entries to the credentials used for the calls"""
+        self.namespace = os.path.abspath(credentials_path) if credentials_path else 'default'
+
+    def _entry_path(self, rpc, parts):
+        key = json.dumps([self.namespace, rpc, [str(p) for p in parts]])
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+        return self.cache_dir / f"{rpc}-{digest}.json"
+
+    def get(self, rpc, *parts):
+        """Return cached messages for an RPC, or None on miss/expiry"""
+        if not self.enabled or self.refresh or self.ttl <= 0:
+            return None
+
+        value = self._lookup(rpc, parts)
+        metrics.record_cache(rpc, value is not None)
+        return value
+
+    def _lookup(self, rpc, parts):
+        path = self._entry_path(rpc, parts)
+        if self._memory is not None:
+            hit = self._memory_get(path)
+            if hit is not None:
+                logger.debug("Memory cache hit for %s %s", rpc, parts)
+                return hit
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.debug(f"Discarding unreadable cache entry: {path}")
+            self._remove(path)
+            return None
+
+        if time.time() - entry.get('created', 0) > self.ttl:
+            self._remove(path)
+            return None
+
+        try:
+            items = []
+            if entry['items']:
+                message_type = getattr(
+                    importlib.import_module(MESSAGE_TYPES_MODULE), entry['type']
+                )
+                items = [
+                    message_type.from_json(item, ignore_unknown_fields=True)
+                    for item in entry['items']
+                ]
+        except (AttributeError, KeyError, TypeError, ValueError):
+            logger.debug(f"Discarding incompatible cache entry: {path}")
+            self._remove(path)
+            return None
+
+        # Touch the entry so eviction drops the least recently used first
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        logger.debug("Cache hit for %s %s", rpc, parts)
+        value = items if entry.get('many') else items[0]
+        if self._memory is not None:
+            self._memory[path] = (entry['created'], value)
+        return value
+
+    def _memory_get(self, path):
+        """Return a decoded entry kept in memory, or None"""
+        if self._memory is None:
+            return None
+        created, value = self._memory.get(path, (0, None))
+        if value is None:
+            return None
+        if time.time() - created > self.ttl or not path.exists():
+            del self._memory[path]
+            return None
+        return value
+
+    def set(self, rpc, parts, value, many=True):
+        """Store messages returned by an RPC
+
+        Values that are not proto-plus messages are silently not cached.
+        """
+        if not self.enabled:
+            return
+
+        writer = self.writer(rpc, parts, many=many)
+        for item in (value if many else [value]):
+            writer.add(item)
+        writer.commit()
+
+    def writer(self, rpc, parts, many=True):
+        """Return an _EntryWriter storing messages one at a time
+
+        Listings are written to the entry as they stream past instead of
+        being collected first, so caching them does not hold every row in
+        memory (unless the memory tier is enabled).
+        """
+        return _EntryWriter(self, rpc, self._entry_path(rpc, parts), many)
+
+    def _stored(self, path, created, value, delta):
+        """Account for an entry an _EntryWriter has just committed"""
+        if self._memory is not None:
+            self._memory[path] = (created, value)
+        self._track_size(delta)
+
+    def invalidate(self, rpc, *parts):
+        """Drop the entry for one RPC/parent combination"""
+        path = self._entry_path(rpc, parts)
+        if self._memory is not None:
+            self._memory.pop(path, None)
+        self._remove(path)
+
+    def invalidate_all(self, rpc):
+        """Drop every entry for an RPC, regardless of parent or credentials"""
+        if self._memory is not None:
+            for path in [p for p in self._memory if p.name.startswith(f"{rpc}-")]:
+                del self._memory[path]
+        for path in self._entries(rpc):
+            self._remove(path)
+
+    def _entries(self, rpc=None):
+        pattern = f"{rpc}-*.json" if rpc else '*.json'
+        try:
+            return list(self.cache_dir.glob(pattern))
+        except OSError:
+            return []
+
+    def _ensure_cache_dir(self):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        os.chmod(self.cache_dir, stat.S_IRWXU)  # 700
+
+    def _track_size(self, delta):
+        """Keep a running size of the cache directory, evicting when over budget
+
+        The directory is scanned once per process to seed the total; after
+        that only this process's writes are added, so storing an entry does
+        not list the directory again until the budget is exceeded. Entries
+        removed meanwhile make the total an overestimate, which the scan in
+        ``_evict`` corrects.
+        """
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._scan())  # includes this write
+        else:
+            self._size += delta
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _scan(self):
+        """(mtime, size, path) of every entry in the cache directory"""
+        entries = []
+        for path in self._entries():
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _evict(self):
+        """Remove least recently used entries until under the size budget"""
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries, key=lambda e: e[0]):
+                self._remove(path)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+        self._size = total
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class _EntryWriter:
+    """One cache entry being written item by item
+
+    Items are appended to a temporary file, which only replaces the entry
+    on ``commit``. ``discard``, or an item that cannot be cached (not a
+    proto-plus message, or of a different type than the others), leaves
+    any previous entry untouched.
+    """
+
+    def __init__(self, cache, rpc, path, many):
+        self._cache = cache
+        self._rpc = rpc
+        self._path = path
+        self._many = many
+        self._created = time.time()
+        self._type = None
+        self._count = 0
+        self._file: Optional[IO[str]] = None
+        self._failed = False
+        self._tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        # Decoded items are only kept for the memory tier
+        self._items: Optional[List[Any]] = [] if cache._memory is not None else None
+
+    def add(self, item):
+        """Append one message to the entry"""
+        if self._failed:
+            return
+        import proto
+
+        type_name = type(item).__name__
+        if not isinstance(item, proto.Message) or self._type not in (None, type_name):
+            self.discard()
+            return
+        self._type = type_name
+        try:
+            file = self._file or self._open()
+            separator = ', ' if self._count else ''
+            file.write(separator + json.dumps(type(item).to_json(item, indent=None)))
+        except OSError as e:
+            self._fail(e)
+            return
+        self._count += 1
+        if self._items is not None:
+            self._items.append(item)
+
+    def commit(self):
+        """Finish the entry and move it into place"""
+        if self._failed:
+            return
+        try:
+            file = self._file or self._open()
+            file.write(f'], "type": {json.dumps(self._type)}}}')
+            file.close()
+            written = os.path.getsize(self._tmp_path)
+            try:
+                replaced = self._path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(self._tmp_path, self._path)
+        except OSError as e:
+            self._fail(e)
+            return
+
+        value = None
+        if self._items is not None:
+            value = self._items if self._many else self._items[0]
+        self._cache._stored(self._path, self._created, value, written - replaced)
+
+    def discard(self):
+        """Abandon the entry, removing the temporary file"""
+        self._failed = True
+        if self._file is not None:
+            self._file.close()
+            self._cache._remove(self._tmp_path)
+        self._items = None
+
+    def _open(self):
+        self._cache._ensure_cache_dir()
+        fd = os.open(self._tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        file = self._file = os.fdopen(fd, 'w', encoding='utf-8')
+        created, many = json.dumps(self._created), json.dumps(self._many)
+        file.write(f'{{"created": {created}, "many": {many}, "items": [')
+        return file
+
+    def _fail(self, error):
+        logger.debug(f"Could not write cache entry {self._path}: {error}")
+        self.discard()
+
+
+# Process-wide cache instance shared by all commands
+response_cache = ResponseCache()
+
+
+def cached(rpc, many=True):
+    """Decorator serving an RPC wrapper from the response cache
+
+    The wrapped function must take the client as its first argument; the
+    remaining positional arguments identify the parent/resource and form the
+    cache key. For listings (``many=True``) the wrapper returns an iterator:
+    cache hits are replayed, and fresh results are written to the cache as
+    they stream past and committed only once the caller has consumed the
+    whole listing.
+
+    Args:
+        rpc: RPC name used as the key prefix (e.g. 'list_properties')
+        many: True if the wrapper returns an iterable of messages
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(client, *parts):
+            hit = response_cache.get(rpc, *parts)
+            if hit is not None:
+                return iter(hit) if many else hit
+
+            value = func(client, *parts)
+            if many:
+                if not response_cache.enabled:
+                    return value
+                return _store_when_exhausted(rpc, parts, value)
+
+            response_cache.set(rpc, parts, value, many=False)
+            return value
+        return wrapper
+    return decorator
+
+
+def _store_when_exhausted(rpc, parts, items):
+    """Pass items through, committing the cache entry once the listing is complete"""
+    writer = response_cache.writer(rpc, parts)
+    try:
+        for item in items:
+            writer.add(item)
+            yield item
+    except BaseException:
+        writer.discard()
+        raise
+    writer.commit()
+
+
+def acached(rpc):
+    """Async counterpart of ``cached`` for async generator listings"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(client, *parts):
+            hit = response_cache.get(rpc, *parts)
+            if hit is not None:
+                for item in hit:
+                    yield item
+                return
+
+            if not response_cache.enabled:
+                async for item in func(client, *parts):
+                    yield item
+                return
+
+            writer = response_cache.writer(rpc, parts)
+            try:
+                async for item in func(client, *parts):
+                    writer.add(item)
+                    yield item
+            except BaseException:
+                writer.discard()
+                raise
+            writer.commit()
+        return wrapper
+    return decorator
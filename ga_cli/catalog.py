@@ -0,0 +1,56 @@
+"""Offline catalog of the values property settings accept
+
+Validators check timezones, currency codes and industry categories against
+these sets instead of importing the Admin API types or building a pytz
+timezone per value, so manifests with tens of thousands of rows are
+validated in a fraction of a second before any RPC is issued. Each set is
+built on first use and kept for the life of the process.
+"""
+
+import functools
+
+
+# Active ISO 4217 currency codes, without fund codes, units of account,
+# precious metals, bond units and testing codes, none of which GA accepts as
+# a property currency
+_CURRENCY_CODES = """
+AED AFN ALL AMD ANG AOA ARS AUD AWG AZN BAM BBD BDT BGN BHD BIF BMD BND BOB
+BRL BSD BTN BWP BYN BZD CAD CDF CHF CLP CNY COP CRC CUC CUP CVE CZK DJF DKK
+DOP DZD EGP ERN ETB EUR FJD FKP GBP GEL GHS GIP GMD GNF GTQ GYD HKD HNL HTG
+HUF IDR ILS INR IQD IRR ISK JMD JOD JPY KES KGS KHR KMF KPW KRW KWD KYD KZT
+LAK LBP LKR LRD LSL LYD MAD MDL MGA MKD MMK MNT MOP MRU MUR MVR MWK MXN MYR
+MZN NAD NGN NIO NOK NPR NZD OMR PAB PEN PGK PHP PKR PLN PYG QAR RON RSD RUB
+RWF SAR SBD SCR SDG SEK SGD SHP SLE SLL SOS SRD SSP STN SVC SYP SZL THB TJS
+TMT TND TOP TRY TTD TWD TZS UAH UGX USD UYU UZS VED VES VND VUV WST XAF XCD
+XCG XOF XPF YER ZAR ZMW ZWG ZWL
+"""
+
+# google.analytics.admin_v1alpha.types.IndustryCategory names, without
+# INDUSTRY_CATEGORY_UNSPECIFIED
+_INDUSTRY_CATEGORIES = """
+AUTOMOTIVE BUSINESS_AND_INDUSTRIAL_MARKETS FINANCE HEALTHCARE TECHNOLOGY TRAVEL
+OTHER ARTS_AND_ENTERTAINMENT BEAUTY_AND_FITNESS BOOKS_AND_LITERATURE
+FOOD_AND_DRINK GAMES HOBBIES_AND_LEISURE HOME_AND_GARDEN INTERNET_AND_TELECOM
+LAW_AND_GOVERNMENT NEWS ONLINE_COMMUNITIES PEOPLE_AND_SOCIETY PETS_AND_ANIMALS
+REAL_ESTATE REFERENCE SCIENCE SPORTS JOBS_AND_EDUCATION SHOPPING
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def timezones():
+    """IANA timezone names, keyed by their lower-cased spelling"""
+    import pytz
+
+    return {name.lower(): name for name in pytz.all_timezones}
+
+
+@functools.lru_cache(maxsize=None)
+def currency_codes():
+    """ISO 4217 currency codes"""
+    return frozenset(_CURRENCY_CODES.split())
+
+
+@functools.lru_cache(maxsize=None)
+def industry_categories():
+    """Industry category names accepted for new properties"""
+    return frozenset(_INDUSTRY_CATEGORIES.split())
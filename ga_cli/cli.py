@@ -1,34 +1,132 @@
 """Main CLI entry point"""
 
+import importlib
+import time
 import click
-from ga_cli import __version__
-from ga_cli.commands.accounts import accounts
-from ga_cli.commands.properties import properties
-from ga_cli.commands.datastreams import datastreams
-from ga_cli.commands.config import config
+from ga_cli import STARTED, __version__
+from ga_cli.cache import response_cache
+from ga_cli.ratelimit import rate_limiter
+from ga_cli.retry import retry_policy
+from ga_cli.tracing import tracer
+from ga_cli.transport import TRANSPORTS, transport_settings
 from ga_cli.config import ConfigManager
+from ga_cli.logging_config import LOG_LEVELS, setup_logging
+from ga_cli.metrics import metrics
+from ga_cli.profiling import profiler
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports subcommands only when they are resolved
+
+    Subcommands are registered as ``name -> 'module.path:attribute'`` strings,
+    so ``ga-cli --version`` or ``ga-cli config show`` never import the modules
+    behind the other command groups.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        # Seconds spent importing subcommands since last read, for --profile
+        self.import_seconds = 0.0
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name):
+        """Import a lazily registered subcommand"""
+        module_name, attr_name = self.lazy_subcommands[cmd_name].split(':')
+        started = time.perf_counter()
+        module = importlib.import_module(module_name)
+        self.import_seconds += time.perf_counter() - started
+        command = getattr(module, attr_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy loading of {cmd_name} failed: {module_name}:{attr_name} is not a Click command"
+            )
+        return command
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        'accounts': 'ga_cli.commands.accounts:accounts',
+        'properties': 'ga_cli.commands.properties:properties',
+        'datastreams': 'ga_cli.commands.datastreams:datastreams',
+        'config': 'ga_cli.commands.config:config',
+        'inventory': 'ga_cli.commands.inventory:inventory',
+        'daemon': 'ga_cli.commands.daemon:daemon',
+        'shell': 'ga_cli.commands.shell:shell',
+        'run': 'ga_cli.commands.shell:run',
+    },
+)
 @click.version_option(version=__version__)
 @click.option('--credentials', envvar='GOOGLE_APPLICATION_CREDENTIALS',
               help='Path to service account credentials file')
+@click.option('--no-cache', is_flag=True, help='Bypass the local response cache')
+@click.option('--refresh', is_flag=True,
+              help='Ignore cached responses but store the fresh results')
+@click.option('--engine', type=click.Choice(['threads', 'async']), default=None,
+              help='Execution engine for commands that fan out over many resources')
+@click.option('--transport', type=click.Choice(TRANSPORTS), default=None,
+              help='API transport (default: grpc)')
+@click.option('--timeout', type=click.FloatRange(min=0), default=None,
+              help='Seconds each API read may take, 0 for no limit (default: 30)')
+@click.option('--log-level', type=click.Choice(LOG_LEVELS, case_sensitive=False), default=None,
+              help='Lowest level written to ~/.ga-cli/ga-cli.log (default: info)')
+@click.option('--profile', is_flag=True,
+              help='Print where the time went (auth, RPCs, output, ...) to stderr')
+@click.option('--profile-out', type=click.Path(dir_okay=False, writable=True), default=None,
+              help='Also write a cProfile dump to this file and an allocation report next to it')
 @click.pass_context
-def cli(ctx, credentials):
+def cli(ctx, credentials, no_cache, refresh, engine, transport, timeout, log_level,
+        profile, profile_out):
     """Google Analytics CLI - Manage GA4 from the command line"""
     ctx.ensure_object(dict)
+    if ctx.obj.get('configured'):
+        # Concurrent lines of `run --parallel` keep the settings their parent
+        # applied; reconfiguring the process-wide singletons would race
+        ctx.obj['credentials'] = credentials or ConfigManager().get_credentials_path()
+        ctx.obj['engine'] = engine
+        return
+
+    _start_profiler(ctx, profile, profile_out)
+
+    with profiler.phase('config'):
+        setup_logging(log_level)
+
+        if not credentials:
+            config_manager = ConfigManager()
+            credentials = config_manager.get_credentials_path()
 
-    if not credentials:
-        config_manager = ConfigManager()
-        credentials = config_manager.get_credentials_path()
+        ctx.obj['credentials'] = credentials
+        ctx.obj['engine'] = engine
 
-    ctx.obj['credentials'] = credentials
+        response_cache.configure(enabled=not no_cache, refresh=refresh)
+        rate_limiter.configure()
+        retry_policy.configure()
+        transport_settings.configure(transport=transport, timeout=timeout)
+        tracer.configure()
+        metrics.configure()
+        if metrics.enabled:
+            ctx.call_on_close(metrics.flush)
 
 
-cli.add_command(accounts)
-cli.add_command(properties)
-cli.add_command(datastreams)
-cli.add_command(config)
+def _start_profiler(ctx, profile, profile_out):
+    """Configure the profiler for this invocation and report when it ends"""
+    group = ctx.command
+    imported, group.import_seconds = group.import_seconds, 0.0
+    startup = time.perf_counter() - STARTED - imported
+    profiler.configure(enabled=profile, output_path=profile_out, startup=startup)
+    if not profiler.enabled:
+        return
+    if imported:
+        profiler.record('import', imported, concurrent=False)
+    ctx.call_on_close(profiler.finish)
 
 
 if __name__ == '__main__':
@@ -1,13 +1,21 @@
 """Account management commands"""
 
 import builtins
+import functools
 import click
-from ga_cli.decorators import with_client
+from ga_cli.decorators import with_client, list_output_options, fields_option
 from ga_cli.formatters.table import format_table
 from ga_cli.formatters.json import format_json
+from ga_cli.formatters.tree import format_tree
+from ga_cli.output import output_rows, resolve_list_format
+from ga_cli.projection import resource_id, row_builder
+from ga_cli.rows import ACCOUNT_FIELDS, account_details, account_row
 from ga_cli.validators import validate_account_id
 from ga_cli.logging_config import logger
-from ga_cli.retry import retry_on_transient_error
+from ga_cli.retry import retry_on_transient_error, async_retry_on_transient_error
+from ga_cli.cache import cached, acached
+from ga_cli.pagination import PAGE_SIZE, first_page, iter_pages
+from ga_cli.aio import afirst_page, aiter_pages
 
 
 @click.group()
@@ -17,66 +25,159 @@ def accounts():
 
 
 @accounts.command()
-@click.option('--format', type=click.Choice(['table', 'json']), default='table')
+@list_output_options
+@fields_option(ACCOUNT_FIELDS)
 @click.pass_context
 @with_client
-def list(ctx, format):
+def list(ctx, format, compact, fields):
     """List all accounts"""
     client = ctx.obj['client']
+    build_row = row_builder(ACCOUNT_FIELDS, fields, format, account_row)
     logger.info("Listing Google Analytics accounts")
 
-    accounts_data = []
-    for account in _list_accounts_with_retry(client):
-        accounts_data.append({
-            'id': account.name.split('/')[-1] if '/' in account.name else account.name,
-            'name': account.display_name or 'N/A',
-            'region': account.region_code or 'N/A',
-            'create_time': str(account.create_time).split('.')[0] if account.create_time else 'N/A',
-        })
+    accounts_data = (build_row(account) for account in _list_accounts_with_retry(client))
 
-    logger.info(f"Found {len(accounts_data)} accounts")
+    count = output_rows(accounts_data, format, title="Google Analytics Accounts", compact=compact)
 
-    if format == 'json':
-        format_json(accounts_data)
-    else:
-        format_table(accounts_data, title="Google Analytics Accounts")
+    logger.info(f"Found {count} accounts")
 
 
 @accounts.command()
 @click.argument('account_id', callback=validate_account_id)
-@click.option('--format', type=click.Choice(['table', 'json']), default='table')
+@click.option('--format', type=click.Choice(['table', 'json', 'ids']), default='table')
+@fields_option(ACCOUNT_FIELDS)
 @click.pass_context
 @with_client
-def get(ctx, account_id, format):
+def get(ctx, account_id, format, fields):
     """Get account details"""
     client = ctx.obj['client']
+    build_row = row_builder(ACCOUNT_FIELDS, fields, format, account_details)
     logger.info(f"Getting account details for: {account_id}")
 
     account = _get_account_with_retry(client, account_id)
-
-    account_data = {
-        'id': account.name.split('/')[-1] if '/' in account.name else account.name,
-        'name': account.display_name or 'N/A',
-        'region': account.region_code or 'N/A',
-        'create_time': str(account.create_time).split('.')[0] if account.create_time else 'N/A',
-        'update_time': str(account.update_time).split('.')[0] if account.update_time else 'N/A',
-    }
+    account_data = build_row(account)
 
     logger.info(f"Retrieved account: {account.display_name}")
 
-    if format == 'json':
+    if format == 'ids':
+        click.echo(account_data.id)
+    elif format == 'json':
         format_json(account_data)
     else:
         format_table([account_data], title=f"Account: {account.display_name}")
 
 
-@retry_on_transient_error()
+@accounts.command()
+@list_output_options
+@click.pass_context
+@with_client
+def tree(ctx, format, compact):
+    """Show every account with its properties
+
+    Built on account summaries, so the whole inventory costs one paginated
+    call instead of one property listing per account.
+    """
+    client = ctx.obj['client']
+    logger.info("Listing account summaries")
+
+    summaries = (
+        _account_summary_record(summary)
+        for summary in _list_account_summaries_with_retry(client)
+    )
+
+    format = resolve_list_format(format)
+    if format == 'table':
+        records = builtins.list(summaries)
+        count = len(records)
+        format_tree(records, title="Google Analytics Accounts")
+    elif format in ('tsv', 'csv'):
+        # Delimited output has no nesting, so emit one row per property
+        count = output_rows(_flatten_summaries(summaries), format)
+    else:
+        count = output_rows(summaries, format, compact=compact)
+
+    logger.info(f"Found {count} account summaries")
+
+
+def _account_summary_record(summary):
+    """Build the nested record for an account summary"""
+    return {
+        'id': resource_id(summary.account),
+        'name': summary.display_name or 'N/A',
+        'properties': [
+            {
+                'id': resource_id(prop.property),
+                'name': prop.display_name or 'N/A',
+                'type': prop.property_type.name if prop.property_type else 'N/A',
+            }
+            for prop in summary.property_summaries
+        ],
+    }
+
+
+def _flatten_summaries(records):
+    """Yield one flat row per property, keeping accounts without properties"""
+    for record in records:
+        properties = record['properties'] or [{'id': '', 'name': '', 'type': ''}]
+        for prop in properties:
+            yield {
+                'account_id': record['id'],
+                'account_name': record['name'],
+                'property_id': prop['id'],
+                'property_name': prop['name'],
+                'property_type': prop['type'],
+            }
+
+
+@cached('list_accounts')
 def _list_accounts_with_retry(client):
-    """List accounts with retry logic"""
-    return builtins.list(client.list_accounts())
+    """List accounts page by page, retrying each page independently"""
+    return iter_pages(functools.partial(_list_accounts_page, client), 'accounts')
+
+
+@retry_on_transient_error()
+def _list_accounts_page(client, page_token, timeout=None):
+    """Fetch one page of accounts with retry logic"""
+    pager = client.list_accounts(
+        request={'page_size': PAGE_SIZE, 'page_token': page_token}, timeout=timeout
+    )
+    return first_page(pager, 'accounts')
+
+
+@acached('list_accounts')
+def _alist_accounts_with_retry(client):
+    """Async variant of _list_accounts_with_retry"""
+    return aiter_pages(functools.partial(_alist_accounts_page, client), 'accounts')
+
+
+@async_retry_on_transient_error()
+async def _alist_accounts_page(client, page_token, timeout=None):
+    """Fetch one page of accounts with async retry logic"""
+    pager = await client.list_accounts(
+        request={'page_size': PAGE_SIZE, 'page_token': page_token}, timeout=timeout
+    )
+    return await afirst_page(pager, 'accounts')
+
+
+@cached('list_account_summaries')
+def _list_account_summaries_with_retry(client):
+    """List account summaries page by page, retrying each page independently"""
+    return iter_pages(
+        functools.partial(_list_account_summaries_page, client), 'account_summaries'
+    )
+
+
+@retry_on_transient_error()
+def _list_account_summaries_page(client, page_token, timeout=None):
+    """Fetch one page of account summaries with retry logic"""
+    pager = client.list_account_summaries(
+        request={'page_size': PAGE_SIZE, 'page_token': page_token}, timeout=timeout
+    )
+    return first_page(pager, 'account_summaries')
 
 
+@cached('get_account', many=False)
 @retry_on_transient_error()
-def _get_account_with_retry(client, account_id):
+def _get_account_with_retry(client, account_id, timeout=None):
     """Get account with retry logic"""
-    return client.get_account(name=f"accounts/{account_id}")
+    return client.get_account(name=f"accounts/{account_id}", timeout=timeout)
@@ -0,0 +1,111 @@
+"""Background daemon commands"""
+
+import os
+import subprocess
+import sys
+import time
+import click
+from ga_cli.daemon import control, socket_path
+from ga_cli.logging_config import logger
+
+
+# How long `daemon start` waits for the background process to listen
+START_TIMEOUT = 15  # seconds
+
+
+@click.group()
+def daemon():
+    """Keep a warm, authenticated client in a background process
+
+    \b
+    While the daemon runs, other ga-cli commands are sent to it over a
+    Unix socket instead of starting up, loading credentials and opening a
+    channel themselves. Set GA_CLI_NO_DAEMON=1 to bypass it.
+    """
+    pass
+
+
+@daemon.command()
+@click.option('--foreground', is_flag=True, help='Serve in this process instead of detaching')
+@click.option('--idle-timeout', type=click.IntRange(0), default=0,
+              help='Exit after this many seconds without a command (0: never)')
+@click.pass_context
+def start(ctx, foreground, idle_timeout):
+    """Start the daemon"""
+    status = control('status')
+    if status is not None:
+        raise click.ClickException(f"Daemon already running (pid {status['pid']})")
+
+    credentials = ctx.obj.get('credentials')
+
+    if foreground:
+        from ga_cli.daemon import DaemonServer
+        from ga_cli.session import Session
+
+        session = Session()
+        session.warm(credentials)
+        server = DaemonServer(session, idle_timeout=idle_timeout)
+        server.bind()
+        click.echo(f"Daemon listening on {server.path} (pid {os.getpid()})", err=True)
+        server.serve_forever()
+        return
+
+    if getattr(sys, 'frozen', False):
+        command = [sys.executable]
+    else:
+        command = [sys.executable, '-m', 'ga_cli']
+    if credentials:
+        command += ['--credentials', os.path.abspath(credentials)]
+    command += ['daemon', 'start', '--foreground', '--idle-timeout', str(idle_timeout)]
+
+    logger.info(f"Starting daemon: {command}")
+    process = subprocess.Popen(
+        command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL, start_new_session=True,
+    )
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        status = control('status')
+        if status is not None:
+            click.echo(f"Daemon started (pid {status['pid']}, socket {status['socket']})")
+            return
+        if process.poll() is not None:
+            raise click.ClickException(
+                f"Daemon exited during start-up (code {process.returncode}); "
+                "run 'ga-cli daemon start --foreground' to see why"
+            )
+        time.sleep(0.1)
+
+    raise click.ClickException(f"Daemon did not start within {START_TIMEOUT}s")
+
+
+@daemon.command()
+def stop():
+    """Stop the daemon"""
+    if control('stop') is None:
+        click.echo("Daemon is not running")
+        return
+
+    # The socket is removed once the daemon has finished shutting down
+    deadline = time.monotonic() + START_TIMEOUT
+    while socket_path().exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    click.echo("Daemon stopped")
+
+
+@daemon.command()
+def status():
+    """Show whether the daemon is running"""
+    status = control('status')
+    if status is None:
+        click.echo("Daemon is not running")
+        return
+
+    click.echo(f"Daemon running (pid {status['pid']})")
+    click.echo(f"  Version: {status.get('version', 'unknown')}")
+    click.echo(f"  Socket: {status['socket']}")
+    click.echo(f"  Uptime: {status['uptime']:.0f}s")
+    click.echo(f"  Commands served: {status['commands']}")
+    for credentials in status['credentials']:
+        click.echo(f"  Warm client: {credentials}")
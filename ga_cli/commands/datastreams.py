@@ -1,14 +1,19 @@
 """Data stream management commands"""
 
-import builtins
+import functools
 import click
-from google.analytics.admin_v1alpha.types import DataStream
-from ga_cli.decorators import with_client
+from ga_cli.decorators import with_client, list_output_options, fields_option
 from ga_cli.formatters.table import format_table
 from ga_cli.formatters.json import format_json
+from ga_cli.output import output_rows
+from ga_cli.projection import resource_id, row_builder
+from ga_cli.rows import DATASTREAM_FIELDS, datastream_details, datastream_row
 from ga_cli.validators import validate_property_id, validate_stream_id, validate_url
 from ga_cli.logging_config import logger
-from ga_cli.retry import retry_on_transient_error
+from ga_cli.retry import retry_on_transient_error, async_retry_on_transient_error
+from ga_cli.cache import cached, acached, response_cache
+from ga_cli.pagination import PAGE_SIZE, first_page, iter_pages
+from ga_cli.aio import afirst_page, aiter_pages
 
 
 @click.group()
@@ -19,75 +24,51 @@ def datastreams():
 
 @datastreams.command()
 @click.argument('property_id', callback=validate_property_id)
-@click.option('--format', type=click.Choice(['table', 'json']), default='table')
+@list_output_options
+@fields_option(DATASTREAM_FIELDS)
 @click.pass_context
 @with_client
-def list(ctx, property_id, format):
+def list(ctx, property_id, format, compact, fields):
     """List data streams for a property"""
     client = ctx.obj['client']
+    build_row = row_builder(DATASTREAM_FIELDS, fields, format, datastream_row)
     logger.info(f"Listing data streams for property: {property_id}")
 
-    streams_data = []
-    for stream in _list_datastreams_with_retry(client, property_id):
-        stream_info = {
-            'id': stream.name.split('/')[-1] if '/' in stream.name else stream.name,
-            'name': stream.display_name or 'N/A',
-            'type': stream.type_.name if stream.type_ else 'N/A',
-        }
-
-        # Add stream-type specific data with null checks
-        if stream.web_stream_data:
-            stream_info['measurement_id'] = stream.web_stream_data.measurement_id or 'N/A'
-            stream_info['url'] = stream.web_stream_data.default_uri or 'N/A'
-        elif stream.android_app_stream_data:
-            stream_info['package_name'] = stream.android_app_stream_data.package_name or 'N/A'
-        elif stream.ios_app_stream_data:
-            stream_info['bundle_id'] = stream.ios_app_stream_data.bundle_id or 'N/A'
-
-        streams_data.append(stream_info)
-
-    logger.info(f"Found {len(streams_data)} data streams")
-
-    if format == 'json':
-        format_json(streams_data)
-    else:
-        format_table(streams_data, title=f"Data Streams for Property {property_id}")
+    streams_data = (
+        build_row(stream) for stream in _list_datastreams_with_retry(client, property_id)
+    )
+
+    count = output_rows(streams_data, format, title=f"Data Streams for Property {property_id}", compact=compact)
+
+    logger.info(f"Found {count} data streams")
 
 
 @datastreams.command()
 @click.argument('property_id', callback=validate_property_id)
 @click.argument('stream_id', callback=validate_stream_id)
-@click.option('--format', type=click.Choice(['table', 'json']), default='table')
+@click.option('--format', type=click.Choice(['table', 'json', 'ids']), default='table')
+@fields_option(DATASTREAM_FIELDS)
 @click.pass_context
 @with_client
-def get(ctx, property_id, stream_id, format):
+def get(ctx, property_id, stream_id, format, fields):
     """Get data stream details including measurement ID"""
     client = ctx.obj['client']
+    build_row = row_builder(DATASTREAM_FIELDS, fields, format, datastream_details)
     logger.info(f"Getting data stream {stream_id} for property: {property_id}")
 
     stream = _get_datastream_with_retry(client, property_id, stream_id)
-
-    stream_data = {
-        'id': stream.name.split('/')[-1] if '/' in stream.name else stream.name,
-        'name': stream.display_name or 'N/A',
-        'type': stream.type_.name if stream.type_ else 'N/A',
-        'create_time': str(stream.create_time).split('.')[0] if stream.create_time else 'N/A',
-    }
-
-    # Add web stream specific data with null checks
-    if stream.web_stream_data:
-        stream_data['measurement_id'] = stream.web_stream_data.measurement_id or 'N/A'
-        stream_data['url'] = stream.web_stream_data.default_uri or 'N/A'
-        stream_data['firebase_app_id'] = stream.web_stream_data.firebase_app_id or 'N/A'
+    stream_data = build_row(stream)
 
     logger.info(f"Retrieved data stream: {stream.display_name}")
 
-    if format == 'json':
+    if format == 'ids':
+        click.echo(stream_data.id)
+    elif format == 'json':
         format_json(stream_data)
     else:
         format_table([stream_data], title=f"Data Stream: {stream.display_name}")
 
-        if stream.web_stream_data and stream.web_stream_data.measurement_id:
+        if not fields and stream.web_stream_data and stream.web_stream_data.measurement_id:
             click.echo(f"\nMeasurement ID: {stream.web_stream_data.measurement_id}")
 
 
@@ -104,8 +85,9 @@ def create(ctx, property_id, name, url):
 
     stream = _create_datastream_with_retry(client, property_id, name, url)
 
-    stream_id = stream.name.split('/')[-1] if '/' in stream.name else stream.name
+    stream_id = resource_id(stream.name)
     logger.info(f"Created data stream: {stream_id}")
+    response_cache.invalidate('list_datastreams', property_id)
 
     click.echo(f"Created data stream: {stream.display_name}")
     click.echo(f"  Stream ID: {stream_id}")
@@ -116,21 +98,59 @@ def create(ctx, property_id, name, url):
             click.echo(f"  URL: {stream.web_stream_data.default_uri}")
 
 
-@retry_on_transient_error()
+@cached('list_datastreams')
 def _list_datastreams_with_retry(client, property_id):
-    """List data streams with retry logic"""
-    return builtins.list(client.list_data_streams(parent=f"properties/{property_id}"))
+    """List data streams page by page, retrying each page independently"""
+    return iter_pages(
+        functools.partial(_list_datastreams_page, client, property_id), 'data_streams'
+    )
 
 
 @retry_on_transient_error()
-def _get_datastream_with_retry(client, property_id, stream_id):
-    """Get data stream with retry logic"""
-    return client.get_data_stream(name=f"properties/{property_id}/dataStreams/{stream_id}")
+def _list_datastreams_page(client, property_id, page_token, timeout=None):
+    """Fetch one page of data streams with retry logic"""
+    request = {
+        "parent": f"properties/{property_id}",
+        "page_size": PAGE_SIZE,
+        "page_token": page_token,
+    }
+    return first_page(client.list_data_streams(request=request, timeout=timeout), 'data_streams')
 
 
+@acached('list_datastreams')
+def _alist_datastreams_with_retry(client, property_id):
+    """Async variant of _list_datastreams_with_retry"""
+    return aiter_pages(
+        functools.partial(_alist_datastreams_page, client, property_id), 'data_streams'
+    )
+
+
+@async_retry_on_transient_error()
+async def _alist_datastreams_page(client, property_id, page_token, timeout=None):
+    """Fetch one page of data streams with async retry logic"""
+    request = {
+        "parent": f"properties/{property_id}",
+        "page_size": PAGE_SIZE,
+        "page_token": page_token,
+    }
+    pager = await client.list_data_streams(request=request, timeout=timeout)
+    return await afirst_page(pager, 'data_streams')
+
+
+@cached('get_datastream', many=False)
 @retry_on_transient_error()
+def _get_datastream_with_retry(client, property_id, stream_id, timeout=None):
+    """Get data stream with retry logic"""
+    return client.get_data_stream(
+        name=f"properties/{property_id}/dataStreams/{stream_id}", timeout=timeout
+    )
+
+
+@retry_on_transient_error(idempotent=False)
 def _create_datastream_with_retry(client, property_id, name, url):
     """Create data stream with retry logic"""
+    from google.analytics.admin_v1alpha.types import DataStream
+
     data_stream = DataStream(
         display_name=name,
         type_=DataStream.DataStreamType.WEB_DATA_STREAM,
@@ -0,0 +1,291 @@
+"""Organization-wide inventory commands"""
+
+import abc
+import asyncio
+import contextvars
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Set
+import click
+from ga_cli.decorators import with_client
+from ga_cli.formatters.json import format_ndjson
+from ga_cli.logging_config import logger
+from ga_cli.concurrency import (
+    DEFAULT_CONCURRENCY, MAX_CONCURRENCY, MAX_ASYNC_CONCURRENCY, get_concurrency, get_engine,
+)
+from ga_cli.aio import iterate_async
+from ga_cli.errors import get_friendly_error
+from ga_cli.stats import rpc_stats
+from ga_cli.commands.accounts import (
+    _list_accounts_with_retry, _alist_accounts_with_retry,
+)
+from ga_cli.commands.properties import (
+    _list_properties_with_retry, _alist_properties_with_retry,
+)
+from ga_cli.commands.datastreams import (
+    _list_datastreams_with_retry, _alist_datastreams_with_retry,
+)
+from ga_cli.rows import account_row, datastream_row, property_row
+
+
+@click.group()
+def inventory():
+    """Crawl accounts, properties and data streams"""
+    pass
+
+
+@inventory.command()
+@click.option('--concurrency', type=click.IntRange(1, MAX_ASYNC_CONCURRENCY), default=None,
+              help=f'Listings run in parallel (default: {DEFAULT_CONCURRENCY}, '
+                   f'at most {MAX_CONCURRENCY} with the threads engine)')
+@click.option('--no-streams', is_flag=True, help='Stop at properties, skip data streams')
+@click.pass_context
+@with_client
+def crawl(ctx, concurrency, no_streams):
+    """Snapshot every account, property and data stream as NDJSON
+
+    Each record carries a "kind" (account, property or data_stream) and the
+    IDs of its parents. Listings are pipelined: properties of one account
+    are fetched, and their data streams listed, while later accounts are
+    still paging. Record order across accounts is therefore not fixed.
+    """
+    engine = get_engine(ctx.obj.get('engine'))
+    workers = get_concurrency(concurrency, engine)
+    logger.info(f"Crawling inventory with {workers} {engine} workers")
+
+    crawler: _Crawler
+    if engine == 'async':
+        crawler = AsyncInventoryCrawler(ctx.obj['auth'], workers, include_streams=not no_streams)
+    else:
+        crawler = InventoryCrawler(ctx.obj['client'], workers, include_streams=not no_streams)
+    calls_before = rpc_stats.total_calls()
+    retries_before = rpc_stats.total_retries()
+    start = time.perf_counter()
+
+    format_ndjson(crawler.records())
+
+    elapsed = time.perf_counter() - start
+    counts = crawler.counts
+    summary = (
+        f"Crawled {counts['account']} accounts, {counts['property']} properties, "
+        f"{counts['data_stream']} data streams in {elapsed:.2f}s "
+        f"({rpc_stats.total_calls() - calls_before} RPCs, "
+        f"{rpc_stats.total_retries() - retries_before} retries)"
+    )
+    logger.info(summary)
+    click.echo(summary, err=True)
+
+    if crawler.failures:
+        raise click.ClickException(f"{len(crawler.failures)} listings failed during the crawl")
+
+
+class _Crawler(abc.ABC):
+    """State and failure reporting shared by the inventory crawlers
+
+    Subclasses implement ``records()``, emitting records and scheduling
+    child listings until ``_outstanding`` drops to zero.
+    """
+
+    _DONE = object()
+
+    def __init__(self, workers, include_streams=True):
+        self.workers = workers
+        self.include_streams = include_streams
+        self.counts: Dict[str, int] = {'account': 0, 'property': 0, 'data_stream': 0}
+        self.failures: List[str] = []
+        self._lock = threading.Lock()
+        self._outstanding = 0
+        self._stopped = False
+
+    @abc.abstractmethod
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Run the crawl, yielding records as they are produced"""
+
+    def _report_failure(self, resource, error):
+        logger.error(f"Inventory listing failed for {resource}: {error}")
+        click.echo(f"{resource}: {get_friendly_error(error)}", err=True)
+        with self._lock:
+            self.failures.append(resource)
+
+
+class InventoryCrawler(_Crawler):
+    """Pipelined account -> property -> data stream crawler
+
+    Listings run as tasks on one bounded thread pool. Each task emits its
+    records onto a queue and schedules the listings of its children, so
+    deeper levels start as soon as their parent arrives. ``records()``
+    drains the queue on the calling thread until no task is outstanding.
+    """
+
+    def __init__(self, client, workers, include_streams=True):
+        super().__init__(workers, include_streams)
+        self.client = client
+        self._queue: queue.Queue[Any] = queue.Queue()
+        # Set by records() for the duration of the crawl
+        self._executor: ThreadPoolExecutor
+
+    def records(self):
+        """Run the crawl, yielding records as they are produced"""
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            self._executor = executor
+            self._submit(self._crawl_accounts, 'accounts')
+
+            try:
+                while True:
+                    item = self._queue.get()
+                    if item is self._DONE:
+                        break
+                    if isinstance(item, BaseException):
+                        raise item
+                    self.counts[item['kind']] += 1
+                    yield item
+            finally:
+                # Stop scheduling new listings; in-flight ones finish on exit
+                self._stopped = True
+
+    def _submit(self, task, resource, *args):
+        with self._lock:
+            if self._stopped:
+                return
+            self._outstanding += 1
+        self._executor.submit(contextvars.copy_context().run, self._run, task, resource, *args)
+
+    def _run(self, task, resource, *args):
+        from google.api_core import exceptions
+
+        try:
+            task(*args)
+        except exceptions.GoogleAPIError as e:
+            self._report_failure(resource, e)
+        except Exception as e:
+            self._queue.put(e)
+        finally:
+            with self._lock:
+                self._outstanding -= 1
+                finished = self._outstanding == 0
+            if finished:
+                self._queue.put(self._DONE)
+
+    def _crawl_accounts(self):
+        for account in _list_accounts_with_retry(self.client):
+            record = _account_record(account)
+            self._queue.put(record)
+            self._submit(self._crawl_properties, f"accounts/{record['id']}", record['id'])
+
+    def _crawl_properties(self, account_id):
+        for prop in _list_properties_with_retry(self.client, account_id):
+            record = _property_record(account_id, prop)
+            self._queue.put(record)
+            if self.include_streams:
+                self._submit(
+                    self._crawl_streams, f"properties/{record['id']}", account_id, record['id']
+                )
+
+    def _crawl_streams(self, account_id, property_id):
+        for stream in _list_datastreams_with_retry(self.client, property_id):
+            self._queue.put(_stream_record(account_id, property_id, stream))
+
+
+class AsyncInventoryCrawler(_Crawler):
+    """Asyncio engine for the inventory crawl
+
+    Same pipeline as InventoryCrawler, with listings as coroutines on one
+    async client. A semaphore bounds how many listings are in flight, so
+    high concurrency does not cost a thread per request.
+    """
+
+    def __init__(self, auth, workers, include_streams=True):
+        super().__init__(workers, include_streams)
+        self.auth = auth
+        self._tasks: Set[asyncio.Future] = set()
+        # Created by _arecords() on the crawl's event loop
+        self.client: Any
+        self._aqueue: asyncio.Queue[Any]
+        self._semaphore: asyncio.Semaphore
+
+    def records(self):
+        """Run the crawl, yielding records as they are produced"""
+        for record in iterate_async(self._arecords):
+            self.counts[record['kind']] += 1
+            yield record
+
+    async def _arecords(self):
+        self._aqueue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self.workers)
+        self.client = self.auth.get_async_client()
+
+        async with self.client:
+            self._spawn(self._acrawl_accounts, 'accounts')
+            try:
+                while True:
+                    item = await self._aqueue.get()
+                    if item is self._DONE:
+                        break
+                    if isinstance(item, BaseException):
+                        raise item
+                    yield item
+            finally:
+                self._stopped = True
+                for task in self._tasks:
+                    task.cancel()
+
+    def _spawn(self, coro_fn, resource, *args):
+        if self._stopped:
+            return
+        self._outstanding += 1
+        task = asyncio.ensure_future(self._arun(coro_fn, resource, *args))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _arun(self, coro_fn, resource, *args):
+        from google.api_core import exceptions
+
+        try:
+            async with self._semaphore:
+                await coro_fn(*args)
+        except exceptions.GoogleAPIError as e:
+            self._report_failure(resource, e)
+        except Exception as e:
+            self._aqueue.put_nowait(e)
+        finally:
+            self._outstanding -= 1
+            if self._outstanding == 0:
+                self._aqueue.put_nowait(self._DONE)
+
+    async def _acrawl_accounts(self):
+        async for account in _alist_accounts_with_retry(self.client):
+            record = _account_record(account)
+            self._aqueue.put_nowait(record)
+            self._spawn(self._acrawl_properties, f"accounts/{record['id']}", record['id'])
+
+    async def _acrawl_properties(self, account_id):
+        async for prop in _alist_properties_with_retry(self.client, account_id):
+            record = _property_record(account_id, prop)
+            self._aqueue.put_nowait(record)
+            if self.include_streams:
+                self._spawn(
+                    self._acrawl_streams, f"properties/{record['id']}", account_id, record['id']
+                )
+
+    async def _acrawl_streams(self, account_id, property_id):
+        async for stream in _alist_datastreams_with_retry(self.client, property_id):
+            self._aqueue.put_nowait(_stream_record(account_id, property_id, stream))
+
+
+def _account_record(account):
+    return {'kind': 'account', **account_row(account)._asdict()}
+
+
+def _property_record(account_id, prop):
+    return {'kind': 'property', 'account_id': account_id, **property_row(prop)._asdict()}
+
+
+def _stream_record(account_id, property_id, stream):
+    return {
+        'kind': 'data_stream',
+        'account_id': account_id,
+        'property_id': property_id,
+        **datastream_row(stream)._asdict(),
+    }
@@ -1,14 +1,33 @@
 """Property management commands"""
 
 import builtins
+import functools
+import threading
+import time
+from typing import List
 import click
-from google.analytics.admin_v1alpha.types import Property
-from ga_cli.decorators import with_client
+from ga_cli.decorators import with_client, list_output_options, fields_option
 from ga_cli.formatters.table import format_table
-from ga_cli.formatters.json import format_json
-from ga_cli.validators import validate_account_id, validate_property_id, validate_timezone, validate_currency
+from ga_cli.formatters.json import format_json, format_ndjson
+from ga_cli.output import output_rows
+from ga_cli.projection import resource_id, row_builder
+from ga_cli.rows import PROPERTY_FIELDS, AccountPropertyRow, property_details, property_row
+from ga_cli.validators import (
+    validate_account_id, validate_property_id, validate_property_ids, validate_timezone, validate_currency,
+    validate_industry, parse_id_list,
+)
 from ga_cli.logging_config import logger
-from ga_cli.retry import retry_on_transient_error
+from ga_cli.retry import retry_on_transient_error, async_retry_on_transient_error
+from ga_cli.cache import cached, acached, response_cache
+from ga_cli.pagination import PAGE_SIZE, first_page, iter_pages
+from ga_cli.aio import afirst_page, aiter_pages, amap_bounded, iterate_async
+from ga_cli.concurrency import (
+    DEFAULT_CONCURRENCY, MAX_CONCURRENCY, MAX_ASYNC_CONCURRENCY,
+    get_concurrency, get_engine, map_bounded,
+)
+from ga_cli.errors import get_friendly_error
+from ga_cli.manifest import read_manifest
+from ga_cli.commands.accounts import _list_accounts_with_retry
 
 
 @click.group()
@@ -18,85 +37,151 @@ def properties():
 
 
 @properties.command()
-@click.argument('account_id', callback=validate_account_id)
-@click.option('--format', type=click.Choice(['table', 'json']), default='table')
+@click.argument('account_id', required=False, callback=validate_account_id)
+@click.option('--all-accounts', is_flag=True,
+              help='List properties for every account the credentials can access')
+@click.option('--accounts-from', type=click.File('r'),
+              help='Read account IDs, one per line, from a file (use - for stdin)')
+@click.option('--concurrency', type=click.IntRange(1, MAX_ASYNC_CONCURRENCY), default=None,
+              help=f'Accounts listed in parallel (default: {DEFAULT_CONCURRENCY}, '
+                   f'at most {MAX_CONCURRENCY} with the threads engine)')
+@list_output_options
+@fields_option(PROPERTY_FIELDS)
 @click.pass_context
 @with_client
-def list(ctx, account_id, format):
-    """List properties for an account"""
+def list(ctx, account_id, all_accounts, accounts_from, concurrency, format, compact, fields):
+    """List properties for an account, or across many accounts"""
     client = ctx.obj['client']
-    logger.info(f"Listing properties for account: {account_id}")
-
-    properties_data = []
-    request = {"filter": f"ancestor:accounts/{account_id}"}
-    for property in _list_properties_with_retry(client, request):
-        properties_data.append({
-            'id': property.name.split('/')[-1] if '/' in property.name else property.name,
-            'name': property.display_name or 'N/A',
-            'type': property.property_type.name if property.property_type else 'N/A',
-            'timezone': property.time_zone or 'N/A',
-            'currency': property.currency_code or 'N/A',
-        })
-
-    logger.info(f"Found {len(properties_data)} properties")
-
-    if format == 'json':
-        format_json(properties_data)
+    projection = row_builder(PROPERTY_FIELDS, fields, format, None)
+
+    if sum(bool(source) for source in (account_id, all_accounts, accounts_from)) != 1:
+        raise click.UsageError(
+            "Specify exactly one of ACCOUNT_ID, --all-accounts or --accounts-from"
+        )
+
+    if account_id:
+        logger.info(f"Listing properties for account: {account_id}")
+
+        build_row = projection or property_row
+        properties_data = (
+            build_row(property) for property in _list_properties_with_retry(client, account_id)
+        )
+
+        count = output_rows(properties_data, format, title=f"Properties for Account {account_id}", compact=compact)
+
+        logger.info(f"Found {count} properties")
+        return
+
+    if all_accounts:
+        account_ids = [
+            resource_id(account.name) for account in _list_accounts_with_retry(client)
+        ]
     else:
-        format_table(properties_data, title=f"Properties for Account {account_id}")
+        account_ids = parse_id_list(accounts_from, validate_account_id, prefix='accounts/')
+
+    engine = get_engine(ctx.obj.get('engine'))
+    workers = get_concurrency(concurrency, engine)
+    logger.info(
+        f"Listing properties for {len(account_ids)} accounts with {workers} {engine} workers"
+    )
+
+    failures: List[str] = []
+    properties_data = _list_properties_for_accounts(
+        ctx, account_ids, workers, engine, failures, projection
+    )
+    count = output_rows(
+        properties_data, format, title=f"Properties for {len(account_ids)} Accounts", compact=compact
+    )
+
+    logger.info(f"Found {count} properties across {len(account_ids)} accounts")
+
+    if failures:
+        raise click.ClickException(
+            f"Failed to list properties for {len(failures)} of {len(account_ids)} accounts"
+        )
 
 
 @properties.command()
 @click.argument('property_id', callback=validate_property_id)
-@click.option('--format', type=click.Choice(['table', 'json']), default='table')
+@click.option('--format', type=click.Choice(['table', 'json', 'ids']), default='table')
+@fields_option(PROPERTY_FIELDS)
 @click.pass_context
 @with_client
-def get(ctx, property_id, format):
+def get(ctx, property_id, format, fields):
     """Get property details"""
     client = ctx.obj['client']
+    build_row = row_builder(PROPERTY_FIELDS, fields, format, property_details)
     logger.info(f"Getting property details for: {property_id}")
 
     property = _get_property_with_retry(client, property_id)
-
-    property_data = {
-        'id': property.name.split('/')[-1] if '/' in property.name else property.name,
-        'name': property.display_name or 'N/A',
-        'type': property.property_type.name if property.property_type else 'N/A',
-        'timezone': property.time_zone or 'N/A',
-        'currency': property.currency_code or 'N/A',
-        'industry': property.industry_category.name if property.industry_category else 'N/A',
-        'create_time': str(property.create_time).split('.')[0] if property.create_time else 'N/A',
-    }
+    property_data = build_row(property)
 
     logger.info(f"Retrieved property: {property.display_name}")
 
-    if format == 'json':
+    if format == 'ids':
+        click.echo(property_data.id)
+    elif format == 'json':
         format_json(property_data)
     else:
         format_table([property_data], title=f"Property: {property.display_name}")
 
 
 @properties.command()
-@click.argument('account_id', callback=validate_account_id)
-@click.option('--name', required=True, help='Display name for the property')
+@click.argument('account_id', required=False, callback=validate_account_id)
+@click.option('--name', help='Display name for the property')
 @click.option('--timezone', default='America/Los_Angeles', callback=validate_timezone,
               help='Property timezone')
 @click.option('--currency', default='USD', callback=validate_currency,
               help='Property currency code (e.g., USD, EUR)')
-@click.option('--industry', default='OTHER', help='Industry category')
+@click.option('--industry', default='OTHER', callback=validate_industry,
+              help='Industry category (e.g., TECHNOLOGY)')
+@click.option('--from-file', 'manifest', type=click.File('r'),
+              help='Create every property in a CSV/JSON manifest (use - for stdin)')
+@click.option('--concurrency', type=click.IntRange(1, MAX_CONCURRENCY), default=None,
+              help=f'Properties created in parallel with --from-file (default: {DEFAULT_CONCURRENCY})')
+@click.option('--continue-on-error', is_flag=True,
+              help='Keep creating the remaining rows after a failure')
 @click.pass_context
 @with_client
-def create(ctx, account_id, name, timezone, currency, industry):
-    """Create a new GA4 property"""
+def create(ctx, account_id, name, timezone, currency, industry, manifest, concurrency,
+           continue_on_error):
+    """Create a new GA4 property, or many from a manifest
+
+    \b
+    A manifest has one property per row with the columns
+    account_id, name, timezone, currency and industry. Empty or missing
+    columns fall back to ACCOUNT_ID and the --timezone, --currency and
+    --industry options. One result per row is written as NDJSON.
+    """
     client = ctx.obj['client']
+
+    if manifest:
+        if name:
+            raise click.UsageError("--name cannot be combined with --from-file")
+        defaults = {
+            'account_id': account_id or '',
+            'timezone': timezone,
+            'currency': currency,
+            'industry': industry,
+        }
+        _create_properties_from_manifest(
+            client, manifest, defaults, get_concurrency(concurrency), continue_on_error
+        )
+        return
+
+    if not account_id or not name:
+        raise click.UsageError("ACCOUNT_ID and --name are required unless --from-file is given")
+
     logger.info(f"Creating property '{name}' for account: {account_id}")
 
     property = _create_property_with_retry(
         client, account_id, name, timezone, currency, industry
     )
 
-    property_id = property.name.split('/')[-1] if '/' in property.name else property.name
+    property_id = resource_id(property.name)
     logger.info(f"Created property: {property_id}")
+    response_cache.invalidate('list_properties', account_id)
+    response_cache.invalidate('list_account_summaries')
 
     click.echo(f"Created property: {property.display_name}")
     click.echo(f"  Property ID: {property_id}")
@@ -105,36 +190,383 @@ def create(ctx, account_id, name, timezone, currency, industry):
 
 
 @properties.command()
-@click.argument('property_id', callback=validate_property_id)
-@click.confirmation_option(prompt='Are you sure you want to delete this property?')
+@click.argument('property_ids', nargs=-1, callback=validate_property_ids)
+@click.option('--from-file', 'ids_file', type=click.File('r'),
+              help='Read property IDs, one per line, from a file (- for stdin, needs --yes)')
+@click.option('--dry-run', is_flag=True, help='Show what would be deleted and exit')
+@click.option('--yes', is_flag=True, help='Confirm the action without prompting.')
+@click.option('--concurrency', type=click.IntRange(1, MAX_CONCURRENCY), default=None,
+              help=f'Properties looked up and deleted in parallel (default: {DEFAULT_CONCURRENCY})')
+@click.option('--continue-on-error', is_flag=True,
+              help='Keep deleting the remaining properties after a failure')
 @click.pass_context
 @with_client
-def delete(ctx, property_id):
-    """Delete a property"""
+def delete(ctx, property_ids, ids_file, dry_run, yes, concurrency, continue_on_error):
+    """Delete one or more properties
+
+    \b
+    With several IDs, the properties are looked up first and shown as one
+    plan, confirmed once, then deleted in parallel. One result per property
+    is written as NDJSON.
+    """
     client = ctx.obj['client']
-    logger.info(f"Deleting property: {property_id}")
 
-    _delete_property_with_retry(client, property_id)
+    # The confirmation prompt reads stdin, which the IDs have already used up
+    if ids_file and ids_file.name == '<stdin>' and not (yes or dry_run):
+        raise click.UsageError("--yes is required when IDs are read from stdin (--from-file -)")
 
-    logger.info(f"Deleted property: {property_id}")
-    click.echo(f"Property {property_id} deleted successfully")
+    property_ids = builtins.list(property_ids)
+    if ids_file:
+        property_ids += parse_id_list(ids_file, validate_property_id, prefix='properties/')
+    property_ids = builtins.list(dict.fromkeys(property_ids))
+
+    if not property_ids:
+        raise click.UsageError("Specify PROPERTY_IDS or --from-file")
+
+    if len(property_ids) == 1 and not dry_run:
+        property_id = property_ids[0]
+        if not yes:
+            click.confirm('Are you sure you want to delete this property?', abort=True)
+
+        logger.info(f"Deleting property: {property_id}")
+
+        _delete_property_with_retry(client, property_id)
+        _invalidate_properties([property_id])
+
+        logger.info(f"Deleted property: {property_id}")
+        click.echo(f"Property {property_id} deleted successfully")
+        return
+
+    _delete_properties(
+        client, property_ids, get_concurrency(concurrency), dry_run, yes, continue_on_error
+    )
+
+
+def _create_properties_from_manifest(client, manifest, defaults, workers, continue_on_error):
+    """Validate every manifest row, then create the properties concurrently
+
+    Nothing is created unless the whole manifest is valid. Without
+    ``continue_on_error`` the first failed creation stops rows that have
+    not started yet; they are reported as skipped.
+    """
+    from google.api_core import exceptions
+
+    rows = _manifest_rows(manifest, defaults)
+    logger.info(f"Creating {len(rows)} properties with {workers} workers")
+
+    def create_row(row):
+        return _create_property_with_retry(
+            client, row['account_id'], row['name'], row['timezone'], row['currency'],
+            row['industry'],
+        )
+
+    counts = {'created': 0, 'failed': 0, 'skipped': 0}
+    created_accounts = set()
+
+    def results():
+        for row, property, error, skipped in _run_bulk(
+            create_row, rows, workers, continue_on_error
+        ):
+            result = {'row': row['location'], 'account_id': row['account_id'], 'name': row['name']}
+            if error is not None:
+                if not isinstance(error, exceptions.GoogleAPIError):
+                    raise error
+                logger.error(f"Creating property from {row['location']} failed: {error}")
+                result.update(status='failed', error=get_friendly_error(error))
+            elif skipped:
+                result['status'] = 'skipped'
+            else:
+                result.update(status='created', property_id=resource_id(property.name))
+                created_accounts.add(row['account_id'])
+            counts[result['status']] += 1
+            yield result
+
+    start = time.perf_counter()
+    try:
+        format_ndjson(results())
+    finally:
+        for account_id in created_accounts:
+            response_cache.invalidate('list_properties', account_id)
+        if created_accounts:
+            response_cache.invalidate('list_account_summaries')
+
+    elapsed = time.perf_counter() - start
+    summary = (
+        f"Created {counts['created']} of {len(rows)} properties in {elapsed:.2f}s "
+        f"({counts['created'] / elapsed if elapsed else 0:.1f}/s)"
+    )
+    logger.info(summary)
+    click.echo(summary, err=True)
+
+    if counts['failed']:
+        skipped = f", {counts['skipped']} skipped" if counts['skipped'] else ''
+        raise click.ClickException(
+            f"{counts['failed']} of {len(rows)} properties failed to create{skipped}"
+        )
+
+
+def _manifest_rows(manifest, defaults):
+    """Read and validate every manifest row before anything is created"""
+    rows = []
+    errors = []
+    checks = [
+        ('account_id', validate_account_id),
+        ('timezone', validate_timezone),
+        ('currency', validate_currency),
+        ('industry', validate_industry),
+    ]
+
+    for location, record in read_manifest(manifest):
+        row = {field: record.get(field) or default for field, default in defaults.items()}
+        row['name'] = record.get('name', '')
+        row['location'] = location
+
+        if not row['account_id']:
+            errors.append(f"{location}: missing account_id")
+        if not row['name']:
+            errors.append(f"{location}: missing name")
+        for field, validator in checks:
+            try:
+                row[field] = validator(None, None, row[field])
+            except click.BadParameter as e:
+                errors.append(f"{location}: {e.message}")
+        rows.append(row)
+
+    if errors:
+        for error in errors:
+            click.echo(error, err=True)
+        raise click.ClickException(
+            f"Manifest has {len(errors)} invalid values; no properties were created"
+        )
+    if not rows:
+        raise click.ClickException("Manifest contains no properties")
+    return rows
+
+
+def _delete_properties(client, property_ids, workers, dry_run, yes, continue_on_error):
+    """Show a deletion plan, confirm it once, then delete concurrently"""
+    from google.api_core import exceptions
+
+    logger.info(f"Resolving {len(property_ids)} properties with {workers} workers")
+
+    plan = []
+    unresolved = []
+    for property_id, property, error in map_bounded(
+        functools.partial(_get_property_with_retry, client), property_ids, max_workers=workers
+    ):
+        if error is not None:
+            if not isinstance(error, exceptions.GoogleAPIError):
+                raise error
+            unresolved.append({
+                'property_id': property_id, 'name': None,
+                'status': 'failed', 'error': get_friendly_error(error),
+            })
+        else:
+            plan.append((property_id, property.display_name or 'N/A'))
+
+    click.echo(f"{len(plan)} properties will be deleted:", err=True)
+    for property_id, name in plan:
+        click.echo(f"  {property_id}  {name}", err=True)
+    if unresolved:
+        click.echo(f"{len(unresolved)} properties could not be looked up and are left alone:",
+                   err=True)
+        for result in unresolved:
+            click.echo(f"  {result['property_id']}  {result['error']}", err=True)
+
+    if dry_run:
+        click.echo("Dry run: nothing was deleted", err=True)
+        return
+    if plan and not yes:
+        click.confirm(f"Delete {len(plan)} properties?", abort=True, err=True)
+
+    counts = {'deleted': 0, 'failed': len(unresolved), 'skipped': 0}
+    deleted = []
+
+    def delete_one(item):
+        return _delete_property_with_retry(client, item[0])
+
+    def results():
+        yield from unresolved
+        for (property_id, name), _, error, skipped in _run_bulk(
+            delete_one, plan, workers, continue_on_error
+        ):
+            result = {'property_id': property_id, 'name': name}
+            if error is not None:
+                if not isinstance(error, exceptions.GoogleAPIError):
+                    raise error
+                logger.error(f"Deleting property {property_id} failed: {error}")
+                result.update(status='failed', error=get_friendly_error(error))
+            elif skipped:
+                result['status'] = 'skipped'
+            else:
+                result['status'] = 'deleted'
+                deleted.append(property_id)
+            counts[result['status']] += 1
+            yield result
+
+    start = time.perf_counter()
+    try:
+        format_ndjson(results())
+    finally:
+        if deleted:
+            _invalidate_properties(deleted)
+
+    elapsed = time.perf_counter() - start
+    summary = f"Deleted {counts['deleted']} of {len(property_ids)} properties in {elapsed:.2f}s"
+    logger.info(summary)
+    click.echo(summary, err=True)
+
+    if counts['failed']:
+        skipped = f", {counts['skipped']} skipped" if counts['skipped'] else ''
+        raise click.ClickException(
+            f"{counts['failed']} of {len(property_ids)} properties failed to delete{skipped}"
+        )
+
+
+def _run_bulk(func, items, workers, continue_on_error):
+    """Apply a mutation to items on the bounded pool
+
+    Without ``continue_on_error`` the first failure stops items that have
+    not started yet; they come back flagged as skipped.
+
+    Yields:
+        (item, result, error, skipped) tuples in input order
+    """
+    stop = threading.Event()
+    not_run = object()
+
+    def run(item):
+        if stop.is_set():
+            return not_run
+        try:
+            return func(item)
+        except Exception:
+            if not continue_on_error:
+                stop.set()
+            raise
+
+    for item, result, error in map_bounded(run, items, max_workers=workers):
+        skipped = result is not_run
+        yield item, None if skipped else result, error, skipped
+
+
+def _invalidate_properties(property_ids):
+    """Drop cached responses that may still reference deleted properties"""
+    for property_id in property_ids:
+        response_cache.invalidate('get_property', property_id)
+        response_cache.invalidate('list_datastreams', property_id)
+    # The owning account is not known here, so drop every property listing
+    response_cache.invalidate_all('list_properties')
+    response_cache.invalidate('list_account_summaries')
+
+
+def _list_properties_for_accounts(ctx, account_ids, workers, engine, failures, projection=None):
+    """Yield property rows for many accounts, fetched concurrently
+
+    Accounts are listed on a bounded thread pool sharing one client, or as
+    coroutines on the async client, and rows are produced in account order.
+    Accounts that fail are reported on stderr and appended to ``failures``
+    without stopping the others. Rows are built by ``projection`` when
+    given, else they are the default columns prefixed with the account.
+    """
+    from google.api_core import exceptions
+
+    build_row = projection or property_row
+    if engine == 'async':
+        auth = ctx.obj['auth']
+        outcomes = iterate_async(
+            lambda: _alist_properties_for_accounts(auth, account_ids, workers, build_row)
+        )
+    else:
+        client = ctx.obj['client']
+
+        def fetch(account_id):
+            return [build_row(p) for p in _list_properties_with_retry(client, account_id)]
+
+        outcomes = map_bounded(fetch, account_ids, max_workers=workers)
+
+    for account_id, rows, error in outcomes:
+        if error is not None:
+            if not isinstance(error, exceptions.GoogleAPIError):
+                raise error
+            logger.error(f"Listing properties for account {account_id} failed: {error}")
+            click.echo(f"Account {account_id}: {get_friendly_error(error)}", err=True)
+            failures.append(account_id)
+            continue
+
+        if projection is not None:
+            yield from rows
+            continue
+        for row in rows:
+            yield AccountPropertyRow._make((account_id, *row))
+
+
+async def _alist_properties_for_accounts(auth, account_ids, concurrency, build_row=None):
+    """Async engine for _list_properties_for_accounts"""
+    build_row = build_row or property_row
+    client = auth.get_async_client()
+
+    async def fetch(account_id):
+        return [
+            build_row(p) async for p in _alist_properties_with_retry(client, account_id)
+        ]
+
+    async with client:
+        async for outcome in amap_bounded(fetch, account_ids, concurrency):
+            yield outcome
+
+
+@cached('list_properties')
+def _list_properties_with_retry(client, account_id):
+    """List properties page by page, retrying each page independently"""
+    return iter_pages(
+        functools.partial(_list_properties_page, client, account_id), 'properties'
+    )
 
 
 @retry_on_transient_error()
-def _list_properties_with_retry(client, request):
-    """List properties with retry logic"""
-    return builtins.list(client.list_properties(request=request))
+def _list_properties_page(client, account_id, page_token, timeout=None):
+    """Fetch one page of properties with retry logic"""
+    request = {
+        "filter": f"ancestor:accounts/{account_id}",
+        "page_size": PAGE_SIZE,
+        "page_token": page_token,
+    }
+    return first_page(client.list_properties(request=request, timeout=timeout), 'properties')
+
+
+@acached('list_properties')
+def _alist_properties_with_retry(client, account_id):
+    """Async variant of _list_properties_with_retry"""
+    return aiter_pages(
+        functools.partial(_alist_properties_page, client, account_id), 'properties'
+    )
 
 
+@async_retry_on_transient_error()
+async def _alist_properties_page(client, account_id, page_token, timeout=None):
+    """Fetch one page of properties with async retry logic"""
+    request = {
+        "filter": f"ancestor:accounts/{account_id}",
+        "page_size": PAGE_SIZE,
+        "page_token": page_token,
+    }
+    pager = await client.list_properties(request=request, timeout=timeout)
+    return await afirst_page(pager, 'properties')
+
+
+@cached('get_property', many=False)
 @retry_on_transient_error()
-def _get_property_with_retry(client, property_id):
+def _get_property_with_retry(client, property_id, timeout=None):
     """Get property with retry logic"""
-    return client.get_property(name=f"properties/{property_id}")
+    return client.get_property(name=f"properties/{property_id}", timeout=timeout)
 
 
-@retry_on_transient_error()
+@retry_on_transient_error(idempotent=False)
 def _create_property_with_retry(client, account_id, name, timezone, currency, industry):
     """Create property with retry logic"""
+    from google.analytics.admin_v1alpha.types import Property
+
     return client.create_property(
         property=Property(
             parent=f"accounts/{account_id}",
@@ -146,7 +578,7 @@ def _create_property_with_retry(client, account_id, name, timezone, currency, in
     )
 
 
-@retry_on_transient_error()
+@retry_on_transient_error(idempotent=False)
 def _delete_property_with_retry(client, property_id):
     """Delete property with retry logic"""
     return client.delete_property(name=f"properties/{property_id}")
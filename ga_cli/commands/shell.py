@@ -0,0 +1,221 @@
+"""Interactive shell and batch scripts running many commands in one process"""
+
+import shlex
+import sys
+from typing import List, Tuple
+import click
+from ga_cli.concurrency import DEFAULT_CONCURRENCY, MAX_CONCURRENCY
+from ga_cli.daemon import subcommand
+from ga_cli.logging_config import logger
+
+
+PROMPT = 'ga-cli> '
+
+# Commands that own a session themselves cannot run inside one
+NESTED_COMMANDS = ('shell', 'run', 'daemon')
+
+# Lines containing one of these words change state, so later lines may
+# depend on them; they never run alongside other lines
+MUTATING_WORDS = frozenset(('create', 'delete', 'init'))
+
+
+def parse_line(line):
+    """Split a shell or script line into CLI arguments
+
+    Blank lines and ``#`` comments give an empty list, and a leading
+    ``ga-cli`` is optional.
+
+    Raises:
+        click.UsageError: On unbalanced quotes or nested session commands
+    """
+    try:
+        args = shlex.split(line, comments=True)
+    except ValueError as e:
+        raise click.UsageError(f"Cannot parse line: {e}")
+    if args and args[0] == 'ga-cli':
+        args = args[1:]
+    command = subcommand(args)
+    if command in NESTED_COMMANDS:
+        raise click.UsageError(f"'{command}' cannot run inside a shell or script")
+    return args
+
+
+def is_mutating(args):
+    """Whether a command line may change state other lines depend on"""
+    return any(arg in MUTATING_WORDS for arg in args if not arg.startswith('-'))
+
+
+def global_args(ctx):
+    """Global options given to the parent invocation, to repeat on every line"""
+    params = ctx.find_root().params
+    args = []
+    if params.get('credentials'):
+        args += ['--credentials', params['credentials']]
+    if params.get('no_cache'):
+        args.append('--no-cache')
+    if params.get('refresh'):
+        args.append('--refresh')
+    if params.get('engine'):
+        args += ['--engine', params['engine']]
+    if params.get('transport'):
+        args += ['--transport', params['transport']]
+    if params.get('timeout') is not None:
+        args += ['--timeout', str(params['timeout'])]
+    if params.get('log_level'):
+        args += ['--log-level', params['log_level']]
+    # --profile-out is left out: every line would overwrite the same dump
+    if params.get('profile'):
+        args.append('--profile')
+    return args
+
+
+def _start_session(ctx):
+    from ga_cli.session import Session
+
+    session = Session()
+    try:
+        session.warm(ctx.obj.get('credentials'))
+    except Exception as e:
+        # Commands needing the client will report the problem themselves
+        logger.warning(f"Could not create a client up front: {e}")
+    return session
+
+
+@click.command()
+@click.pass_context
+def shell(ctx):
+    """Run commands interactively against one warm client
+
+    \b
+    Type commands without the leading ga-cli, e.g. "accounts list".
+    "help" shows the available commands; "exit" or Ctrl-D quits.
+    """
+    session = _start_session(ctx)
+    base_args = global_args(ctx)
+    interactive = sys.stdin.isatty()
+
+    if interactive:
+        try:
+            import readline  # noqa: F401 - enables line editing and history for input()
+        except ImportError:
+            pass
+        click.echo("ga-cli shell. Type 'help' for commands, 'exit' to quit.", err=True)
+
+    exit_code = 0
+    while True:
+        try:
+            line = input(PROMPT if interactive else '')
+        except EOFError:
+            if interactive:
+                click.echo(err=True)
+            break
+        except KeyboardInterrupt:
+            click.echo(err=True)
+            continue
+
+        try:
+            args = parse_line(line)
+        except click.UsageError as e:
+            e.show()
+            exit_code = e.exit_code
+            continue
+        if not args:
+            continue
+        if args[0] in ('exit', 'quit'):
+            break
+        if args[0] == 'help':
+            args = ['--help']
+
+        try:
+            exit_code = session.run(base_args + args)
+        except KeyboardInterrupt:
+            click.echo("Interrupted", err=True)
+            exit_code = 130
+
+    ctx.exit(exit_code if not interactive else 0)
+
+
+@click.command()
+@click.argument('script', type=click.File('r'))
+@click.option('--parallel', type=click.IntRange(1, MAX_CONCURRENCY), default=1,
+              help=f'Run up to this many independent lines at once (e.g. {DEFAULT_CONCURRENCY})')
+@click.option('--keep-going', is_flag=True, help='Run the remaining lines after a failure')
+@click.pass_context
+def run(ctx, script, parallel, keep_going):
+    """Run a script of ga-cli commands, one per line, in one process
+
+    \b
+    Lines are written without the leading ga-cli; blank lines and # comments
+    are skipped. With --parallel, consecutive read-only lines run
+    concurrently and their output is printed in script order. Lines that
+    create or delete anything run alone, after everything before them.
+    Global options apply to every line and, with --parallel, cannot be
+    given on individual lines.
+    """
+    lines = []
+    for number, line in enumerate(script, start=1):
+        try:
+            args = parse_line(line)
+        except click.UsageError as e:
+            raise click.UsageError(f"line {number}: {e.message}")
+        if args and parallel > 1 and args[0].startswith('-'):
+            raise click.UsageError(
+                f"line {number}: global options such as {args[0]} cannot be set per line "
+                f"with --parallel; give them to 'ga-cli run' instead"
+            )
+        if args:
+            lines.append((number, args))
+
+    session = _start_session(ctx)
+    base_args = global_args(ctx)
+    logger.info(f"Running {len(lines)} commands from {script.name} with {parallel} workers")
+
+    failed = []
+    for batch in _batches(lines, parallel):
+        if len(batch) == 1:
+            number, args = batch[0]
+            results = [(number, session.run(base_args + args))]
+        else:
+            results = []
+            commands = [base_args + args for _, args in batch]
+            numbered = [number for number, _ in batch]
+            for number, (_, exit_code, out, err) in zip(
+                numbered, session.run_parallel(commands, parallel)
+            ):
+                sys.stdout.write(out)
+                sys.stderr.write(err)
+                results.append((number, exit_code))
+            sys.stdout.flush()
+
+        for number, exit_code in results:
+            if exit_code:
+                click.echo(f"line {number}: exit code {exit_code}", err=True)
+                failed.append((number, exit_code))
+        if failed and not keep_going:
+            break
+
+    if failed:
+        raise click.ClickException(
+            f"{len(failed)} of {len(lines)} commands failed" if keep_going
+            else f"Stopped at line {failed[0][0]}"
+        )
+
+
+def _batches(lines, parallel):
+    """Group consecutive read-only lines; mutating lines form their own batch"""
+    if parallel == 1:
+        for line in lines:
+            yield [line]
+        return
+
+    batch: List[Tuple[int, List[str]]] = []
+    for line in lines:
+        if is_mutating(line[1]):
+            if batch:
+                yield batch
+                batch = []
+            yield [line]
+        else:
+            batch.append(line)
+    if batch:
+        yield batch
@@ -0,0 +1,94 @@
+"""Bounded concurrent fan-out for multi-resource commands"""
+
+import contextvars
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Tuple
+
+
+DEFAULT_CONCURRENCY = 8
+# Threads are capped lower than coroutines, which cost no thread each
+MAX_CONCURRENCY = 64
+MAX_ASYNC_CONCURRENCY = 1024
+
+ENGINES = ['threads', 'async']
+
+
+def get_engine(value=None):
+    """Resolve the fan-out engine from the flag, config file or default
+
+    Args:
+        value: Value passed on the command line, if any
+
+    Returns:
+        'threads' or 'async' (config: [performance] engine)
+    """
+    if value:
+        return value
+
+    from ga_cli.config import ConfigManager
+
+    configured = ConfigManager().get('performance', 'engine', fallback='threads')
+    return configured if configured in ENGINES else 'threads'
+
+
+def get_concurrency(value=None, engine='threads'):
+    """Resolve the worker count from the flag, config file or default
+
+    Args:
+        value: Value passed on the command line, if any
+        engine: Fan-out engine; bounds the allowed maximum
+
+    Returns:
+        Number of concurrent workers (config: [performance] concurrency)
+    """
+    if not value:
+        from ga_cli.config import ConfigManager
+
+        configured = ConfigManager().get('performance', 'concurrency', fallback=None)
+        try:
+            value = int(configured) if configured else DEFAULT_CONCURRENCY
+        except ValueError:
+            value = DEFAULT_CONCURRENCY
+
+    limit = MAX_ASYNC_CONCURRENCY if engine == 'async' else MAX_CONCURRENCY
+    return max(1, min(value, limit))
+
+
+def map_bounded(func, items, max_workers=DEFAULT_CONCURRENCY):
+    """Apply func to items on a bounded thread pool, preserving input order
+
+    At most ``2 * max_workers`` calls are in flight or waiting to be
+    consumed, so large inputs are not all scheduled up front. Exceptions are
+    captured per item instead of aborting the run.
+
+    Args:
+        func: Callable applied to each item
+        items: Iterable of inputs
+        max_workers: Number of worker threads
+
+    Yields:
+        (item, result, error) tuples in input order; exactly one of
+        result/error is meaningful
+    """
+    window = max_workers * 2
+    pending: Deque[Tuple[Any, Future]] = deque()
+    items = iter(items)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item in items:
+            # Workers run in a copy of the caller's context (e.g. its trace span)
+            context = contextvars.copy_context()
+            pending.append((item, executor.submit(context.run, func, item)))
+            if len(pending) >= window:
+                yield _collect(*pending.popleft())
+
+        while pending:
+            yield _collect(*pending.popleft())
+
+
+def _collect(item, future):
+    try:
+        return item, future.result(), None
+    except Exception as e:
+        return item, None, e
@@ -0,0 +1,414 @@
+"""Background daemon serving CLI commands from a warm process
+
+``ga-cli daemon start`` keeps an authenticated Admin API client, the
+imported command modules and an in-memory response cache alive, and
+listens on ``~/.ga-cli/daemon.sock``. Regular invocations hand their
+command line to it (see ``forward``) and only relay its output, so they
+skip the heavy imports, credential loading and channel setup.
+
+The client side of this module is imported on every invocation and must
+stay cheap: only the standard library is imported at module level.
+
+Wire format: both directions exchange frames of a one-byte kind, a 4-byte
+big-endian length and a payload. The client sends one REQUEST (JSON); the
+daemon answers with STDOUT/STDERR frames, may ask for input with
+STDIN_REQUEST (the client replies with one STDIN frame, empty at EOF), and
+ends with EXIT carrying the exit code. A request from a different ga-cli
+version is answered with a single VERSION frame naming the daemon's
+version instead, and the client runs the command itself.
+"""
+
+import io
+import json
+import os
+import socket
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+from ga_cli import __version__
+
+
+REQUEST = b'r'
+STDOUT = b'o'
+STDERR = b'e'
+STDIN_REQUEST = b'i'
+STDIN = b'd'
+EXIT = b'x'
+VERSION = b'v'
+
+_HEADER = struct.Struct('!cI')
+
+# Set to run every command in-process even while a daemon is listening
+DISABLE_ENV = 'GA_CLI_NO_DAEMON'
+
+# Client environment applied to the daemon while it runs the command
+FORWARDED_ENV = ('GOOGLE_APPLICATION_CREDENTIALS', 'COLUMNS', 'LINES', 'NO_COLOR', 'TERM')
+
+# Commands that manage a long-lived process themselves are never forwarded
+LOCAL_COMMANDS = ('daemon', 'shell', 'run')
+
+# Global options taking a value, so the subcommand can be found without
+# importing Click (tests check this against the CLI group)
+GLOBAL_VALUE_OPTIONS = (
+    '--credentials', '--engine', '--transport', '--timeout', '--log-level', '--profile-out',
+)
+
+
+def subcommand(args):
+    """Return the subcommand named in a command line, skipping global options
+
+    Returns:
+        The first argument that is neither a global option nor its value,
+        or None if there is none
+    """
+    args = iter(args)
+    for arg in args:
+        if arg == '--':
+            return next(args, None)
+        if arg in GLOBAL_VALUE_OPTIONS:
+            next(args, None)
+        elif not arg.startswith('-'):
+            return arg
+    return None
+
+
+def socket_path():
+    """Path of the daemon's Unix socket"""
+    return Path.home() / '.ga-cli' / 'daemon.sock'
+
+
+def send_frame(sock, kind, payload=b''):
+    sock.sendall(_HEADER.pack(kind, len(payload)) + payload)
+
+
+def recv_frame(sock):
+    """Read one frame; returns (None, None) once the peer has gone away"""
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None, None
+    kind, length = _HEADER.unpack(header)
+    payload = _recv_exact(sock, length) if length else b''
+    if payload is None:
+        return None, None
+    return kind, payload
+
+
+def _recv_exact(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 16))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def connect(path=None):
+    """Connect to a running daemon, or return None if there is none"""
+    family = getattr(socket, 'AF_UNIX', None)
+    path = path or socket_path()
+    if family is None or not path.exists():
+        return None
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def forward(args):
+    """Run a command line through the daemon if one is listening
+
+    Args:
+        args: Arguments after the program name
+
+    Returns:
+        The command's exit code, or None if it must run in-process
+    """
+    if os.environ.get(DISABLE_ENV) or subcommand(args) in LOCAL_COMMANDS:
+        return None
+
+    sock = connect()
+    if sock is None:
+        return None
+
+    request = {
+        'version': __version__,
+        'argv': list(args),
+        'cwd': os.getcwd(),
+        'env': {name: os.environ[name] for name in FORWARDED_ENV if name in os.environ},
+        'stdout_isatty': sys.stdout.isatty(),
+        'stderr_isatty': sys.stderr.isatty(),
+    }
+
+    with sock:
+        try:
+            send_frame(sock, REQUEST, json.dumps(request).encode('utf-8'))
+        except OSError:
+            return None
+
+        while True:
+            kind, payload = recv_frame(sock)
+            if kind is None:
+                # The command may have run partly, so it is not retried locally
+                sys.stderr.write("Error: lost connection to the ga-cli daemon\n")
+                return 1
+            if kind == STDOUT:
+                sys.stdout.buffer.write(payload)
+                sys.stdout.buffer.flush()
+            elif kind == STDERR:
+                sys.stderr.buffer.write(payload)
+                sys.stderr.buffer.flush()
+            elif kind == STDIN_REQUEST:
+                send_frame(sock, STDIN, os.read(sys.stdin.fileno(), int(payload)))
+            elif kind == EXIT:
+                return int(payload)
+            elif kind == VERSION:
+                sys.stderr.write(
+                    f"Warning: the ga-cli daemon runs version {payload.decode()}, not "
+                    f"{__version__}; running locally. Restart it with "
+                    f"'ga-cli daemon stop' and 'ga-cli daemon start'.\n"
+                )
+                return None
+
+
+def control(command):
+    """Send a control command ('status' or 'stop') to the daemon
+
+    Returns:
+        The daemon's JSON reply, or None if no daemon is listening
+    """
+    sock = connect()
+    if sock is None:
+        return None
+    with sock:
+        send_frame(sock, REQUEST, json.dumps({'control': command}).encode('utf-8'))
+        output = b''
+        while True:
+            kind, payload = recv_frame(sock)
+            if kind is None or kind == EXIT:
+                break
+            if kind == STDOUT:
+                output += payload
+    return json.loads(output or b'{}')
+
+
+class DaemonServer:
+    """Serves forwarded command lines one at a time from a warm Session
+
+    Commands run sequentially in the daemon's main thread: they share
+    process-wide state (stdio, working directory, the Rich console), and a
+    client that arrives while another command runs waits in the listen
+    backlog.
+
+    Args:
+        session: ga_cli.session.Session executing the commands
+        path: Socket path (default: ~/.ga-cli/daemon.sock)
+        idle_timeout: Exit after this many seconds without a request (0: never)
+    """
+
+    def __init__(self, session, path=None, idle_timeout=0):
+        self.session = session
+        self.path = Path(path) if path else socket_path()
+        self.idle_timeout = idle_timeout
+        self.started = time.time()
+        self.last_request = self.started
+        self.stopping = False
+        self._listener: Optional[socket.socket] = None
+
+    def bind(self):
+        """Create the socket, replacing a stale one left by a dead daemon
+
+        Returns:
+            The listening socket
+        """
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.path.exists():
+            probe = connect(self.path)
+            if probe is not None:
+                probe.close()
+                raise RuntimeError(f"A daemon is already listening on {self.path}")
+            self.path.unlink()
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            listener.bind(str(self.path))
+        finally:
+            os.umask(old_umask)
+        listener.listen(16)
+        listener.settimeout(1.0)
+        self._listener = listener
+        return listener
+
+    def serve_forever(self):
+        """Accept requests until stopped or idle for too long"""
+        from ga_cli.logging_config import logger
+
+        listener = self._listener or self.bind()
+        logger.info(f"Daemon listening on {self.path} (pid {os.getpid()})")
+        try:
+            while not self.stopping:
+                try:
+                    conn, _ = listener.accept()
+                except socket.timeout:
+                    idle = time.time() - self.last_request
+                    if self.idle_timeout and idle > self.idle_timeout:
+                        logger.info(f"Daemon idle for {idle:.0f}s, exiting")
+                        break
+                    continue
+                with conn:
+                    conn.settimeout(None)
+                    try:
+                        self.handle(conn)
+                    except OSError as e:
+                        logger.warning(f"Daemon client went away: {e}")
+                self.last_request = time.time()
+        finally:
+            listener.close()
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+            logger.info("Daemon stopped")
+
+    def handle(self, conn):
+        """Serve one connection"""
+        kind, payload = recv_frame(conn)
+        if kind != REQUEST:
+            return
+        request = json.loads(payload)
+
+        control_command = request.get('control')
+        if control_command == 'stop':
+            self.stopping = True
+            send_frame(conn, STDOUT, json.dumps({'stopped': True}).encode('utf-8'))
+            send_frame(conn, EXIT, b'0')
+        elif control_command == 'status':
+            send_frame(conn, STDOUT, json.dumps(self.status()).encode('utf-8'))
+            send_frame(conn, EXIT, b'0')
+        elif request.get('version') != __version__:
+            # Serving another version would run stale code for the client
+            send_frame(conn, VERSION, __version__.encode('utf-8'))
+        else:
+            code = self.execute(conn, request)
+            send_frame(conn, EXIT, str(code).encode('ascii'))
+
+    def status(self):
+        """Describe the running daemon"""
+        return {
+            'pid': os.getpid(),
+            'version': __version__,
+            'socket': str(self.path),
+            'uptime': round(time.time() - self.started, 1),
+            'commands': self.session.commands_run,
+            'credentials': sorted(self.session.auth_sessions),
+        }
+
+    def execute(self, conn, request):
+        """Run a forwarded command with the client's stdio, cwd and environment"""
+        import traceback
+        from ga_cli import output
+        from ga_cli.logging_config import logger
+
+        argv = request.get('argv') or []
+        command = subcommand(argv)
+        if command in LOCAL_COMMANDS:
+            send_frame(conn, STDERR, f"Error: '{command}' cannot run in the daemon\n".encode())
+            return 2
+
+        stdout = io.TextIOWrapper(
+            io.BufferedWriter(_FrameWriter(conn, STDOUT, request.get('stdout_isatty', False))),
+            encoding='utf-8', line_buffering=request.get('stdout_isatty', False),
+        )
+        stderr = io.TextIOWrapper(
+            io.BufferedWriter(_FrameWriter(conn, STDERR, request.get('stderr_isatty', False))),
+            encoding='utf-8', write_through=True,
+        )
+        stdin = io.TextIOWrapper(
+            io.BufferedReader(_FrameReader(conn, (stdout, stderr))), encoding='utf-8'
+        )
+
+        saved_streams = (sys.stdin, sys.stdout, sys.stderr)
+        saved_env = {name: os.environ.get(name) for name in FORWARDED_ENV}
+        saved_cwd = os.getcwd()
+
+        try:
+            for name in FORWARDED_ENV:
+                os.environ.pop(name, None)
+            os.environ.update(request.get('env') or {})
+            os.chdir(request.get('cwd') or saved_cwd)
+            # The console log handler follows sys.stderr to the client
+            sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+            # Rich sizes and colors its console from the terminal it starts on
+            output._console = None
+
+            try:
+                return self.session.run(argv)
+            except Exception:
+                logger.exception("Unexpected error in daemon command")
+                stderr.write(traceback.format_exc())
+                return 1
+        finally:
+            try:
+                stdout.flush()
+                stderr.flush()
+            finally:
+                sys.stdin, sys.stdout, sys.stderr = saved_streams
+                output._console = None
+                os.chdir(saved_cwd)
+                for name, value in saved_env.items():
+                    if value is None:
+                        os.environ.pop(name, None)
+                    else:
+                        os.environ[name] = value
+
+
+class _FrameWriter(io.RawIOBase):
+    """Raw stream sending everything written as frames of one kind"""
+
+    def __init__(self, conn, kind, tty):
+        super().__init__()
+        self.conn = conn
+        self.kind = kind
+        self.tty = tty
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        return self.tty
+
+    def write(self, data):
+        data = bytes(data)
+        if data:
+            send_frame(self.conn, self.kind, data)
+        return len(data)
+
+
+class _FrameReader(io.RawIOBase):
+    """Raw stream reading the client's stdin on demand"""
+
+    def __init__(self, conn, flush_first):
+        super().__init__()
+        self.conn = conn
+        self.flush_first = flush_first
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        # Prompts must be visible before the client blocks on its stdin
+        for stream in self.flush_first:
+            stream.flush()
+        send_frame(self.conn, STDIN_REQUEST, str(len(buffer)).encode('ascii'))
+        kind, data = recv_frame(self.conn)
+        if kind != STDIN:
+            return 0
+        buffer[:len(data)] = data
+        return len(data)
@@ -3,9 +3,12 @@
 import functools
 import click
 from ga_cli.auth import AuthManager
+from ga_cli.cache import response_cache
 from ga_cli.logging_config import logger
 from ga_cli.errors import get_friendly_error
-from google.api_core import exceptions
+from ga_cli.profiling import profiler
+from ga_cli.projection import parse_fields
+from ga_cli.tracing import tracer
 
 
 def with_client(func):
@@ -15,7 +18,7 @@ def with_client(func):
     - Retrieves credentials from context or config
     - Creates an authenticated API client
     - Handles common API exceptions with user-friendly messages
-    - Adds logging for all operations
+    - Adds logging for all operations, and a trace span for the command
     - Injects client into context for use by command
 
     Usage:
@@ -28,6 +31,10 @@ def with_client(func):
     """
     @functools.wraps(func)
     def wrapper(ctx, *args, **kwargs):
+        # Deferred so that merely importing a command module stays cheap
+        with profiler.phase('import'):
+            from google.api_core import exceptions
+
         try:
             # Get credentials path
             credentials_path = ctx.obj.get('credentials')
@@ -42,17 +49,25 @@ def with_client(func):
                     "No credentials configured. Run 'ga-cli config init' first."
                 )
 
-            logger.debug(f"Using credentials: {credentials_path}")
+            logger.debug("Using credentials: %s", credentials_path)
+            response_cache.set_namespace(credentials_path)
 
-            # Create authenticated client
-            auth = AuthManager(credentials_path)
-            client = auth.get_client()
+            # Long-lived sessions (daemon, shell) keep one warm client per credentials
+            sessions = ctx.obj.get('auth_sessions')
+            auth = sessions.get(credentials_path) if sessions is not None else None
+            with profiler.phase('auth'):
+                if auth is None:
+                    auth = AuthManager(credentials_path)
+                client = auth.get_client()
+            if sessions is not None:
+                sessions[credentials_path] = auth
 
-            # Add client to context
+            # Add client to context; fan-out commands may derive async clients from auth
             ctx.obj['client'] = client
+            ctx.obj['auth'] = auth
 
             # Call the actual command
-            logger.info(f"Executing command: {func.__name__}")
+            logger.info("Executing command: %s", func.__name__)
             return func(ctx, *args, **kwargs)
 
         except exceptions.NotFound as e:
@@ -87,4 +102,39 @@ def with_client(func):
             click.echo(f"Error: {str(e)}", err=True)
             raise click.Abort()
 
-    return wrapper
+    @functools.wraps(func)
+    def traced(ctx, *args, **kwargs):
+        # The RPC spans of the command become children of this one
+        with tracer.span('command', ' '.join(ctx.command_path.split()[1:])):
+            return wrapper(ctx, *args, **kwargs)
+
+    return traced
+
+
+LIST_FORMATS = ['table', 'tsv', 'csv', 'json', 'ndjson', 'ids']
+
+
+def list_output_options(func):
+    """Decorator adding the output options shared by list commands
+
+    Adds ``--format`` (table, tsv, csv, json, ndjson or ids) and
+    ``--compact``. Without ``--format`` a table is shown on a terminal and
+    TSV otherwise; ``ids`` writes one resource ID per line.
+    """
+    func = click.option('--compact', is_flag=True,
+                        help='Write JSON on a single line without indentation')(func)
+    func = click.option('--format', type=click.Choice(LIST_FORMATS), default=None,
+                        help='Output format [default: table on a terminal, tsv otherwise]')(func)
+    return func
+
+
+def fields_option(extractors):
+    """Decorator adding ``--fields`` for a resource type's field extractors
+
+    The option value is a tuple of field names (None when not given);
+    commands compile it with ``ga_cli.projection.row_builder``.
+    """
+    return click.option(
+        '--fields', callback=parse_fields, metavar='FIELD,...',
+        help=f"Comma-separated fields to output ({', '.join(extractors)})",
+    )
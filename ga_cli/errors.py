@@ -1,7 +1,5 @@
 """User-friendly error messages for ga-cli"""
 
-from google.api_core import exceptions
-
 
 ERROR_MESSAGES = {
     'not_found': 'Resource not found. Please check the ID and try again.',
@@ -17,6 +15,8 @@ ERROR_MESSAGES = {
 
 def get_friendly_error(exception):
     """Map API exceptions to user-friendly messages"""
+    from google.api_core import exceptions
+
     error_map = {
         exceptions.NotFound: ERROR_MESSAGES['not_found'],
         exceptions.PermissionDenied: ERROR_MESSAGES['permission_denied'],
@@ -2,8 +2,74 @@
 
 import json
 import click
+from ga_cli.profiling import profiler
+from ga_cli.projection import as_dict, is_row
 
 
-def format_json(data):
-    """Format data as JSON"""
-    click.echo(json.dumps(data, indent=2))
+# Separators for compact JSON and NDJSON records
+COMPACT_SEPARATORS = (',', ':')
+
+
+@profiler.timed('output')
+def format_json(data, compact=False):
+    """Format data as JSON
+
+    Lists and other iterables are written one element at a time, so rows
+    appear as soon as they are produced. The output is identical to
+    ``json.dumps(data, indent=2)``, or to a single-line dump when compact.
+
+    Args:
+        data: A dict or row, or an iterable of them
+        compact: Write without indentation or whitespace
+
+    Returns:
+        Number of records written
+    """
+    if is_row(data):
+        data = as_dict(data)
+    if isinstance(data, dict):
+        if compact:
+            click.echo(json.dumps(data, separators=COMPACT_SEPARATORS))
+        else:
+            click.echo(json.dumps(data, indent=2))
+        return 1
+
+    count = 0
+    for item in data:
+        item = as_dict(item)
+        if compact:
+            text = json.dumps(item, separators=COMPACT_SEPARATORS)
+            click.echo(('[' if count == 0 else ',') + text, nl=False)
+        else:
+            text = json.dumps(item, indent=2).replace('\n', '\n  ')
+            click.echo(('[\n  ' if count == 0 else ',\n  ') + text, nl=False)
+        count += 1
+
+    if not count:
+        click.echo('[]')
+    else:
+        click.echo(']' if compact else '\n]')
+    return count
+
+
+@profiler.timed('output')
+def format_ndjson(data):
+    """Format data as newline-delimited JSON, one record per line
+
+    Records are encoded and written as they are produced, so memory stays
+    flat regardless of result size and consumers can start immediately.
+
+    Args:
+        data: A dict or row, or an iterable of them
+
+    Returns:
+        Number of records written
+    """
+    if isinstance(data, dict) or is_row(data):
+        data = [data]
+
+    count = 0
+    for item in data:
+        click.echo(json.dumps(as_dict(item), separators=COMPACT_SEPARATORS))
+        count += 1
+    return count
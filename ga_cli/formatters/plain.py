@@ -0,0 +1,95 @@
+"""Plain delimited formatters (TSV/CSV) for pipes and large result sets"""
+
+import csv
+import sys
+from ga_cli.profiling import profiler
+from ga_cli.projection import is_row
+
+
+# Rows are written without per-row flushes; flush periodically so a slow
+# listing still reaches downstream consumers page by page.
+FLUSH_EVERY = 200
+
+
+def _tsv_field(value):
+    """Render a value as a single TSV field"""
+    text = str(value)
+    if '\t' in text or '\n' in text or '\r' in text:
+        text = text.replace('\t', ' ').replace('\r', ' ').replace('\n', ' ')
+    return text
+
+
+@profiler.timed('output')
+def format_delimited(data, delimiter='\t', header=True):
+    """Stream rows as delimiter-separated values
+
+    The column order is taken once from the first row; later rows are
+    written in that order, with missing keys left empty. Rows of the first
+    row's namedtuple type are written as they are, without any lookups.
+    Nothing is buffered beyond the output stream, so memory stays flat.
+
+    Args:
+        data: Iterable of row dicts or namedtuple rows
+        delimiter: '\\t' for TSV (fields are sanitised) or ',' for CSV (fields are quoted)
+        header: Write the column names as the first line
+
+    Returns:
+        Number of rows written
+    """
+    stream = sys.stdout
+    rows = iter(data)
+    first = next(rows, None)
+    if first is None:
+        return 0
+
+    row_type = type(first) if is_row(first) else None
+    columns = list(first._fields if row_type else first.keys())
+
+    if delimiter == '\t':
+        def write(values):
+            stream.write('\t'.join([_tsv_field(v) for v in values]) + '\n')
+    else:
+        write = csv.writer(stream, delimiter=delimiter, lineterminator='\n').writerow
+
+    if header:
+        write(columns)
+
+    write(first if row_type else first.values())
+    count = 1
+    for row in rows:
+        if type(row) is row_type:
+            write(row)
+        else:
+            values = row._asdict() if is_row(row) else row
+            write([values.get(column, '') for column in columns])
+        count += 1
+        if count % FLUSH_EVERY == 0:
+            stream.flush()
+
+    stream.flush()
+    return count
+
+
+def format_tsv(data, header=True):
+    """Format rows as tab-separated values"""
+    return format_delimited(data, delimiter='\t', header=header)
+
+
+def format_csv(data, header=True):
+    """Format rows as comma-separated values"""
+    return format_delimited(data, delimiter=',', header=header)
+
+
+@profiler.timed('output')
+def format_ids(data):
+    """Write the ``id`` of each row on its own line, for piping into other commands"""
+    stream = sys.stdout
+    count = 0
+    for row in data:
+        stream.write(f"{row.id if is_row(row) else row['id']}\n")
+        count += 1
+        if count % FLUSH_EVERY == 0:
+            stream.flush()
+
+    stream.flush()
+    return count
@@ -1,12 +1,17 @@
 """Table formatter using Rich"""
 
-from rich.console import Console
-from rich.table import Table
+from ga_cli.profiling import profiler
+from ga_cli.projection import is_row
 
 
+@profiler.timed('output')
 def format_table(data, title=None):
-    """Format list of dicts as a Rich table"""
-    console = Console()
+    """Format a list of dicts or rows as a Rich table"""
+    # Rich is only needed for interactive rendering, so import it on demand
+    from rich.table import Table
+    from ga_cli.output import get_console
+
+    console = get_console()
 
     if not data:
         console.print("[yellow]No results found[/yellow]")
@@ -14,10 +19,12 @@ def format_table(data, title=None):
 
     table = Table(show_header=True, header_style="bold magenta", title=title)
 
-    for key in data[0].keys():
+    columns = data[0]._fields if is_row(data[0]) else data[0].keys()
+    for key in columns:
         table.add_column(key.replace('_', ' ').title())
 
     for item in data:
-        table.add_row(*[str(v) for v in item.values()])
+        values = item if is_row(item) else item.values()
+        table.add_row(*[str(v) for v in values])
 
     console.print(table)
@@ -0,0 +1,31 @@
+"""Tree formatter using Rich"""
+
+from ga_cli.profiling import profiler
+
+
+@profiler.timed('output')
+def format_tree(data, title=None):
+    """Format account summaries as a Rich tree
+
+    Args:
+        data: List of dicts with 'id', 'name' and a 'properties' list of
+            dicts with 'id', 'name' and 'type'
+        title: Label for the root of the tree
+    """
+    # Rich is only needed for interactive rendering, so import it on demand
+    from rich.tree import Tree
+    from ga_cli.output import get_console
+
+    console = get_console()
+
+    if not data:
+        console.print("[yellow]No results found[/yellow]")
+        return
+
+    root = Tree(f"[bold magenta]{title or 'Accounts'}[/bold magenta]")
+    for account in data:
+        node = root.add(f"[bold]{account['name']}[/bold] ({account['id']})")
+        for prop in account['properties']:
+            node.add(f"{prop['name']} ({prop['id']}) [dim]{prop['type']}[/dim]")
+
+    console.print(root)
@@ -1,44 +1,214 @@
-"""Logging configuration for ga-cli"""
+"""Logging configuration for ga-cli
 
+Importing this module only creates the ``ga_cli`` logger; ``setup_logging``
+attaches the handlers when the CLI starts. Records for the log file go
+through a queue to a listener thread, so command and RPC threads never
+wait on disk. The file rotates by size under a lock shared by every ga-cli
+process. Warnings and errors are also printed to stderr, synchronously, so
+they stay in order with the command's own output.
+"""
+
+import atexit
+import datetime
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import sys
 from pathlib import Path
+from types import ModuleType
+from typing import Optional
 
+fcntl: Optional[ModuleType]
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
 
-def setup_logging():
-    """Configure logging for ga-cli"""
-    log_dir = Path.home() / '.ga-cli'
-    log_dir.mkdir(exist_ok=True)
 
-    log_file = log_dir / 'ga-cli.log'
+LOG_LEVELS = ['debug', 'info', 'warning', 'error', 'critical']
+LOG_FORMATS = ['text', 'json']
 
-    # Create logger
-    logger = logging.getLogger('ga_cli')
-    logger.setLevel(logging.INFO)
+DEFAULT_LEVEL = 'info'
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
 
-    # Prevent duplicate handlers
-    if logger.handlers:
-        return logger
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
-    # File handler
-    fh = logging.FileHandler(log_file)
-    fh.setLevel(logging.DEBUG)
+logger = logging.getLogger('ga_cli')
+logger.setLevel(logging.INFO)
 
-    # Console handler (only WARNING and above)
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.WARNING)
+_configured = False
+_listener = None
 
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    fh.setFormatter(formatter)
-    ch.setFormatter(formatter)
 
-    logger.addHandler(fh)
-    logger.addHandler(ch)
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, for log shippers and jq"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.datetime.fromtimestamp(
+                record.created, tz=datetime.timezone.utc
+            ).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'pid': record.process,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+class SharedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Size-based rotation that several processes can share
+
+    Each record is written under an exclusive lock on ``<file>.lock``. A
+    process that finds the file was rotated by another one reopens it
+    before writing, so no process keeps appending to a renamed backup.
+    Without ``fcntl`` this is a plain RotatingFileHandler.
+    """
+
+    def __init__(self, filename, max_bytes=DEFAULT_MAX_BYTES, backup_count=DEFAULT_BACKUP_COUNT):
+        super().__init__(
+            filename, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True
+        )
+        self._lock_fd = None
+
+    def emit(self, record):
+        if fcntl is None:
+            return super().emit(record)
+        try:
+            if self._lock_fd is None:
+                self._lock_fd = os.open(self.baseFilename + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            try:
+                self._reopen_if_rotated()
+                super().emit(record)
+            finally:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        except Exception:
+            self.handleError(record)
+
+    def _reopen_if_rotated(self):
+        if self.stream is None:
+            return
+        try:
+            current = os.stat(self.baseFilename).st_ino
+        except FileNotFoundError:
+            current = None
+        if current != os.fstat(self.stream.fileno()).st_ino:
+            self.stream.close()
+            self.stream = None
+
+    def close(self):
+        super().close()
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queues records untouched; the listener thread does all formatting
+
+    The queue never leaves the process, so records need not be made
+    picklable first.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class _StderrHandler(logging.StreamHandler):
+    """Console handler writing to whatever sys.stderr is at the time
+
+    The daemon and the test runner swap sys.stderr per command; resolving
+    it per record keeps warnings with the output of the command that
+    logged them.
+    """
 
+    def __init__(self):
+        super().__init__(sys.stderr)
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def setup_logging(level=None):
+    """Set the log level and attach the handlers on first use
+
+    Args:
+        level: Value of --log-level (config: [logging] level, default info)
+
+    Other keys read from [logging]: format (text or json), max_bytes and
+    backup_count.
+
+    Returns:
+        The ga_cli logger
+    """
+    from ga_cli.config import ConfigManager
+
+    config_manager = ConfigManager()
+    if level is None:
+        level = config_manager.get('logging', 'level', fallback=DEFAULT_LEVEL)
+    if str(level).lower() not in LOG_LEVELS:
+        logger.warning(f"Ignoring unknown log level: {level}")
+        level = DEFAULT_LEVEL
+    logger.setLevel(str(level).upper())
+
+    global _configured
+    if not _configured:
+        _configured = True
+        _attach_handlers(config_manager)
     return logger
 
 
-# Get logger singleton
-logger = setup_logging()
+def _attach_handlers(config_manager):
+    console = _StderrHandler()
+    console.setLevel(logging.WARNING)
+    console.setFormatter(logging.Formatter(TEXT_FORMAT))
+    logger.addHandler(console)
+
+    log_format = config_manager.get('logging', 'format', fallback='text')
+    try:
+        max_bytes = int(config_manager.get('logging', 'max_bytes', fallback=DEFAULT_MAX_BYTES))
+        backup_count = int(
+            config_manager.get('logging', 'backup_count', fallback=DEFAULT_BACKUP_COUNT)
+        )
+    except ValueError as e:
+        logger.warning(f"Ignoring invalid logging settings: {e}")
+        max_bytes, backup_count = DEFAULT_MAX_BYTES, DEFAULT_BACKUP_COUNT
+
+    log_dir = Path.home() / '.ga-cli'
+    try:
+        log_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"File logging disabled: {e}")
+        return
+
+    file_handler = SharedRotatingFileHandler(log_dir / 'ga-cli.log', max_bytes, backup_count)
+    file_handler.setFormatter(
+        JsonFormatter() if log_format == 'json' else logging.Formatter(TEXT_FORMAT)
+    )
+
+    global _listener
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(records, file_handler)
+    logger.addHandler(_LocalQueueHandler(records))
+    _listener.start()
+    atexit.register(_stop_listener)
+
+
+def _stop_listener():
+    """Drain the queue, so records logged just before exit reach the file"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
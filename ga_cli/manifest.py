@@ -0,0 +1,78 @@
+"""Manifest files for bulk commands"""
+
+import csv
+import json
+import os
+import click
+
+
+def read_manifest(file):
+    """Read bulk records from a CSV, JSON array or NDJSON manifest
+
+    The format is taken from the file extension, falling back to the first
+    non-blank character for stdin: ``[`` is a JSON array, ``{`` one JSON
+    object per line, anything else CSV with a header row. Column names are
+    lower-cased and values stripped; missing values are empty strings.
+
+    Args:
+        file: Open text file (e.g. from ``click.File``)
+
+    Returns:
+        List of (location, record) pairs, where location is a label such as
+        "line 3" for error messages
+    """
+    text = file.read()
+    name = getattr(file, 'name', '') or ''
+    extension = os.path.splitext(name)[1].lower() if isinstance(name, str) else ''
+    start = text.lstrip()[:1]
+
+    if extension == '.json' or (extension != '.csv' and start == '['):
+        records = _read_json_array(text)
+    elif extension in ('.ndjson', '.jsonl') or (extension != '.csv' and start == '{'):
+        records = _read_ndjson(text)
+    else:
+        records = _read_csv(text)
+
+    return [(location, _normalize(record, location)) for location, record in records]
+
+
+def _read_json_array(text):
+    try:
+        data = json.loads(text)
+    except ValueError as e:
+        raise click.BadParameter(f"Invalid JSON manifest: {e}")
+    if not isinstance(data, list):
+        raise click.BadParameter("JSON manifest must be an array of objects")
+    return [(f"record {index}", record) for index, record in enumerate(data, start=1)]
+
+
+def _read_ndjson(text):
+    records = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            records.append((f"line {line_number}", json.loads(line)))
+        except ValueError as e:
+            raise click.BadParameter(f"line {line_number}: invalid JSON: {e}")
+    return records
+
+
+def _read_csv(text):
+    reader = csv.DictReader(text.splitlines())
+    records = []
+    for record in reader:
+        if not any((value or '').strip() for value in record.values() if isinstance(value, str)):
+            continue
+        records.append((f"line {reader.line_num}", record))
+    return records
+
+
+def _normalize(record, location):
+    if not isinstance(record, dict):
+        raise click.BadParameter(f"{location}: expected an object")
+    return {
+        str(key).strip().lower(): '' if value is None else str(value).strip()
+        for key, value in record.items()
+        if key is not None
+    }
@@ -0,0 +1,233 @@
+"""Prometheus textfile metrics for Admin API usage
+
+With ``[metrics] textfile`` set, each invocation counts its requests by RPC
+and status, records their latency in a histogram, and counts retries and
+response cache hits and misses. When the command ends these are added to
+the running totals in ``~/.ga-cli/metrics.json`` (``[metrics] state``),
+under the same file lock other ga-cli processes use, and the totals are
+rendered to the textfile for node-exporter's textfile collector. The
+textfile is replaced atomically, so the collector never reads a partial
+file, and counters keep increasing across cron runs as Prometheus expects.
+
+Like the rate limiter, metrics are off until configured, and recording
+then costs one attribute check.
+"""
+
+import contextlib
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from ga_cli.logging_config import logger
+from ga_cli.statefile import LockedJsonFile
+
+
+# Upper bounds of the request latency histogram, in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+FAMILIES = {
+    'ga_cli_rpc_requests_total': (
+        'counter', 'Admin API requests sent, by RPC and status (retried attempts included)'),
+    'ga_cli_rpc_duration_seconds': (
+        'histogram', 'Latency of Admin API requests, by RPC'),
+    'ga_cli_rpc_retries_total': (
+        'counter', 'Admin API requests retried after a transient or quota error, by RPC'),
+    'ga_cli_cache_requests_total': (
+        'counter', 'Response cache lookups, by RPC and result (hit or miss)'),
+    'ga_cli_last_run_timestamp_seconds': (
+        'gauge', 'When a ga-cli command last finished'),
+}
+
+_LE = re.compile(r'le="([^"]*)"')
+
+_NO_TIMER = contextlib.nullcontext()
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def sample_key(name, **labels):
+    """Render a sample name with its labels, e.g. ``x_total{rpc="get_account"}``"""
+    if not labels:
+        return name
+    rendered = ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return f"{name}{{{rendered}}}"
+
+
+def _bucket_label(bound):
+    return '+Inf' if bound == float('inf') else f"{bound:g}"
+
+
+class _RpcTimer:
+    """Records one request's status and latency"""
+
+    __slots__ = ('_metrics', '_rpc', '_started')
+
+    def __init__(self, metrics, rpc):
+        self._metrics = metrics
+        self._rpc = rpc
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        status = 'OK' if exc_type is None else exc_type.__name__
+        self._metrics.record_rpc(self._rpc, status, time.perf_counter() - self._started)
+        return False
+
+
+class Metrics:
+    """Process-wide metric samples, configured from the [metrics] section
+
+    Attributes:
+        enabled: Whether samples are being recorded
+        textfile: The .prom file written for node-exporter
+        state_path: JSON file holding the totals across invocations
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.textfile: Optional[Path] = None
+        self.state_path: Optional[Path] = None
+        self._lock = threading.Lock()
+        self._samples = {}
+
+    def configure(self):
+        """Load settings from the [metrics] section of the config file
+
+        Recognized keys: textfile (enables metrics) and state.
+        """
+        from ga_cli.config import ConfigManager
+
+        config_manager = ConfigManager()
+        textfile = config_manager.get('metrics', 'textfile', fallback=None)
+        self.enabled = bool(textfile)
+        if not self.enabled:
+            return
+        self.textfile = Path(textfile).expanduser()
+        state = config_manager.get('metrics', 'state', fallback=None)
+        self.state_path = (
+            Path(state).expanduser() if state else Path.home() / '.ga-cli' / 'metrics.json'
+        )
+
+    def timer(self, rpc):
+        """Context manager recording a request's status and latency"""
+        if not self.enabled:
+            return _NO_TIMER
+        return _RpcTimer(self, rpc)
+
+    def record_rpc(self, rpc, status, seconds):
+        """Count one request and add its latency to the histogram"""
+        if not self.enabled:
+            return
+        name = 'ga_cli_rpc_duration_seconds'
+        with self._lock:
+            self._add(sample_key('ga_cli_rpc_requests_total', rpc=rpc, status=status), 1)
+            for bound in LATENCY_BUCKETS:
+                if seconds <= bound:
+                    self._add(sample_key(f"{name}_bucket", rpc=rpc, le=_bucket_label(bound)), 1)
+            self._add(sample_key(f"{name}_bucket", rpc=rpc, le='+Inf'), 1)
+            self._add(sample_key(f"{name}_sum", rpc=rpc), seconds)
+            self._add(sample_key(f"{name}_count", rpc=rpc), 1)
+
+    def record_retry(self, rpc):
+        """Count one retry of an RPC"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._add(sample_key('ga_cli_rpc_retries_total', rpc=rpc), 1)
+
+    def record_cache(self, rpc, hit):
+        """Count one response cache lookup"""
+        if not self.enabled:
+            return
+        with self._lock:
+            key = sample_key('ga_cli_cache_requests_total', rpc=rpc, result='hit' if hit else 'miss')
+            self._add(key, 1)
+
+    def _add(self, key, value):
+        self._samples[key] = self._samples.get(key, 0) + value
+
+    def flush(self):
+        """Add this process's samples to the totals and rewrite the textfile
+
+        Samples are cleared afterwards, so long-lived processes can flush
+        after every command. Failures are logged, never raised.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            samples, self._samples = self._samples, {}
+        try:
+            if LockedJsonFile.available():
+                with LockedJsonFile(self.state_path) as state:
+                    totals = state.setdefault('samples', {})
+                    self._merge(totals, samples)
+                    self._write(totals)
+            else:
+                self._write(self._merge({}, samples))
+        except OSError as e:
+            logger.warning(f"Could not write metrics to {self.textfile}: {e}")
+
+    @staticmethod
+    def _merge(totals, samples):
+        for key, value in samples.items():
+            totals[key] = totals.get(key, 0) + value
+        totals['ga_cli_last_run_timestamp_seconds'] = round(time.time(), 3)
+        return totals
+
+    def _write(self, totals):
+        """Replace the textfile with the rendered totals"""
+        textfile = self.textfile
+        if textfile is None:
+            return
+        textfile.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(
+            dir=textfile.parent, prefix='.' + textfile.name, suffix='.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(render(totals))
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, textfile)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+
+def _family(key):
+    name = key.split('{', 1)[0]
+    for suffix in ('_bucket', '_sum', '_count'):
+        if name.endswith(suffix) and name[:-len(suffix)] in FAMILIES:
+            return name[:-len(suffix)]
+    return name
+
+
+def _sort_key(key):
+    """Order samples by labels, with histogram buckets in increasing order"""
+    match = _LE.search(key)
+    bound = float('inf') if not match or match.group(1) == '+Inf' else float(match.group(1))
+    return _LE.sub('', key), bound
+
+
+def render(totals):
+    """Render samples in the Prometheus text exposition format"""
+    lines = []
+    for family, (kind, help_text) in FAMILIES.items():
+        keys = sorted((key for key in totals if _family(key) == family), key=_sort_key)
+        if not keys:
+            continue
+        lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} {kind}")
+        lines.extend(f"{key} {totals[key]:.10g}" for key in keys)
+    return '\n'.join(lines) + '\n'
+
+
+# Process-wide metrics, configured from the config file by the CLI
+metrics = Metrics()
@@ -2,9 +2,21 @@
 
 import click
 import json
-from rich.console import Console
+import sys
+from ga_cli.formatters.json import format_json, format_ndjson
+from ga_cli.formatters.plain import format_csv, format_ids, format_tsv
+from ga_cli.formatters.table import format_table
 
-console = Console()
+_console = None
+
+
+def get_console():
+    """Return the shared Rich console, importing Rich on first use"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 
 def success_message(message: str, format_type: str = 'text'):
@@ -17,7 +29,7 @@ def success_message(message: str, format_type: str = 'text'):
     if format_type == 'json':
         click.echo(json.dumps({"success": True, "message": message}))
     else:
-        console.print(f"[green]{message}[/green]")
+        get_console().print(f"[green]{message}[/green]")
 
 
 def error_message(message: str, format_type: str = 'text'):
@@ -30,7 +42,7 @@ def error_message(message: str, format_type: str = 'text'):
     if format_type == 'json':
         click.echo(json.dumps({"success": False, "error": message}))
     else:
-        console.print(f"[red]{message}[/red]", err=True)
+        get_console().print(f"[red]{message}[/red]", err=True)
 
 
 def info_message(message: str, format_type: str = 'text'):
@@ -43,7 +55,7 @@ def info_message(message: str, format_type: str = 'text'):
     if format_type == 'json':
         click.echo(json.dumps({"info": message}))
     else:
-        console.print(f"[blue]{message}[/blue]")
+        get_console().print(f"[blue]{message}[/blue]")
 
 
 def warning_message(message: str, format_type: str = 'text'):
@@ -56,4 +68,49 @@ def warning_message(message: str, format_type: str = 'text'):
     if format_type == 'json':
         click.echo(json.dumps({"warning": message}))
     else:
-        console.print(f"[yellow]{message}[/yellow]")
+        get_console().print(f"[yellow]{message}[/yellow]")
+
+
+def resolve_list_format(format_type):
+    """Pick the list output format when none was requested
+
+    Rich tables are only worth their cost for a person at a terminal; when
+    stdout is a pipe or file the streaming TSV renderer is used instead.
+    """
+    if format_type:
+        return format_type
+    return 'table' if sys.stdout.isatty() else 'tsv'
+
+
+def output_rows(rows, format_type=None, title=None, compact=False):
+    """Render list rows in the requested output format
+
+    JSON, NDJSON, TSV, CSV and ID rows are written as they are produced; the
+    table view collects them first.
+
+    Args:
+        rows: Iterable of row dicts
+        format_type: 'table', 'tsv', 'csv', 'json', 'ndjson', 'ids', or None
+            to choose between table and TSV based on whether stdout is a TTY
+        title: Table title
+        compact: Write JSON without indentation
+
+    Returns:
+        Number of rows written
+    """
+    format_type = resolve_list_format(format_type)
+
+    if format_type == 'json':
+        return format_json(rows, compact=compact)
+    if format_type == 'ndjson':
+        return format_ndjson(rows)
+    if format_type == 'tsv':
+        return format_tsv(rows)
+    if format_type == 'csv':
+        return format_csv(rows)
+    if format_type == 'ids':
+        return format_ids(rows)
+
+    rows = list(rows)
+    format_table(rows, title=title)
+    return len(rows)
@@ -0,0 +1,56 @@
+"""Page-by-page iteration over Admin API list calls"""
+
+from types import SimpleNamespace
+from ga_cli.tracing import current_page
+
+
+# Largest page the Admin API accepts; fewer pages means fewer round trips
+PAGE_SIZE = 200
+
+
+def first_page(pager, field):
+    """Return the response a GAPIC pager has already fetched
+
+    Only the first page is taken, so no further RPCs are issued; callers
+    request the following pages themselves via ``next_page_token``. Plain
+    iterables (e.g. test doubles) are treated as a single, final page.
+
+    Args:
+        pager: Pager returned by a ``list_*`` client method
+        field: Name of the repeated field holding the page's items
+    """
+    pages = getattr(pager, 'pages', None)
+    if pages is None:
+        return SimpleNamespace(**{field: list(pager), 'next_page_token': ''})
+    return next(iter(pages))
+
+
+def iter_pages(fetch_page, field):
+    """Yield items page by page, resuming from the last page token
+
+    ``fetch_page(page_token)`` must issue one request and return the
+    response for that page. It is expected to carry its own retry logic, so
+    a transient failure repeats only the page that failed rather than the
+    whole listing.
+
+    Args:
+        fetch_page: Callable taking a page token and returning one response
+        field: Name of the repeated field holding the page's items
+
+    Yields:
+        Items from each page as soon as the page arrives
+    """
+    page_token = ''
+    page = 0
+    while True:
+        page += 1
+        # Only set around the request; the consumer runs between yields
+        token = current_page.set(page)
+        try:
+            response = fetch_page(page_token)
+        finally:
+            current_page.reset(token)
+        yield from getattr(response, field)
+        page_token = response.next_page_token
+        if not page_token:
+            return
@@ -0,0 +1,249 @@
+"""Per-phase timing for --profile
+
+Phases (start-up, command import, config, auth, token refresh, each RPC,
+rate-limit and retry waits, output) are timed with ``profiler.phase``.
+Time is attributed to the innermost phase only, so output that pulls pages
+while it renders is not also counted as RPC time. Phases that run in worker
+threads or on the event loop overlap the main thread and are listed but
+not counted towards its total.
+
+Like the rate limiter, the profiler is off until the CLI configures it, and
+a phase then costs one attribute check.
+
+With --profile-out, the run is also recorded with cProfile (main thread)
+and tracemalloc, and the largest allocation sites are written next to the
+``.prof`` file.
+"""
+
+import contextlib
+import functools
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+import click
+
+
+# Allocation sites listed in the --profile-out report
+TOP_ALLOCATIONS = 25
+
+# Frames kept per allocation by tracemalloc
+TRACEBACK_FRAMES = 1
+
+_NO_PHASE = contextlib.nullcontext()
+
+
+class _Phase:
+    """Times one phase, excluding the phases nested inside it"""
+
+    __slots__ = ('_profiler', '_name', '_detail', '_stack', '_nested', '_started')
+
+    def __init__(self, profiler, name, detail):
+        self._profiler = profiler
+        self._name = name
+        self._detail = detail
+
+    def __enter__(self):
+        self._stack = self._profiler._stack()
+        self._nested = 0.0
+        self._stack.append(self)
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self._started
+        self._stack.pop()
+        if self._stack:
+            self._stack[-1]._nested += elapsed
+        self._profiler.record(
+            self._name, elapsed - self._nested, self._detail,
+            concurrent=threading.current_thread() is not threading.main_thread(),
+        )
+        return False
+
+
+class Profiler:
+    """Wall-time breakdown of one CLI invocation, by phase
+
+    Attributes:
+        enabled: Whether phases are being timed
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._first_run = True
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._reset()
+
+    def _reset(self):
+        self.started = time.perf_counter()
+        self.startup = None
+        self.phases = {}
+        self.details = {}
+        self.concurrent = set()
+        self.output_path: Optional[Path] = None
+        self._cprofile = None
+
+    def configure(self, enabled=False, output_path=None, startup=None):
+        """Start profiling an invocation, or switch profiling off
+
+        Args:
+            enabled: Time phases from now on
+            output_path: Also write a cProfile dump here, plus an
+                allocation report next to it
+            startup: Seconds spent before the CLI group ran; only used for
+                the first command of a process, later ones (shell, daemon)
+                start warm
+        """
+        self._stop_recorders()
+        self.enabled = bool(enabled or output_path)
+        self._reset()
+        first_run, self._first_run = self._first_run, False
+        if not self.enabled:
+            return
+        if first_run:
+            self.startup = startup
+        if output_path:
+            import cProfile
+            import tracemalloc
+
+            self.output_path = Path(output_path)
+            tracemalloc.start(TRACEBACK_FRAMES)
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def phase(self, name, detail=None):
+        """Context manager timing a phase, e.g. ``phase('rpc', 'list_accounts')``"""
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self, name, detail)
+
+    def timed(self, name):
+        """Decorator running a function inside a phase"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.phase(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, name, seconds, detail=None, concurrent=True):
+        """Add time measured elsewhere, e.g. by a coroutine, to a phase
+
+        Args:
+            name: Phase name
+            seconds: Time spent
+            detail: Optional breakdown key, such as the RPC name
+            concurrent: Whether the time overlaps the main thread
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            count, total = self.phases.get(name, (0, 0.0))
+            self.phases[name] = (count + 1, total + seconds)
+            if concurrent:
+                self.concurrent.add(name)
+            if detail is not None:
+                key = (name, detail)
+                count, total, longest = self.details.get(key, (0, 0.0, 0.0))
+                self.details[key] = (count + 1, total + seconds, max(longest, seconds))
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def finish(self):
+        """Print the summary to stderr and write the --profile-out files"""
+        if not self.enabled:
+            return
+        wall = time.perf_counter() - self.started
+        self._stop_recorders(write=True)
+        for line in self.summary(wall):
+            click.echo(line, err=True)
+        self.enabled = False
+
+    def summary(self, wall):
+        """Lines of the timing report
+
+        Args:
+            wall: Seconds from configure() to the end of the command
+        """
+        total = wall + (self.startup or 0.0)
+        lines = [
+            f"Profile: {total:.3f}s wall",
+            f"  {'phase':<28}{'calls':>7}{'seconds':>10}{'share':>8}",
+        ]
+
+        def row(label, count, seconds, share=True):
+            percent = f"{seconds / total * 100:>7.1f}%" if share and total else ''
+            return f"  {label:<28}{count:>7}{seconds:>10.3f}{percent}"
+
+        attributed = 0.0
+        if self.startup is not None:
+            lines.append(row('startup', 1, self.startup))
+            attributed += self.startup
+        for name, (count, seconds) in self.phases.items():
+            overlaps = name in self.concurrent
+            lines.append(row(name + (' *' if overlaps else ''), count, seconds, share=not overlaps))
+            if not overlaps:
+                attributed += seconds
+            for (phase, detail), (calls, spent, longest) in sorted(self.details.items()):
+                if phase == name:
+                    lines.append(row(f"  {detail}", calls, spent, share=False)
+                                 + f"  max {longest:.3f}")
+        lines.append(row('other', '', max(total - attributed, 0.0)))
+        if self.concurrent:
+            lines.append("  * ran in worker threads or coroutines, overlapping the phases above")
+        if self.output_path:
+            lines.append(f"  cProfile: {self.output_path}  allocations: {self.allocations_path}")
+        return lines
+
+    @property
+    def allocations_path(self):
+        """Where the tracemalloc report goes: <output>.alloc.txt (None without --profile-out)"""
+        if self.output_path is None:
+            return None
+        return self.output_path.with_name(self.output_path.name + '.alloc.txt')
+
+    def _stop_recorders(self, write=False):
+        if self._cprofile is None:
+            return
+        import tracemalloc
+
+        self._cprofile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        if write:
+            self._cprofile.dump_stats(self.output_path)
+            self._write_allocations(snapshot, current, peak)
+        self._cprofile = None
+
+    def _write_allocations(self, snapshot, current, peak):
+        import tracemalloc
+
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<unknown>'),
+        ))
+        lines = [
+            f"Traced memory: {current / 1024:.1f} KiB at exit, {peak / 1024:.1f} KiB peak",
+            f"Top {TOP_ALLOCATIONS} allocation sites still held at exit:",
+        ]
+        for index, stat in enumerate(snapshot.statistics('lineno')[:TOP_ALLOCATIONS], 1):
+            frame = stat.traceback[0]
+            lines.append(
+                f"#{index:<3} {frame.filename}:{frame.lineno}: "
+                f"{stat.size / 1024:.1f} KiB in {stat.count} blocks"
+            )
+        self.allocations_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+# Process-wide profiler, configured by the CLI from --profile/--profile-out
+profiler = Profiler()
@@ -0,0 +1,100 @@
+"""Field projections: build only the output columns a command was asked for
+
+Each resource type maps field names to extractor functions (see
+``ga_cli.rows``). ``--fields`` (or ``--format ids``) is compiled once into a
+``Projection`` that calls just the requested extractors, so fields nobody
+asked for are never computed, serialized or rendered.
+
+Projections produce namedtuple rows. Formatters accept them as well as
+plain dicts; ``is_row`` and ``as_dict`` tell the two apart.
+"""
+
+from collections import namedtuple
+from typing import Any
+import click
+
+
+def resource_id(name):
+    """Last segment of a resource name, e.g. '123' for 'accounts/123'"""
+    return name.split('/')[-1] if '/' in name else name
+
+
+def timestamp(value):
+    """Render an API timestamp to the second, or 'N/A' when unset"""
+    return str(value).split('.')[0] if value else 'N/A'
+
+
+def parse_fields(ctx, param, value):
+    """Click callback turning 'id,name' into ('id', 'name')"""
+    if value is None:
+        return None
+    fields = tuple(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+    if not fields:
+        raise click.BadParameter("expected a comma-separated list of field names")
+    return fields
+
+
+def row_type(name, fields) -> Any:
+    """Namedtuple class for fields only known at run time
+
+    Typed as Any: the fields of a --fields selection cannot be checked
+    statically, so rows are treated as plain tuples with ``_asdict``.
+    """
+    return namedtuple(name, fields)
+
+
+def is_row(value):
+    """Whether a value is a namedtuple row rather than a dict"""
+    return isinstance(value, tuple) and hasattr(value, '_fields')
+
+
+def as_dict(row):
+    """Return a row as a dict, e.g. for JSON encoding"""
+    return row._asdict() if is_row(row) else row
+
+
+class Projection:
+    """Row builder compiled for a fixed list of fields
+
+    Args:
+        extractors: Mapping of field name to ``function(resource) -> value``
+        fields: Field names to output, in order
+        name: Name of the generated row type
+
+    Raises:
+        click.BadParameter: If a field is not one of the extractors
+    """
+
+    def __init__(self, extractors, fields, name='Row'):
+        unknown = [field for field in fields if field not in extractors]
+        if unknown:
+            raise click.BadParameter(
+                f"unknown field {', '.join(unknown)} (choose from: {', '.join(extractors)})",
+                param_hint="'--fields'",
+            )
+        self.fields = tuple(fields)
+        self.row_type = row_type(name, self.fields)
+        self._make = self.row_type._make
+        self._getters = tuple(extractors[field] for field in self.fields)
+
+    def __call__(self, resource):
+        return self._make([get(resource) for get in self._getters])
+
+
+def row_builder(extractors, fields, format_type, default):
+    """Pick the function turning API resources into output rows
+
+    Args:
+        extractors: Field extractors of the resource type
+        fields: Value of --fields, or None
+        format_type: Value of --format; 'ids' only needs the ID
+        default: Builder for the command's default columns
+
+    Returns:
+        A callable taking one resource and returning a row
+    """
+    if format_type == 'ids':
+        return Projection(extractors, ('id',))
+    if fields:
+        return Projection(extractors, fields)
+    return default
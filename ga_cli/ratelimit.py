@@ -0,0 +1,162 @@
+"""Client-side rate limiting shared by every process on the host
+
+The Admin API enforces per-project quotas per minute and per day. Bursting
+past them only earns ResourceExhausted errors and back-off, so each RPC
+attempt first takes a token from host-wide token buckets. The bucket state
+lives in a small file under ``~/.ga-cli`` guarded by an exclusive lock, so
+concurrent invocations (cron jobs, parallel shells) share one budget.
+"""
+
+import threading
+import time
+from pathlib import Path
+from ga_cli.logging_config import logger
+from ga_cli.statefile import LockedJsonFile
+
+
+# Buckets and the window over which each refills, in seconds
+WINDOWS = (('minute', 60), ('day', 86400))
+
+# Longest single sleep, so waits re-check the shared state regularly
+MAX_WAIT = 5.0
+
+
+class RateLimiter:
+    """Token buckets for per-minute and per-day request budgets
+
+    Each bucket holds up to its budget and refills continuously over its
+    window. A request proceeds once every configured bucket has a token.
+    Limits are disabled until configured, so ``acquire`` costs nothing by
+    default.
+    """
+
+    def __init__(self, state_path=None):
+        self._state_path = Path(state_path) if state_path else None
+        self._limits = {}
+        self._configured = False
+        self._lock = threading.Lock()
+        self._local_state = {}
+
+    @property
+    def state_path(self):
+        return self._state_path or Path.home() / '.ga-cli' / 'ratelimit.json'
+
+    @property
+    def enabled(self):
+        if not self._configured:
+            self.configure()
+        return bool(self._limits)
+
+    def configure(self, per_minute=None, per_day=None):
+        """Set the budgets, falling back to the config file
+
+        Args:
+            per_minute: Requests per minute (config: [rate_limit] per_minute)
+            per_day: Requests per day (config: [rate_limit] per_day)
+        """
+        from ga_cli.config import ConfigManager
+
+        config_manager = ConfigManager()
+        if per_minute is None:
+            per_minute = config_manager.get('rate_limit', 'per_minute', fallback=None)
+        if per_day is None:
+            per_day = config_manager.get('rate_limit', 'per_day', fallback=None)
+
+        limits = {}
+        for window, value in (('minute', per_minute), ('day', per_day)):
+            try:
+                budget = float(value) if value not in (None, '') else 0
+            except ValueError:
+                logger.warning(f"Ignoring invalid rate_limit per_{window}: {value}")
+                budget = 0
+            if budget > 0:
+                limits[window] = budget
+
+        self._limits = limits
+        self._configured = True
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def aacquire(self):
+        """Wait, without blocking the event loop, until a request may be sent"""
+        import asyncio
+
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def try_acquire(self):
+        """Take a token if every bucket has one
+
+        Returns:
+            0 if a token was taken, otherwise seconds to wait before retrying
+        """
+        if not self.enabled:
+            return 0
+
+        with self._lock:
+            with self._locked_state() as state:
+                wait = self._take(state, time.time())
+
+        if wait > 0:
+            logger.debug("Rate limit reached, waiting %.2fs", wait)
+        return wait
+
+    def _take(self, state, now):
+        buckets = {}
+        wait = 0.0
+        for window, seconds in WINDOWS:
+            budget = self._limits.get(window)
+            if not budget:
+                continue
+            rate = budget / seconds
+            bucket = state.get(window) or {}
+            tokens = float(bucket.get('tokens', budget))
+            updated = float(bucket.get('updated', now))
+            tokens = min(budget, tokens + max(0.0, now - updated) * rate)
+            buckets[window] = tokens
+            if tokens < 1:
+                wait = max(wait, (1 - tokens) / rate)
+
+        if wait <= 0:
+            for window in buckets:
+                buckets[window] -= 1
+
+        for window, tokens in buckets.items():
+            state[window] = {'tokens': tokens, 'updated': now}
+        return min(wait, MAX_WAIT)
+
+    def _locked_state(self):
+        if not LockedJsonFile.available():
+            return _MemoryState(self._local_state)
+        return LockedJsonFile(self.state_path)
+
+    def reset(self):
+        """Forget the configuration and in-process state"""
+        self._limits = {}
+        self._configured = False
+        self._local_state = {}
+
+
+class _MemoryState:
+    """Per-process fallback where file locks are unavailable"""
+
+    def __init__(self, state):
+        self.state = state
+
+    def __enter__(self):
+        return self.state
+
+    def __exit__(self, *exc):
+        return False
+
+
+rate_limiter = RateLimiter()
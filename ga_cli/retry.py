@@ -1,40 +1,326 @@
-"""Retry logic with exponential backoff for API calls"""
+"""Retry logic with jittered exponential backoff for API calls
 
+Every attempt first takes a token from the shared rate limiter, so retries
+count against the client-side budget like any other request.
+
+Delays use "full jitter" (a uniform draw below the exponential bound), so
+parallel workers that fail together do not retry in lockstep. Quota errors
+(ResourceExhausted) back off for longer and honor any retry delay the server
+returns. Each call also has a total time budget: a retry that would end past
+it is not attempted and the last error is raised instead.
+
+Wrapped functions that take a ``timeout`` argument get a per-attempt
+deadline: the configured RPC timeout (or the ``rpc_timeout`` of a
+TimeoutClient passed as the first argument), capped by what is left of the
+budget. Mutations leave ``timeout`` out and keep the library default, and are
+wrapped with ``idempotent=False``: a mutation that timed out or failed with an
+internal error may still have been applied, so they are only retried on
+errors showing the request was refused.
+"""
+
+import asyncio
+import inspect
+import random
 import time
 import functools
-from google.api_core import exceptions
 from ga_cli.logging_config import logger
+from ga_cli.metrics import metrics
+from ga_cli.profiling import profiler
+from ga_cli.stats import rpc_name, rpc_stats
+from ga_cli.ratelimit import rate_limiter
+from ga_cli.tracing import resource_getter, tracer
+from ga_cli.transport import TimeoutClient, transport_settings
+
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 2
+DEFAULT_MAX_DELAY = 30.0  # seconds
+DEFAULT_DEADLINE = 120.0  # seconds, across all attempts of one call
+
+# Quota errors clear on the scale of the per-minute quota window
+DEFAULT_QUOTA_DELAY = 10.0
+DEFAULT_QUOTA_MAX_DELAY = 60.0
+
+
+def transient_errors():
+    """Exception types worth retrying with the regular backoff"""
+    from google.api_core import exceptions
+
+    return (
+        exceptions.ServiceUnavailable,
+        exceptions.DeadlineExceeded,
+        exceptions.InternalServerError,
+    )
+
+
+def quota_errors():
+    """Exception types worth retrying with the longer quota backoff"""
+    from google.api_core import exceptions
+
+    return (exceptions.ResourceExhausted,)
+
+
+def rejected_errors():
+    """Exception types showing a request was refused before it was applied
+
+    Only these are safe to retry for mutations: after a timeout or an
+    internal error the server may already have made the change.
+    """
+    from google.api_core import exceptions
+
+    return (exceptions.ServiceUnavailable,) + quota_errors()
+
+
+def server_retry_delay(error):
+    """Return the retry delay the server attached to an error, if any
 
+    The Admin API reports it as a ``google.rpc.RetryInfo`` detail, which
+    google-api-core exposes on ``error.details``.
+
+    Returns:
+        Delay in seconds, or None
+    """
+    for detail in getattr(error, 'details', None) or ():
+        retry_delay = getattr(detail, 'retry_delay', None)
+        if retry_delay is None:
+            continue
+        seconds = getattr(retry_delay, 'seconds', 0) + getattr(retry_delay, 'nanos', 0) / 1e9
+        if seconds > 0:
+            return seconds
+    return None
 
-def retry_on_transient_error(max_retries=3, backoff_factor=2):
-    """Decorator for retrying on transient errors
+
+class RetryPolicy:
+    """How often, how long and for which errors an RPC is retried
 
     Args:
-        max_retries: Maximum number of retry attempts
-        backoff_factor: Multiplier for exponential backoff delay
+        max_retries: Maximum number of attempts, the first one included
+        backoff_factor: Base of the exponential backoff, in seconds
+        max_delay: Upper bound of a single regular backoff
+        deadline: Total seconds one call may spend, waits included
+            (0 disables the budget)
+        quota_delay: Initial backoff after a quota error
+        quota_max_delay: Upper bound of a single quota backoff
+    """
+
+    def __init__(self, max_retries=DEFAULT_MAX_RETRIES, backoff_factor=DEFAULT_BACKOFF_FACTOR,
+                 max_delay=DEFAULT_MAX_DELAY, deadline=DEFAULT_DEADLINE,
+                 quota_delay=DEFAULT_QUOTA_DELAY, quota_max_delay=DEFAULT_QUOTA_MAX_DELAY):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.quota_delay = quota_delay
+        self.quota_max_delay = quota_max_delay
+
+    def configure(self):
+        """Load settings from the [retry] section of the config file
+
+        Recognized keys: max_retries, max_delay, deadline, quota_delay and
+        quota_max_delay. Missing or invalid values keep their defaults.
+        """
+        from ga_cli.config import ConfigManager
+
+        config_manager = ConfigManager()
+        for key, cast in (
+            ('max_retries', int),
+            ('max_delay', float),
+            ('deadline', float),
+            ('quota_delay', float),
+            ('quota_max_delay', float),
+        ):
+            value = config_manager.get('retry', key, fallback=None)
+            if value in (None, ''):
+                continue
+            try:
+                setattr(self, key, max(cast(value), 0))
+            except ValueError:
+                logger.warning(f"Ignoring invalid retry {key}: {value}")
+
+    def with_overrides(self, max_retries=None, backoff_factor=None):
+        """Return this policy, or a copy with the given settings replaced"""
+        if max_retries is None and backoff_factor is None:
+            return self
+        policy = RetryPolicy(**vars(self))
+        if max_retries is not None:
+            policy.max_retries = max_retries
+        if backoff_factor is not None:
+            policy.backoff_factor = backoff_factor
+        return policy
+
+    def retryable_errors(self, idempotent=True):
+        """Exception types this policy retries
+
+        Args:
+            idempotent: False for calls that must not be sent twice
+        """
+        if idempotent:
+            return transient_errors() + quota_errors()
+        return rejected_errors()
+
+    def delay(self, attempt, error):
+        """Seconds to wait before the attempt following failure number ``attempt``"""
+        if isinstance(error, quota_errors()):
+            hint = server_retry_delay(error)
+            if hint is not None:
+                # Never earlier than asked; the jitter spreads out the workers
+                return hint + random.uniform(0, min(hint, self.quota_max_delay) / 2)
+            growth = max(self.backoff_factor, 1) ** (attempt - 1)
+            bound = min(self.quota_max_delay, self.quota_delay * growth)
+            # Keep at least half the bound so quota errors always wait a while
+            return bound / 2 + random.uniform(0, bound / 2)
+
+        bound = min(self.max_delay, self.backoff_factor ** attempt)
+        return random.uniform(0, bound)
+
+    def attempt_timeout(self, started, timeout=None):
+        """Deadline in seconds for the next attempt, or None for no deadline
+
+        Args:
+            started: ``time.monotonic()`` when the first attempt began
+            timeout: RPC timeout to apply instead of the configured one
+        """
+        if timeout is None:
+            timeout = transport_settings.timeout
+        timeout = timeout or None
+        if self.deadline:
+            remaining = max(self.deadline - (time.monotonic() - started), 0.001)
+            timeout = min(timeout, remaining) if timeout else remaining
+        return timeout
+
+    def backoff(self, rpc, attempt, started, error):
+        """Decide whether to retry after a failed attempt
+
+        Args:
+            rpc: RPC name, for counters and log messages
+            attempt: Number of attempts made so far
+            started: ``time.monotonic()`` when the first attempt began
+            error: The exception raised by the last attempt
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if attempt >= self.max_retries:
+            logger.error(f"Max retries ({self.max_retries}) exceeded for {rpc}")
+            return None
+
+        wait_time = self.delay(attempt, error)
+        elapsed = time.monotonic() - started
+        if self.deadline and elapsed + wait_time > self.deadline:
+            logger.error(
+                f"Retry budget ({self.deadline:g}s) exhausted for {rpc} "
+                f"after {attempt} attempts and {elapsed:.1f}s"
+            )
+            return None
+
+        rpc_stats.record_retry(rpc)
+        metrics.record_retry(rpc)
+        logger.warning(
+            f"{type(error).__name__} in {rpc}, retrying in {wait_time:.2f}s "
+            f"(attempt {attempt}/{self.max_retries}): {str(error)}"
+        )
+        return wait_time
+
+
+# Process-wide policy, configured from the config file by the CLI
+retry_policy = RetryPolicy()
+
+
+def _client_timeout(args):
+    """The timeout carried by a TimeoutClient passed as the first argument"""
+    if args and isinstance(args[0], TimeoutClient):
+        return args[0].rpc_timeout
+    return None
+
+
+def retry_on_transient_error(max_retries=None, backoff_factor=None, policy=None,
+                             idempotent=True):
+    """Decorator for retrying on transient and quota errors
+
+    Args:
+        max_retries: Maximum number of attempts (default: from the policy)
+        backoff_factor: Base of the exponential backoff (default: from the policy)
+        policy: RetryPolicy to apply instead of the process-wide one
+        idempotent: False for mutations, which only retry rejected_errors()
     """
     def decorator(func):
+        rpc = rpc_name(func)
+        takes_timeout = 'timeout' in inspect.signature(func).parameters
+        resource_of = resource_getter(func)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            retries = 0
-            while retries < max_retries:
+            active = (policy or retry_policy).with_overrides(max_retries, backoff_factor)
+            started = time.monotonic()
+            sets_timeout = takes_timeout and kwargs.get('timeout') is None
+            rpc_timeout = _client_timeout(args)
+            resource = resource_of(args, kwargs) if tracer.enabled else None
+            attempt = 0
+            while True:
+                with profiler.phase('rate limit wait'):
+                    rate_limiter.acquire()
+                rpc_stats.record_call(rpc)
+                attempt += 1
+                if sets_timeout:
+                    kwargs['timeout'] = active.attempt_timeout(started, rpc_timeout)
                 try:
-                    return func(*args, **kwargs)
-                except (exceptions.ServiceUnavailable,
-                        exceptions.DeadlineExceeded,
-                        exceptions.InternalServerError) as e:
-                    retries += 1
-                    if retries >= max_retries:
-                        logger.error(f"Max retries ({max_retries}) exceeded for {func.__name__}")
+                    with profiler.phase('rpc', rpc), metrics.timer(rpc), \
+                            tracer.span('rpc', rpc, resource, attempt):
+                        return func(*args, **kwargs)
+                except active.retryable_errors(idempotent) as e:
+                    wait_time = active.backoff(rpc, attempt, started, e)
+                    if wait_time is None:
                         raise
+                    with profiler.phase('retry wait'):
+                        time.sleep(wait_time)
+        return wrapper
+    return decorator
+
+
+def async_retry_on_transient_error(max_retries=None, backoff_factor=None, policy=None,
+                                   idempotent=True):
+    """Decorator for retrying coroutines on transient and quota errors
 
-                    wait_time = backoff_factor ** retries
-                    logger.warning(
-                        f"Transient error in {func.__name__}, "
-                        f"retrying in {wait_time}s (attempt {retries}/{max_retries}): {str(e)}"
-                    )
-                    time.sleep(wait_time)
+    Same semantics as retry_on_transient_error, but waits with
+    asyncio.sleep so other in-flight requests keep running.
 
-            return func(*args, **kwargs)
+    Args:
+        max_retries: Maximum number of attempts (default: from the policy)
+        backoff_factor: Base of the exponential backoff (default: from the policy)
+        policy: RetryPolicy to apply instead of the process-wide one
+        idempotent: False for mutations, which only retry rejected_errors()
+    """
+    def decorator(func):
+        rpc = rpc_name(func)
+        takes_timeout = 'timeout' in inspect.signature(func).parameters
+        resource_of = resource_getter(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            active = (policy or retry_policy).with_overrides(max_retries, backoff_factor)
+            started = time.monotonic()
+            sets_timeout = takes_timeout and kwargs.get('timeout') is None
+            rpc_timeout = _client_timeout(args)
+            resource = resource_of(args, kwargs) if tracer.enabled else None
+            attempt = 0
+            while True:
+                await rate_limiter.aacquire()
+                rpc_stats.record_call(rpc)
+                attempt += 1
+                if sets_timeout:
+                    kwargs['timeout'] = active.attempt_timeout(started, rpc_timeout)
+                sent = time.perf_counter()
+                try:
+                    try:
+                        with metrics.timer(rpc), tracer.span('rpc', rpc, resource, attempt):
+                            return await func(*args, **kwargs)
+                    finally:
+                        # Coroutines interleave, so they bypass the phase stack
+                        profiler.record('rpc', time.perf_counter() - sent, rpc)
+                except active.retryable_errors(idempotent) as e:
+                    wait_time = active.backoff(rpc, attempt, started, e)
+                    if wait_time is None:
+                        raise
+                    await asyncio.sleep(wait_time)
         return wrapper
     return decorator
@@ -0,0 +1,113 @@
+"""Row types and converters from Admin API resources to output rows
+
+Each resource type has one table of field extractors; every row a command
+prints (its default list and get columns, and any ``--fields`` selection)
+is a ``Projection`` over that table. Rows are namedtuples, so large
+listings hold no per-row dict and the formatters read values in order.
+"""
+
+from collections import namedtuple
+from ga_cli.projection import Projection, resource_id, timestamp
+
+
+ACCOUNT_FIELDS = {
+    'id': lambda account: resource_id(account.name),
+    'name': lambda account: account.display_name or 'N/A',
+    'region': lambda account: account.region_code or 'N/A',
+    'create_time': lambda account: timestamp(account.create_time),
+    'update_time': lambda account: timestamp(account.update_time),
+}
+
+PROPERTY_FIELDS = {
+    'account': lambda property: resource_id(property.parent) if property.parent else 'N/A',
+    'id': lambda property: resource_id(property.name),
+    'name': lambda property: property.display_name or 'N/A',
+    'type': lambda property: property.property_type.name if property.property_type else 'N/A',
+    'timezone': lambda property: property.time_zone or 'N/A',
+    'currency': lambda property: property.currency_code or 'N/A',
+    'industry': lambda property: (
+        property.industry_category.name if property.industry_category else 'N/A'
+    ),
+    'create_time': lambda property: timestamp(property.create_time),
+}
+
+
+def _web_field(attribute):
+    """Extractor for a web stream attribute"""
+    return lambda stream: (
+        getattr(stream.web_stream_data, attribute) or 'N/A' if stream.web_stream_data else 'N/A'
+    )
+
+
+# App-specific fields are 'N/A' for other stream types
+DATASTREAM_FIELDS = {
+    'id': lambda stream: resource_id(stream.name),
+    'name': lambda stream: stream.display_name or 'N/A',
+    'type': lambda stream: stream.type_.name if stream.type_ else 'N/A',
+    'measurement_id': _web_field('measurement_id'),
+    'url': _web_field('default_uri'),
+    'firebase_app_id': _web_field('firebase_app_id'),
+    'package_name': lambda stream: (
+        stream.android_app_stream_data.package_name or 'N/A'
+        if stream.android_app_stream_data else 'N/A'
+    ),
+    'bundle_id': lambda stream: (
+        stream.ios_app_stream_data.bundle_id or 'N/A' if stream.ios_app_stream_data else 'N/A'
+    ),
+    'create_time': lambda stream: timestamp(stream.create_time),
+}
+
+
+account_row = Projection(
+    ACCOUNT_FIELDS, ('id', 'name', 'region', 'create_time'), 'AccountRow'
+)
+account_details = Projection(ACCOUNT_FIELDS, tuple(ACCOUNT_FIELDS), 'AccountDetails')
+
+# Rows of multi-account listings lead with the account that was listed
+AccountPropertyRow = namedtuple(
+    'AccountPropertyRow', ['account', 'id', 'name', 'type', 'timezone', 'currency']
+)
+
+property_row = Projection(PROPERTY_FIELDS, AccountPropertyRow._fields[1:], 'PropertyRow')
+property_details = Projection(
+    PROPERTY_FIELDS,
+    ('id', 'name', 'type', 'timezone', 'currency', 'industry', 'create_time'),
+    'PropertyDetails',
+)
+
+_STREAM_COLUMNS = ('id', 'name', 'type')
+_web_stream_row = Projection(
+    DATASTREAM_FIELDS, _STREAM_COLUMNS + ('measurement_id', 'url'), 'WebStreamRow'
+)
+_android_stream_row = Projection(
+    DATASTREAM_FIELDS, _STREAM_COLUMNS + ('package_name',), 'AndroidStreamRow'
+)
+_ios_stream_row = Projection(DATASTREAM_FIELDS, _STREAM_COLUMNS + ('bundle_id',), 'IosStreamRow')
+_stream_row = Projection(DATASTREAM_FIELDS, _STREAM_COLUMNS, 'StreamRow')
+
+_stream_details = Projection(
+    DATASTREAM_FIELDS, _STREAM_COLUMNS + ('create_time',), 'StreamDetails'
+)
+_web_stream_details = Projection(
+    DATASTREAM_FIELDS,
+    _stream_details.fields + ('measurement_id', 'url', 'firebase_app_id'),
+    'WebStreamDetails',
+)
+
+
+def datastream_row(stream):
+    """List row for a data stream, with the columns of its stream type"""
+    if stream.web_stream_data:
+        return _web_stream_row(stream)
+    if stream.android_app_stream_data:
+        return _android_stream_row(stream)
+    if stream.ios_app_stream_data:
+        return _ios_stream_row(stream)
+    return _stream_row(stream)
+
+
+def datastream_details(stream):
+    """Record shown by datastreams get; web streams add their tag settings"""
+    if stream.web_stream_data:
+        return _web_stream_details(stream)
+    return _stream_details(stream)
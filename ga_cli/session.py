@@ -0,0 +1,153 @@
+"""Run many CLI command lines in one process against warm clients"""
+
+import io
+import sys
+import threading
+import click
+from ga_cli.cache import response_cache
+from ga_cli.concurrency import map_bounded
+from ga_cli.logging_config import logger
+
+
+class Session:
+    """Executes ga-cli command lines in-process, sharing state between them
+
+    Every command goes through the regular Click groups, but the
+    ``AuthManager`` for a credentials file is created once and reused (see
+    ``with_client``), and the response cache keeps decoded entries in memory.
+    Used by the daemon, ``ga-cli shell`` and ``ga-cli run``.
+
+    Usage:
+        session = Session()
+        session.warm(credentials_path)
+        exit_code = session.run(['properties', 'list', '123456'])
+    """
+
+    def __init__(self):
+        self.auth_sessions = {}
+        self.commands_run = 0
+        self._lock = threading.Lock()
+        response_cache.enable_memory()
+
+    def warm(self, credentials_path=None):
+        """Import the Admin API stack and create a client ahead of the first command
+
+        Args:
+            credentials_path: Credentials to warm; defaults to the configured ones
+
+        Returns:
+            The credentials path that was warmed, or None if none is configured
+        """
+        from ga_cli.auth import AuthManager
+        from ga_cli.config import ConfigManager
+
+        credentials_path = credentials_path or ConfigManager().get_credentials_path()
+        if credentials_path and credentials_path not in self.auth_sessions:
+            auth = AuthManager(credentials_path)
+            auth.get_client()
+            self.auth_sessions[credentials_path] = auth
+            logger.info(f"Warmed client for {credentials_path}")
+        return credentials_path
+
+    def run(self, args, configured=False):
+        """Run one command line, reporting errors the way the CLI would
+
+        Args:
+            args: Arguments after the program name, e.g. ['accounts', 'list']
+            configured: True to keep the process-wide settings (cache, retry,
+                transport, logging, tracing, metrics) as they are instead of
+                applying the command's global options
+
+        Returns:
+            The command's exit code
+        """
+        from ga_cli.cli import cli
+
+        with self._lock:
+            self.commands_run += 1
+        obj = {'auth_sessions': self.auth_sessions, 'configured': configured}
+        try:
+            result = cli.main(args=list(args), prog_name='ga-cli', standalone_mode=False, obj=obj)
+        except click.exceptions.Exit as e:
+            return e.exit_code
+        except click.ClickException as e:
+            e.show()
+            return e.exit_code
+        except click.Abort:
+            click.echo('Aborted!', err=True)
+            return 1
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        return result if isinstance(result, int) else 0
+
+    def run_parallel(self, commands, workers):
+        """Run independent command lines concurrently
+
+        Each command's stdout and stderr are captured and handed back in
+        input order, so output never interleaves. Commands share the warm
+        clients; call ``warm`` first so they do not race to create them.
+        They also share the process-wide settings already in effect, which
+        are not reconfigured per command: their global options must match
+        those the settings were applied with.
+
+        Args:
+            commands: Iterable of argument lists
+            workers: Number of commands run at once
+
+        Yields:
+            (args, exit_code, stdout, stderr) tuples in input order
+        """
+        real_stdout, real_stderr = sys.stdout, sys.stderr
+        stdout, stderr = _ThreadLocalStream(real_stdout), _ThreadLocalStream(real_stderr)
+
+        def run_captured(args):
+            out, err = _Capture(real_stdout.isatty()), _Capture(real_stderr.isatty())
+            stdout.attach(out)
+            stderr.attach(err)
+            try:
+                exit_code = self.run(args, configured=True)
+            finally:
+                stdout.detach()
+                stderr.detach()
+            return exit_code, out.getvalue(), err.getvalue()
+
+        sys.stdout, sys.stderr = stdout, stderr
+        try:
+            for args, result, error in map_bounded(run_captured, commands, max_workers=workers):
+                if error is not None:
+                    raise error
+                yield (args,) + result
+        finally:
+            sys.stdout, sys.stderr = real_stdout, real_stderr
+
+
+class _Capture(io.StringIO):
+    """In-memory stream that reports the terminal state of the stream it replaces"""
+
+    def __init__(self, tty):
+        super().__init__()
+        self._tty = tty
+
+    def isatty(self):
+        return self._tty
+
+
+class _ThreadLocalStream:
+    """Stand-in for sys.stdout/sys.stderr routing writes per thread
+
+    Threads that attached a stream write to it; all others write to the
+    stream that was replaced.
+    """
+
+    def __init__(self, default):
+        self._default = default
+        self._local = threading.local()
+
+    def attach(self, stream):
+        self._local.stream = stream
+
+    def detach(self):
+        self._local.stream = None
+
+    def __getattr__(self, name):
+        return getattr(getattr(self._local, 'stream', None) or self._default, name)
@@ -0,0 +1,62 @@
+"""Small JSON state files shared by concurrent ga-cli processes"""
+
+import json
+import os
+from types import ModuleType
+from typing import Any, Dict, Optional
+
+fcntl: Optional[ModuleType]
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class LockedJsonFile:
+    """JSON document read and written under an exclusive file lock
+
+    The file is created with mode 0600 (its directory 0700) and the lock is
+    held from ``__enter__`` until the updated document is written back on
+    ``__exit__``, so read-modify-write cycles from several processes never
+    interleave. Requires ``fcntl``; check ``available()`` first.
+
+    Usage:
+        with LockedJsonFile(path) as state:
+            state['key'] = 'value'
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # Opened by __enter__ and closed by __exit__
+        self._fd: int
+        self.state: Dict[str, Any] = {}
+
+    @staticmethod
+    def available():
+        """True where file locks are supported"""
+        return fcntl is not None
+
+    def __enter__(self):
+        if fcntl is None:
+            raise OSError("File locks are not supported on this platform")
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            with os.fdopen(os.dup(self._fd), 'r') as f:
+                self.state = json.loads(f.read() or '{}')
+        except ValueError:
+            self.state = {}
+        return self.state
+
+    def __exit__(self, *exc):
+        try:
+            data = json.dumps(self.state).encode('utf-8')
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            os.ftruncate(self._fd, 0)
+            os.write(self._fd, data)
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+        return False
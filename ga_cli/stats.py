@@ -0,0 +1,68 @@
+"""Process-wide counters of Admin API calls"""
+
+import threading
+from collections import Counter
+
+
+def rpc_name(func):
+    """Derive the RPC name from a wrapper such as _list_accounts_page"""
+    name = func.__name__.lstrip('_')
+    if name.startswith('alist_') or name.startswith('aget_'):
+        name = name[1:]
+    for suffix in ('_with_retry', '_page'):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    return name
+
+
+class RpcStats:
+    """Thread-safe counters of Admin API calls, keyed by RPC name
+
+    Every attempt counts as a call, including retried ones. Retries are
+    also counted separately, so quota or availability trouble shows up.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls: Counter[str] = Counter()
+        self.retries: Counter[str] = Counter()
+
+    def record_call(self, rpc):
+        """Count one request sent for an RPC"""
+        with self._lock:
+            self.calls[rpc] += 1
+
+    def record_retry(self, rpc):
+        """Count one retry scheduled for an RPC"""
+        with self._lock:
+            self.retries[rpc] += 1
+
+    def total_calls(self):
+        """Total requests sent across all RPCs"""
+        with self._lock:
+            return sum(self.calls.values())
+
+    def total_retries(self):
+        """Total retries across all RPCs"""
+        with self._lock:
+            return sum(self.retries.values())
+
+    def snapshot(self):
+        """Return a copy of the per-RPC call counts"""
+        with self._lock:
+            return dict(self.calls)
+
+    def retry_snapshot(self):
+        """Return a copy of the per-RPC retry counts"""
+        with self._lock:
+            return dict(self.retries)
+
+    def reset(self):
+        """Clear all counters"""
+        with self._lock:
+            self.calls.clear()
+            self.retries.clear()
+
+
+# Process-wide statistics shared by all commands and worker threads
+rpc_stats = RpcStats()
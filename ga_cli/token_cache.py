@@ -0,0 +1,163 @@
+"""Access tokens shared between short-lived ga-cli invocations
+
+Each process otherwise loads the service-account key and mints a fresh
+token before its first RPC. With ``[auth] token_cache = true`` the token is
+kept in ``~/.ga-cli/tokens.json`` (mode 0600), keyed by credentials file and
+scopes, and reused until shortly before it expires. Refreshes happen under
+an exclusive file lock, so parallel processes wait for one refresh instead
+of each fetching their own token.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from google.auth import credentials as auth_credentials
+from ga_cli.logging_config import logger
+from ga_cli.profiling import profiler
+from ga_cli.statefile import LockedJsonFile
+
+
+# Tokens this close to expiry are refreshed rather than reused
+REFRESH_MARGIN = 300  # seconds
+
+
+def token_cache_enabled():
+    """Whether the token cache is switched on (config: [auth] token_cache)"""
+    from ga_cli.config import ConfigManager
+
+    value = ConfigManager().get('auth', 'token_cache', fallback='false')
+    return str(value).lower() in ('true', '1', 'yes', 'on')
+
+
+def cache_key(credentials_path, scopes):
+    """Key an entry by credentials file and requested scopes"""
+    raw = json.dumps([os.path.abspath(credentials_path), sorted(scopes)])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class TokenCache:
+    """File-backed store of access tokens and their expiry times"""
+
+    def __init__(self, path=None):
+        self._path = Path(path) if path else None
+
+    @property
+    def path(self):
+        return self._path or Path.home() / '.ga-cli' / 'tokens.json'
+
+    def locked(self):
+        """Open the token file under an exclusive lock"""
+        return LockedJsonFile(self.path)
+
+    @staticmethod
+    def lookup(state, key, now=None):
+        """Return (token, expiry) from a locked state if still fresh, else None"""
+        entry = state.get(key)
+        if not entry:
+            return None
+        now = time.time() if now is None else now
+        if entry.get('expiry', 0) - now <= REFRESH_MARGIN:
+            return None
+        return entry['token'], entry['expiry']
+
+    @staticmethod
+    def store(state, key, token, expiry, now=None):
+        """Record a token in a locked state, dropping expired entries"""
+        now = time.time() if now is None else now
+        for stale in [k for k, e in state.items() if e.get('expiry', 0) <= now]:
+            del state[stale]
+        state[key] = {'token': token, 'expiry': expiry}
+
+
+def _to_epoch(expiry):
+    """google-auth expiries are naive UTC datetimes"""
+    return expiry.replace(tzinfo=datetime.timezone.utc).timestamp()
+
+
+def _from_epoch(seconds):
+    return datetime.datetime.fromtimestamp(seconds, tz=datetime.timezone.utc).replace(tzinfo=None)
+
+
+class CachedTokenCredentials(auth_credentials.Credentials):
+    """Credentials serving tokens from the shared cache
+
+    Wraps already scoped credentials; ``refresh`` first looks for a token
+    another process stored, and only refreshes the wrapped credentials when
+    none is fresh. Being a plain Credentials object, it is passed to the
+    transport as is, so the token it carries is the one used.
+    """
+
+    def __init__(self, inner, key, cache=None):
+        super().__init__()
+        self._inner = inner
+        self._key = key
+        self._cache = cache or TokenCache()
+
+    def refresh(self, request):
+        with profiler.phase('token refresh'), self._cache.locked() as state:
+            cached = self._cache.lookup(state, self._key)
+            if cached is None:
+                logger.debug("Refreshing access token")
+                self._inner.refresh(request)
+                token = self._inner.token
+                if isinstance(token, bytes):
+                    token = token.decode('utf-8')
+                expiry = _to_epoch(self._inner.expiry)
+                self._cache.store(state, self._key, token, expiry)
+            else:
+                logger.debug("Reusing cached access token")
+                token, expiry = cached
+
+        self.token = token
+        self.expiry = _from_epoch(expiry)
+
+
+def with_token_cache(credentials, credentials_path, scopes):
+    """Wrap service-account credentials so their tokens are cached on disk
+
+    Args:
+        credentials: Service-account credentials loaded from credentials_path
+        credentials_path: File the credentials were loaded from (cache key)
+        scopes: OAuth scopes the tokens are requested for
+
+    Returns:
+        Credentials to hand to the API client, or the originals where file
+        locks are unavailable
+    """
+    if not LockedJsonFile.available():
+        return credentials
+
+    return CachedTokenCredentials(
+        scoped_credentials(credentials, scopes), cache_key(credentials_path, scopes)
+    )
+
+
+def scoped_credentials(credentials, scopes):
+    """Scope service-account credentials the way the API client would"""
+    inner = credentials.with_scopes(list(scopes))
+    # Mirror what the client does for service accounts: self-signed JWTs
+    # where supported, so a refresh is local signing rather than a round trip
+    if hasattr(inner, 'with_always_use_jwt_access'):
+        inner = inner.with_always_use_jwt_access(True)
+    return inner
+
+
+class TimedCredentials(auth_credentials.Credentials):
+    """Credentials reporting each token refresh to --profile
+
+    Like CachedTokenCredentials, wraps already scoped credentials so the
+    client uses this object as is and every refresh goes through it.
+    """
+
+    def __init__(self, inner):
+        super().__init__()
+        self._inner = inner
+
+    def refresh(self, request):
+        with profiler.phase('token refresh'):
+            self._inner.refresh(request)
+        self.token = self._inner.token
+        self.expiry = self._inner.expiry
@@ -0,0 +1,244 @@
+"""Lightweight spans around commands and Admin API calls
+
+With ``[tracing] enabled = true`` every command run through ``with_client``
+and every RPC attempt made by the retry decorators becomes a span, appended
+as one JSON object per line to ``~/.ga-cli/trace.ndjson`` (``[tracing]
+file``). A span records the operation, the resource it acted on, the page
+of list calls, the attempt number, its status and duration, and the trace
+and parent IDs tying RPC attempts to the command that made them, so
+latency and retry behavior can be analyzed across many runs.
+
+Each span is written with a single append to a file opened with O_APPEND,
+so concurrent ga-cli processes can share one trace file. With
+``opentelemetry = true`` and the OpenTelemetry API installed, the spans are
+also started on the globally configured tracer provider.
+
+Like the rate limiter, tracing is off until configured, and a span then
+costs one attribute check.
+"""
+
+import contextlib
+import contextvars
+import inspect
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+from ga_cli.logging_config import logger
+
+
+# Wrapper arguments naming the resource a call acts on, outermost first
+RESOURCE_COLLECTIONS = {
+    'account_id': 'accounts',
+    'property_id': 'properties',
+    'stream_id': 'dataStreams',
+}
+
+# Page of the listing being fetched, set by ga_cli.pagination
+current_page: 'contextvars.ContextVar[Optional[int]]' = contextvars.ContextVar('ga_cli_page', default=None)
+
+_current_span: 'contextvars.ContextVar[Optional[Span]]' = contextvars.ContextVar('ga_cli_span', default=None)
+
+_NO_SPAN = contextlib.nullcontext()
+
+
+def resource_getter(func):
+    """Build a function naming the resource a call of ``func`` acts on
+
+    The returned ``get(args, kwargs)`` joins the ID arguments of the call
+    into a resource name such as ``properties/123/dataStreams/456``.
+    """
+    ids = [
+        (index, name) for index, name in enumerate(inspect.signature(func).parameters)
+        if name in RESOURCE_COLLECTIONS
+    ]
+
+    def get(args, kwargs):
+        parts = []
+        for index, name in ids:
+            value = args[index] if index < len(args) else kwargs.get(name)
+            if value:
+                parts.append(f"{RESOURCE_COLLECTIONS[name]}/{value}")
+        return '/'.join(parts) or None
+
+    return get
+
+
+def _new_id(size):
+    return os.urandom(size).hex()
+
+
+class Span:
+    """One timed operation; entered with ``with``"""
+
+    __slots__ = (
+        'tracer', 'kind', 'operation', 'resource', 'page', 'attempt', 'status',
+        'trace_id', 'span_id', 'parent_id', 'start', '_started', '_token', '_otel',
+    )
+
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+
+    def __init__(self, tracer, kind, operation, resource=None, attempt=None):
+        self.tracer = tracer
+        self.kind = kind
+        self.operation = operation
+        self.resource = resource
+        self.attempt = attempt
+        self.page = current_page.get()
+        self.status = 'OK'
+        self._otel = None
+
+    def __enter__(self):
+        parent = _current_span.get()
+        self.trace_id = parent.trace_id if parent else _new_id(16)
+        self.parent_id = parent.span_id if parent else None
+        self.span_id = _new_id(8)
+        self._token = _current_span.set(self)
+        if self.tracer.otel is not None:
+            self._otel = self.tracer.otel.start(self, parent)
+        self.start = time.time()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self._started
+        _current_span.reset(self._token)
+        if exc is not None:
+            # Commands report API errors and then abort; name the cause
+            cause = exc.__context__ if exc_type.__name__ == 'Abort' and exc.__context__ else exc
+            self.status = type(cause).__name__
+        if self._otel is not None:
+            self.tracer.otel.end(self._otel, self)
+        self.tracer.export(self, duration)
+        return False
+
+    def as_dict(self, duration):
+        """The span as written to the trace file"""
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'kind': self.kind,
+            'operation': self.operation,
+            'resource': self.resource,
+            'page': self.page,
+            'attempt': self.attempt,
+            'status': self.status,
+            'start': round(self.start, 6),
+            'duration_ms': round(duration * 1000, 3),
+            'pid': os.getpid(),
+        }
+
+
+class _OpenTelemetry:
+    """Mirrors spans onto the OpenTelemetry API"""
+
+    def __init__(self, trace_api):
+        from ga_cli import __version__
+
+        self._trace = trace_api
+        self._tracer = trace_api.get_tracer('ga_cli', __version__)
+
+    def start(self, span, parent):
+        context = None
+        if parent is not None and parent._otel is not None:
+            context = self._trace.set_span_in_context(parent._otel)
+        attributes = {'ga_cli.kind': span.kind}
+        for key in ('resource', 'page', 'attempt'):
+            value = getattr(span, key)
+            if value is not None:
+                attributes[f"ga_cli.{key}"] = value
+        return self._tracer.start_span(span.operation, context=context, attributes=attributes)
+
+    def end(self, otel_span, span):
+        if span.status != 'OK':
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, span.status))
+        otel_span.end()
+
+
+class Tracer:
+    """Process-wide span recorder, configured from the [tracing] section
+
+    Attributes:
+        enabled: Whether spans are recorded
+        path: Trace file spans are appended to
+        otel: OpenTelemetry bridge, or None
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path: Optional[Path] = None
+        self.otel = None
+        self._fd = None
+
+    @property
+    def default_path(self):
+        return Path.home() / '.ga-cli' / 'trace.ndjson'
+
+    def configure(self):
+        """Load settings from the [tracing] section of the config file
+
+        Recognized keys: enabled, file and opentelemetry.
+        """
+        from ga_cli.config import ConfigManager
+
+        config_manager = ConfigManager()
+
+        def flag(key):
+            value = config_manager.get('tracing', key, fallback='false')
+            return str(value).lower() in ('true', '1', 'yes', 'on')
+
+        self.enabled = flag('enabled')
+        path = config_manager.get('tracing', 'file', fallback=None)
+        path = Path(path).expanduser() if path else self.default_path
+        if path != self.path:
+            self.close()
+            self.path = path
+
+        self.otel = None
+        if self.enabled and flag('opentelemetry'):
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                logger.warning("[tracing] opentelemetry is on but opentelemetry-api is not installed")
+            else:
+                self.otel = _OpenTelemetry(trace)
+
+    def span(self, kind, operation, resource=None, attempt=None):
+        """Context manager recording a span, e.g. ``span('rpc', 'get_property')``
+
+        Args:
+            kind: 'command' or 'rpc'
+            operation: Command path or RPC name
+            resource: Resource name the operation acts on
+            attempt: Attempt number of a retried call
+        """
+        if not self.enabled:
+            return _NO_SPAN
+        return Span(self, kind, operation, resource, attempt)
+
+    def export(self, span, duration):
+        """Append a finished span to the trace file"""
+        line = json.dumps(span.as_dict(duration), separators=(',', ':')) + '\n'
+        path = self.path or self.default_path
+        try:
+            if self._fd is None:
+                path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            os.write(self._fd, line.encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Tracing disabled, cannot write {path}: {e}")
+            self.enabled = False
+
+    def close(self):
+        """Close the trace file"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+# Process-wide tracer, configured from the config file by the CLI
+tracer = Tracer()
@@ -0,0 +1,129 @@
+"""Transport, per-RPC timeout and gRPC channel settings for Admin API clients"""
+
+import functools
+from ga_cli.logging_config import logger
+
+
+TRANSPORTS = ['grpc', 'rest']
+
+DEFAULT_TRANSPORT = 'grpc'
+DEFAULT_TIMEOUT = 30.0  # seconds per RPC attempt
+DEFAULT_ENDPOINT = 'analyticsadmin.googleapis.com'
+
+# gRPC keepalive pings are off unless configured; long-lived clients (the
+# daemon, shell sessions) use them to notice dead connections early
+DEFAULT_KEEPALIVE_TIME = 0  # seconds, 0 disables keepalive pings
+DEFAULT_KEEPALIVE_TIMEOUT = 20  # seconds
+
+
+class TransportSettings:
+    """How Admin API clients connect, and how long each RPC may take
+
+    Args:
+        transport: 'grpc' or 'rest' (the async engine always uses gRPC)
+        timeout: Deadline for a single RPC attempt, in seconds (0: none)
+        keepalive_time: Seconds between gRPC keepalive pings (0: off)
+        keepalive_timeout: Seconds to wait for a keepalive ack
+        endpoint: API host
+    """
+
+    def __init__(self, transport=DEFAULT_TRANSPORT, timeout=DEFAULT_TIMEOUT,
+                 keepalive_time=DEFAULT_KEEPALIVE_TIME,
+                 keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT, endpoint=DEFAULT_ENDPOINT):
+        self.transport = transport
+        self.timeout = timeout
+        self.keepalive_time = keepalive_time
+        self.keepalive_timeout = keepalive_timeout
+        self.endpoint = endpoint
+
+    def configure(self, transport=None, timeout=None):
+        """Apply per-invocation settings, falling back to the config file
+
+        Args:
+            transport: Value of --transport (config: [transport] transport)
+            timeout: Value of --timeout (config: [transport] timeout)
+
+        Other keys read from [transport]: keepalive_time, keepalive_timeout
+        and endpoint.
+        """
+        from ga_cli.config import ConfigManager
+
+        config_manager = ConfigManager()
+        configured = config_manager.get('transport', 'transport', fallback=DEFAULT_TRANSPORT)
+        if transport is None and configured not in TRANSPORTS:
+            logger.warning(f"Ignoring unknown transport: {configured}")
+            configured = DEFAULT_TRANSPORT
+        self.transport = transport or configured
+        self.endpoint = config_manager.get('transport', 'endpoint', fallback=DEFAULT_ENDPOINT)
+
+        for key, value, default in (
+            ('timeout', timeout, DEFAULT_TIMEOUT),
+            ('keepalive_time', None, DEFAULT_KEEPALIVE_TIME),
+            ('keepalive_timeout', None, DEFAULT_KEEPALIVE_TIMEOUT),
+        ):
+            if value is None:
+                value = config_manager.get('transport', key, fallback=default)
+            try:
+                setattr(self, key, max(float(value), 0))
+            except ValueError:
+                logger.warning(f"Ignoring invalid transport {key}: {value}")
+                setattr(self, key, default)
+
+    def channel_options(self):
+        """gRPC channel arguments for the configured keepalive behavior"""
+        if not self.keepalive_time:
+            return []
+        return [
+            ('grpc.keepalive_time_ms', int(self.keepalive_time * 1000)),
+            ('grpc.keepalive_timeout_ms', int(self.keepalive_timeout * 1000)),
+            ('grpc.keepalive_permit_without_calls', 1),
+            ('grpc.http2.max_pings_without_data', 0),
+        ]
+
+    def client_transport(self, client_class):
+        """Value for the ``transport`` argument of a client constructor
+
+        Async clients always get gRPC. gRPC transports are built through a
+        channel factory so the channel options apply.
+        """
+        is_async = 'Async' in getattr(client_class, '__name__', '')
+        transport = 'grpc_asyncio' if is_async else self.transport
+        if is_async and self.transport != 'grpc':
+            logger.debug("The async engine always uses the gRPC transport")
+
+        options = self.channel_options()
+        if transport == 'rest' or not options:
+            return transport
+
+        transport_class = client_class.get_transport_class(transport)
+        return functools.partial(
+            transport_class, channel=_channel_factory(transport_class, options)
+        )
+
+
+class TimeoutClient:
+    """Admin API client whose requests use their own timeout
+
+    Wraps a shared client. The retry decorators give each attempt
+    ``rpc_timeout`` instead of the process-wide setting, so a timeout chosen
+    for one caller does not change it for other commands in the process.
+    """
+
+    def __init__(self, client, timeout):
+        self.client = client
+        self.rpc_timeout = timeout
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
+def _channel_factory(transport_class, options):
+    """Create channels the way the transport would, with extra options"""
+    def create_channel(host, **kwargs):
+        kwargs['options'] = list(kwargs.get('options') or []) + options
+        return transport_class.create_channel(host, **kwargs)
+    return create_channel
+
+
+# Process-wide settings, configured from flags and the config file by the CLI
+transport_settings = TransportSettings()
@@ -2,6 +2,7 @@
 
 import re
 import click
+from ga_cli import catalog
 
 
 def validate_account_id(ctx, param, value):
@@ -18,6 +19,17 @@ def validate_property_id(ctx, param, value):
     return value
 
 
+def validate_property_ids(ctx, param, value):
+    """Validate several property IDs, accepting properties/ prefixes"""
+    ids = []
+    for property_id in value or ():
+        if property_id.startswith('properties/'):
+            property_id = property_id[len('properties/'):]
+        validate_property_id(ctx, param, property_id)
+        ids.append(property_id)
+    return tuple(ids)
+
+
 def validate_url(ctx, param, value):
     """Validate URL format"""
     if value:
@@ -28,20 +40,35 @@ def validate_url(ctx, param, value):
 
 
 def validate_timezone(ctx, param, value):
-    """Validate timezone"""
+    """Validate an IANA timezone name, returning its canonical spelling"""
     if value:
-        try:
-            import pytz
-            pytz.timezone(value)
-        except pytz.exceptions.UnknownTimeZoneError:
+        canonical = catalog.timezones().get(value.lower())
+        if canonical is None:
             raise click.BadParameter(f"Invalid timezone: {value}")
+        return canonical
     return value
 
 
 def validate_currency(ctx, param, value):
-    """Validate currency code"""
-    if value and not re.match(r'^[A-Z]{3}$', value):
-        raise click.BadParameter("Currency must be 3-letter code (e.g., USD)")
+    """Validate an ISO 4217 currency code"""
+    if value:
+        if not re.match(r'^[A-Z]{3}$', value):
+            raise click.BadParameter("Currency must be 3-letter code (e.g., USD)")
+        if value not in catalog.currency_codes():
+            raise click.BadParameter(f"Unknown currency code: {value}")
+    return value
+
+
+def validate_industry(ctx, param, value):
+    """Validate an industry category name, returning it upper-cased"""
+    if value:
+        category = value.strip().upper()
+        if category not in catalog.industry_categories():
+            raise click.BadParameter(
+                f"Invalid industry category: {value} "
+                f"(choose from: {', '.join(sorted(catalog.industry_categories()))})"
+            )
+        return category
     return value
 
 
@@ -50,3 +77,35 @@ def validate_stream_id(ctx, param, value):
     if value and not value.isdigit():
         raise click.BadParameter("Stream ID must be numeric")
     return value
+
+
+def parse_id_list(lines, validator, prefix=None):
+    """Parse resource IDs given one per line
+
+    Blank lines and ``#`` comments are skipped, and a resource-name prefix
+    such as ``accounts/`` is accepted and stripped.
+
+    Args:
+        lines: Iterable of text lines (e.g. an open file or stdin)
+        validator: ID validator such as validate_account_id
+        prefix: Optional resource-name prefix to strip
+
+    Returns:
+        List of IDs in input order, without duplicates
+    """
+    ids = []
+    seen = set()
+    for line_number, line in enumerate(lines, start=1):
+        value = line.split('#', 1)[0].strip()
+        if not value:
+            continue
+        if prefix and value.startswith(prefix):
+            value = value[len(prefix):]
+        try:
+            validator(None, None, value)
+        except click.BadParameter as e:
+            raise click.BadParameter(f"line {line_number}: {e.message}")
+        if value not in seen:
+            seen.add(value)
+            ids.append(value)
+    return ids
@@ -41,9 +41,12 @@ setup(
         "rich>=13.0.0,<14.0.0",
         "pytz>=2023.3",
     ],
+    extras_require={
+        "tracing": ["opentelemetry-api>=1.0.0"],
+    },
     entry_points={
         "console_scripts": [
-            "ga-cli=ga_cli.cli:cli",
+            "ga-cli=ga_cli.__main__:main",
         ],
     },
     license="MIT",
@@ -1,10 +1,19 @@
 """Pytest fixtures and configuration"""
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock
 from click.testing import CliRunner
 
 
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path_factory, monkeypatch):
+    """Keep cache and state files written under ~/.ga-cli out of the real home"""
+    home = tmp_path_factory.mktemp('home')
+    monkeypatch.setenv('HOME', str(home))
+    return home
+
+
 @pytest.fixture
 def cli_runner():
     """Provide a Click CLI test runner"""
@@ -87,3 +96,26 @@ def mock_config_manager(mocker, mock_credentials_path):
     manager.get_credentials_path.return_value = mock_credentials_path
     manager.get.return_value = mock_credentials_path
     return manager
+
+
+@pytest.fixture
+def paged_response():
+    """Build a side_effect that serves items like a paginated list RPC
+
+    Each call returns a pager-like object whose ``pages`` yields only the
+    page selected by the request's ``page_token``.
+    """
+    def factory(items, field, page_size=2):
+        pages = [items[i:i + page_size] for i in range(0, len(items), page_size)] or [[]]
+
+        def list_method(request=None, **kwargs):
+            token = (request or {}).get('page_token') or '0'
+            index = int(token)
+            response = SimpleNamespace(**{
+                field: pages[index],
+                'next_page_token': str(index + 1) if index + 1 < len(pages) else '',
+            })
+            return SimpleNamespace(pages=iter([response]))
+
+        return list_method
+    return factory
@@ -1,5 +1,6 @@
 """Tests for account commands"""
 
+import json
 from click.testing import CliRunner
 from unittest.mock import Mock, patch, MagicMock
 from ga_cli.cli import cli
@@ -47,3 +48,104 @@ def test_accounts_get(mock_auth):
     result = runner.invoke(cli, ['accounts', 'get', '123456'])
 
     assert 'Test Account' in result.output or result.exit_code == 1
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_accounts_list_ids(mock_auth):
+    """Test --format ids writes one account ID per line"""
+    accounts = []
+    for account_id in ('1', '2'):
+        account = Mock()
+        account.name = f"accounts/{account_id}"
+        accounts.append(account)
+    mock_auth.return_value.get_client.return_value.list_accounts.return_value = accounts
+
+    result = CliRunner().invoke(
+        cli, ['--credentials', '/tmp/creds.json', 'accounts', 'list', '--format', 'ids']
+    )
+
+    assert result.exit_code == 0
+    assert result.output == '1\n2\n'
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_accounts_list_unknown_field(mock_auth):
+    """Test an unknown --fields name is a usage error"""
+    result = CliRunner().invoke(
+        cli, ['--credentials', '/tmp/creds.json', 'accounts', 'list', '--fields', 'id,colour']
+    )
+
+    assert result.exit_code == 2
+    assert 'unknown field colour' in result.output
+    mock_auth.return_value.get_client.return_value.list_accounts.assert_not_called()
+
+
+def _summary(account_id, name, properties):
+    summary = Mock()
+    summary.account = f"accounts/{account_id}"
+    summary.display_name = name
+    summary.property_summaries = []
+    for property_id, property_name in properties:
+        prop = Mock()
+        prop.property = f"properties/{property_id}"
+        prop.display_name = property_name
+        prop.property_type.name = "PROPERTY_TYPE_ORDINARY"
+        summary.property_summaries.append(prop)
+    return summary
+
+
+SUMMARIES = [
+    _summary('1', 'First', [('11', 'Site'), ('12', 'App')]),
+    _summary('2', 'Empty', []),
+]
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_accounts_tree_json(mock_auth):
+    """Test accounts tree nests properties under accounts"""
+    mock_client = Mock()
+    mock_client.list_account_summaries.return_value = SUMMARIES
+    mock_auth.return_value.get_client.return_value = mock_client
+
+    result = CliRunner().invoke(
+        cli, ['--credentials', '/tmp/creds.json', 'accounts', 'tree', '--format', 'json'])
+
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert [a['id'] for a in data] == ['1', '2']
+    assert [p['id'] for p in data[0]['properties']] == ['11', '12']
+    assert data[1]['properties'] == []
+    mock_client.list_accounts.assert_not_called()
+    mock_client.list_properties.assert_not_called()
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_accounts_tree_tsv_flattens(mock_auth):
+    """Test delimited output has one row per property"""
+    mock_client = Mock()
+    mock_client.list_account_summaries.return_value = SUMMARIES
+    mock_auth.return_value.get_client.return_value = mock_client
+
+    result = CliRunner().invoke(
+        cli, ['--credentials', '/tmp/creds.json', 'accounts', 'tree', '--format', 'tsv'])
+
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0].split('\t') == [
+        'account_id', 'account_name', 'property_id', 'property_name', 'property_type']
+    assert [line.split('\t')[2] for line in lines[1:]] == ['11', '12', '']
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_accounts_tree_table(mock_auth):
+    """Test the table format renders a tree"""
+    mock_client = Mock()
+    mock_client.list_account_summaries.return_value = SUMMARIES
+    mock_auth.return_value.get_client.return_value = mock_client
+
+    result = CliRunner().invoke(
+        cli, ['--credentials', '/tmp/creds.json', 'accounts', 'tree', '--format', 'table'])
+
+    assert result.exit_code == 0
+    assert 'First (1)' in result.output
+    assert 'Site (11)' in result.output
@@ -0,0 +1,91 @@
+"""Tests for the asyncio engine helpers"""
+
+import asyncio
+from unittest.mock import patch
+import pytest
+from google.api_core import exceptions
+from ga_cli.aio import amap_bounded, iterate_async, aiter_pages
+from ga_cli.retry import async_retry_on_transient_error
+
+
+async def _collect(agen):
+    return [item async for item in agen]
+
+
+def test_iterate_async_yields_items_in_order():
+    """Test an async generator is drained from synchronous code"""
+    async def numbers():
+        for i in range(3):
+            await asyncio.sleep(0)
+            yield i
+
+    assert list(iterate_async(numbers)) == [0, 1, 2]
+
+
+def test_amap_bounded_preserves_order_and_captures_errors():
+    """Test results come back in input order and errors per item"""
+    in_flight = []
+    peak = []
+
+    async def work(item):
+        in_flight.append(item)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01 * (5 - item))
+        in_flight.remove(item)
+        if item == 2:
+            raise ValueError('boom')
+        return item * 10
+
+    results = list(iterate_async(lambda: amap_bounded(work, range(5), 2)))
+
+    assert [item for item, _, _ in results] == [0, 1, 2, 3, 4]
+    assert [result for _, result, _ in results] == [0, 10, None, 30, 40]
+    assert isinstance(results[2][2], ValueError)
+    assert max(peak) == 2
+
+
+def test_aiter_pages_follows_page_tokens(paged_response):
+    """Test async paging resumes from each next_page_token"""
+    fetch = paged_response(['a', 'b', 'c'], 'items')
+
+    async def fetch_page(page_token):
+        return next(fetch(request={'page_token': page_token}).pages)
+
+    assert asyncio.run(_collect(aiter_pages(fetch_page, 'items'))) == ['a', 'b', 'c']
+
+
+@patch('ga_cli.retry.asyncio.sleep')
+def test_async_retry_on_transient_error(mock_sleep):
+    """Test transient errors are retried with backoff"""
+    calls = []
+
+    async def no_sleep(delay):
+        calls.append(delay)
+    mock_sleep.side_effect = no_sleep
+
+    attempts = []
+
+    @async_retry_on_transient_error(max_retries=3)
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise exceptions.ServiceUnavailable('unavailable')
+        return 'ok'
+
+    assert asyncio.run(flaky()) == 'ok'
+    assert len(attempts) == 3
+    assert len(calls) == 2
+
+
+def test_async_retry_gives_up_on_permanent_error():
+    """Test non-transient errors are raised immediately"""
+    attempts = []
+
+    @async_retry_on_transient_error()
+    async def denied():
+        attempts.append(1)
+        raise exceptions.PermissionDenied('denied')
+
+    with pytest.raises(exceptions.PermissionDenied):
+        asyncio.run(denied())
+    assert len(attempts) == 1
@@ -63,12 +63,17 @@ class TestAuthManager:
 
     @patch('ga_cli.auth.service_account')
     @patch('ga_cli.auth.AnalyticsAdminServiceClient')
-    def test_get_client_with_timeout(self, mock_client_class, mock_service_account):
-        """Test get_client accepts timeout parameter"""
+    def test_get_client_with_timeout(self, mock_client_class, mock_service_account, monkeypatch):
+        """Test get_client's timeout applies to its client, not the whole process"""
+        from ga_cli.transport import transport_settings
+
+        monkeypatch.setattr(transport_settings, 'timeout', 30.0)
         mock_credentials = Mock()
         mock_service_account.Credentials.from_service_account_file.return_value = mock_credentials
 
         auth = AuthManager(credentials_path="/path/to/creds.json")
         client = auth.get_client(timeout=60)
 
-        assert client is not None
+        assert client.rpc_timeout == 60
+        assert client.client is auth.get_client()
+        assert transport_settings.timeout == 30.0
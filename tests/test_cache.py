@@ -0,0 +1,238 @@
+"""Tests for the response cache"""
+
+import os
+import time
+import pytest
+from unittest.mock import Mock, patch
+from click.testing import CliRunner
+from google.analytics.admin_v1alpha.types import Account, Property
+from ga_cli.cache import ResponseCache, cached
+from ga_cli.cli import cli
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Response cache rooted in a temporary directory"""
+    cache = ResponseCache(cache_dir=tmp_path / 'cache')
+    cache.configure(enabled=True, refresh=False, ttl=60, max_size_mb=1)
+    cache.set_namespace('/path/to/creds.json')
+    return cache
+
+
+class TestResponseCache:
+    """Test ResponseCache class"""
+
+    def test_round_trip_list(self, cache):
+        """Test cached list responses are rebuilt as messages"""
+        accounts = [Account(name='accounts/1', display_name='One')]
+        cache.set('list_accounts', (), accounts)
+
+        hit = cache.get('list_accounts')
+        assert hit == accounts
+
+    def test_round_trip_single(self, cache):
+        """Test cached get responses return a single message"""
+        prop = Property(name='properties/9', display_name='Nine', time_zone='UTC')
+        cache.set('get_property', ('9',), prop, many=False)
+
+        assert cache.get('get_property', '9') == prop
+
+    def test_empty_list_is_cached(self, cache):
+        """Test empty listings are cached too"""
+        cache.set('list_properties', ('1',), [])
+        assert cache.get('list_properties', '1') == []
+
+    def test_miss_for_other_parent(self, cache):
+        """Test entries are keyed by parent"""
+        cache.set('list_properties', ('1',), [Property(name='properties/9')])
+        assert cache.get('list_properties', '2') is None
+
+    def test_namespace_isolates_credentials(self, cache):
+        """Test entries are keyed by credentials"""
+        cache.set('list_accounts', (), [Account(name='accounts/1')])
+        cache.set_namespace('/other/creds.json')
+        assert cache.get('list_accounts') is None
+
+    def test_expired_entry_is_dropped(self, cache):
+        """Test entries older than the TTL are misses"""
+        cache.set('list_accounts', (), [Account(name='accounts/1')])
+        with patch('ga_cli.cache.time.time', return_value=time.time() + 120):
+            assert cache.get('list_accounts') is None
+        assert list(cache.cache_dir.glob('*.json')) == []
+
+    def test_refresh_skips_reads_but_writes(self, cache):
+        """Test refresh mode ignores existing entries"""
+        cache.set('list_accounts', (), [Account(name='accounts/1')])
+        cache.refresh = True
+        assert cache.get('list_accounts') is None
+
+        cache.set('list_accounts', (), [Account(name='accounts/2')])
+        cache.refresh = False
+        assert cache.get('list_accounts')[0].name == 'accounts/2'
+
+    def test_disabled_cache_does_not_write(self, cache):
+        """Test disabled cache neither reads nor writes"""
+        cache.enabled = False
+        cache.set('list_accounts', (), [Account(name='accounts/1')])
+        assert not cache.cache_dir.exists()
+
+    def test_non_messages_are_not_cached(self, cache):
+        """Test values that are not proto-plus messages are skipped"""
+        cache.set('list_accounts', (), [Mock()])
+        assert cache.get('list_accounts') is None
+
+    def test_invalidate(self, cache):
+        """Test invalidating one parent"""
+        cache.set('list_properties', ('1',), [])
+        cache.set('list_properties', ('2',), [])
+        cache.invalidate('list_properties', '1')
+
+        assert cache.get('list_properties', '1') is None
+        assert cache.get('list_properties', '2') == []
+
+    def test_invalidate_all(self, cache):
+        """Test invalidating every entry of an RPC"""
+        cache.set('list_properties', ('1',), [])
+        cache.set('list_properties', ('2',), [])
+        cache.set('list_accounts', (), [])
+        cache.invalidate_all('list_properties')
+
+        assert cache.get('list_properties', '1') is None
+        assert cache.get('list_properties', '2') is None
+        assert cache.get('list_accounts') == []
+
+    def test_memory_tier_serves_without_reading_files(self, cache):
+        """Test decoded entries are reused from memory once enabled"""
+        cache.enable_memory()
+        accounts = [Account(name='accounts/1')]
+        cache.set('list_accounts', (), accounts)
+
+        with patch('ga_cli.cache.open', side_effect=AssertionError('file read')):
+            assert cache.get('list_accounts') == accounts
+
+    def test_memory_tier_sees_invalidation_by_other_processes(self, cache):
+        """Test a memory hit is dropped once the entry file is gone"""
+        cache.enable_memory()
+        cache.set('list_properties', ('1',), [Property(name='properties/9')])
+
+        ResponseCache(cache_dir=cache.cache_dir).invalidate_all('list_properties')
+
+        assert cache.get('list_properties', '1') is None
+
+    def test_eviction_keeps_directory_under_budget(self, cache):
+        """Test oldest entries are evicted beyond the size budget"""
+        cache.max_bytes = 2048
+        big_name = 'x' * 600
+        for i in range(10):
+            cache.set('list_properties', (str(i),), [Property(display_name=big_name)])
+            path = cache._entry_path('list_properties', (str(i),))
+            if path.exists():
+                os.utime(path, (i, i))
+
+        total = sum(p.stat().st_size for p in cache.cache_dir.glob('*.json'))
+        assert total <= 2048
+        assert cache.get('list_properties', '9') is not None
+        assert cache.get('list_properties', '0') is None
+
+    def test_writes_scan_directory_once(self, cache):
+        """Test the directory is listed again only when over budget"""
+        with patch.object(cache, '_entries', wraps=cache._entries) as entries:
+            for i in range(20):
+                cache.set('list_properties', (str(i),), [Property(name=f"properties/{i}")])
+
+        assert entries.call_count == 1
+
+    def test_invalid_config_values_keep_defaults(self, tmp_path, isolated_home):
+        """Test unparsable TTL and size settings are ignored"""
+        config_dir = isolated_home / '.ga-cli'
+        config_dir.mkdir()
+        (config_dir / 'config.ini').write_text('[cache]\nttl = 5m\nmax_size_mb = lots\n')
+
+        cache = ResponseCache(cache_dir=tmp_path / 'cache')
+        cache.configure()
+
+        assert cache.ttl == 300
+        assert cache.max_bytes == 50 * 1024 * 1024
+
+    def test_config_file_settings(self, tmp_path, isolated_home):
+        """Test TTL and enablement fall back to the config file"""
+        config_dir = isolated_home / '.ga-cli'
+        config_dir.mkdir()
+        (config_dir / 'config.ini').write_text('[cache]\nttl = 42\nenabled = false\n')
+
+        cache = ResponseCache(cache_dir=tmp_path / 'cache')
+        cache.configure()
+
+        assert cache.ttl == 42
+        assert cache.enabled is False
+
+
+@patch('ga_cli.commands.properties.response_cache')
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_create_invalidates_listing(mock_auth, mock_cache):
+    """Test creating a property drops the cached listing for its account"""
+    created = Mock()
+    created.name = 'properties/555'
+    created.display_name = 'New'
+    mock_auth.return_value.get_client.return_value.create_property.return_value = created
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        '--credentials', '/tmp/creds.json',
+        'properties', 'create', '123', '--name', 'New',
+    ])
+
+    assert result.exit_code == 0
+    mock_cache.invalidate.assert_any_call('list_properties', '123')
+    mock_cache.invalidate.assert_any_call('list_account_summaries')
+
+
+def test_cached_decorator_serves_hits(cache):
+    """Test the decorator only calls through on a miss"""
+    calls = []
+
+    with patch('ga_cli.cache.response_cache', cache):
+        @cached('list_accounts')
+        def fetch(client):
+            calls.append(client)
+            return [Account(name='accounts/1')]
+
+        first = list(fetch('client'))
+        second = list(fetch('client'))
+
+    assert first == second
+    assert calls == ['client']
+
+
+def test_cached_decorator_skips_partial_listings(cache):
+    """Test a listing abandoned midway is not stored"""
+    with patch('ga_cli.cache.response_cache', cache):
+        @cached('list_accounts')
+        def fetch(client):
+            yield Account(name='accounts/1')
+            yield Account(name='accounts/2')
+
+        stream = fetch('client')
+        next(stream)
+        stream.close()
+
+    assert cache.get('list_accounts') is None
+    assert list(cache.cache_dir.iterdir()) == []
+
+
+def test_cached_decorator_streams_listing_into_entry(cache):
+    """Test a listing is written while it streams and committed at the end"""
+    with patch('ga_cli.cache.response_cache', cache):
+        @cached('list_accounts')
+        def fetch(client):
+            for i in range(3):
+                yield Account(name=f"accounts/{i}")
+
+        stream = fetch('client')
+        next(stream)
+        assert [p.suffix for p in cache.cache_dir.iterdir()] == ['.tmp']
+        rest = list(stream)
+
+    assert [a.name for a in rest] == ['accounts/1', 'accounts/2']
+    assert [a.name for a in cache.get('list_accounts')] == ['accounts/0', 'accounts/1', 'accounts/2']
+    assert [p.suffix for p in cache.cache_dir.iterdir()] == ['.json']
@@ -0,0 +1,26 @@
+"""Tests for the offline validation catalog"""
+
+from google.analytics.admin_v1alpha.types import IndustryCategory
+from ga_cli import catalog
+
+
+def test_industry_categories_match_api_enum():
+    """Test the precomputed categories track the Admin API enum"""
+    names = {category.name for category in IndustryCategory}
+    assert catalog.industry_categories() == names - {'INDUSTRY_CATEGORY_UNSPECIFIED'}
+
+
+def test_currency_codes():
+    """Test common codes are present and non-currency codes are not"""
+    codes = catalog.currency_codes()
+    assert {'USD', 'EUR', 'JPY', 'GBP'} <= codes
+    assert 'XAU' not in codes and 'XXX' not in codes
+    # Fund codes and units of account are not property currencies
+    assert not {'BOV', 'CHE', 'CHW', 'CLF', 'COU', 'MXV', 'USN', 'UYI', 'UYW'} & codes
+    assert len(codes) == 160
+
+
+def test_timezones_loaded_once():
+    """Test the timezone table is built once and shared"""
+    assert catalog.timezones() is catalog.timezones()
+    assert catalog.timezones()['utc'] == 'UTC'
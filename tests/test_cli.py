@@ -1,5 +1,10 @@
 """Tests for CLI entry point"""
 
+import json
+import os
+import subprocess
+import sys
+import pytest
 from click.testing import CliRunner
 from ga_cli.cli import cli
 
@@ -50,3 +55,44 @@ def test_config_command_exists():
     result = runner.invoke(cli, ['config', '--help'])
     assert result.exit_code == 0
     assert 'Manage CLI configuration' in result.output
+
+
+# Commands that never issue an RPC must not pay for the Admin API stack
+# (startup time itself is tracked by the cold start in benchmarks/bench_suite.py)
+HEAVY_MODULES = ('grpc', 'google.protobuf', 'google.analytics.admin', 'rich')
+
+STARTUP_PROBE = """
+import json, sys
+from ga_cli.cli import cli
+try:
+    cli(sys.argv[1:], prog_name='ga-cli')
+except SystemExit:
+    pass
+heavy = [m for m in {heavy!r} if m in sys.modules]
+sys.stderr.write(json.dumps({{'heavy': heavy}}))
+"""
+
+
+def _probe_startup(args, tmp_path):
+    """Run the CLI in a fresh interpreter and report the heavy modules it imported"""
+    env = dict(os.environ, HOME=str(tmp_path))
+    env.pop('GOOGLE_APPLICATION_CREDENTIALS', None)
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env['PYTHONPATH'] = repo_root + os.pathsep + env.get('PYTHONPATH', '')
+    result = subprocess.run(
+        [sys.executable, '-c', STARTUP_PROBE.format(heavy=HEAVY_MODULES)] + args,
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize('args', [
+    ['--help'],
+    ['--version'],
+    ['config', 'show'],
+    ['accounts', '--help'],
+])
+def test_no_rpc_commands_skip_heavy_imports(args, tmp_path):
+    """Test that help/version/config commands do not import the Admin API stack"""
+    report = _probe_startup(args, tmp_path)
+    assert report['heavy'] == []
@@ -0,0 +1,64 @@
+"""Tests for bounded concurrent fan-out"""
+
+import threading
+import time
+from ga_cli.concurrency import get_concurrency, map_bounded, DEFAULT_CONCURRENCY
+
+
+class TestMapBounded:
+    """Test map_bounded helper"""
+
+    def test_preserves_input_order(self):
+        """Test results come back in input order regardless of finish order"""
+        def slow_first(i):
+            time.sleep(0.02 if i == 0 else 0)
+            return i * 10
+
+        results = [(item, result) for item, result, _ in map_bounded(slow_first, range(5), 4)]
+        assert results == [(0, 0), (1, 10), (2, 20), (3, 30), (4, 40)]
+
+    def test_captures_errors_per_item(self):
+        """Test one failing item does not abort the others"""
+        def fail_on_two(i):
+            if i == 2:
+                raise ValueError('boom')
+            return i
+
+        outcomes = list(map_bounded(fail_on_two, range(4), 2))
+        assert [o[1] for o in outcomes] == [0, 1, None, 3]
+        assert isinstance(outcomes[2][2], ValueError)
+
+    def test_respects_worker_bound(self):
+        """Test no more than max_workers calls run at once"""
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def track(i):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+        list(map_bounded(track, range(20), 3))
+        assert peak[0] <= 3
+
+
+class TestGetConcurrency:
+    """Test worker count resolution"""
+
+    def test_explicit_value(self):
+        """Test a flag value is used as-is"""
+        assert get_concurrency(5) == 5
+
+    def test_default(self):
+        """Test the default applies without config"""
+        assert get_concurrency() == DEFAULT_CONCURRENCY
+
+    def test_config_value(self, isolated_home):
+        """Test the config file value is used"""
+        (isolated_home / '.ga-cli').mkdir()
+        (isolated_home / '.ga-cli' / 'config.ini').write_text('[performance]\nconcurrency = 3\n')
+        assert get_concurrency() == 3
@@ -0,0 +1,142 @@
+"""Tests for the background daemon and its thin client"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import pytest
+import click
+from ga_cli import __version__, daemon
+from ga_cli.cli import cli
+from ga_cli.daemon import (
+    DISABLE_ENV, EXIT, GLOBAL_VALUE_OPTIONS, REQUEST, STDERR, STDOUT, VERSION, DaemonServer,
+    control, forward, recv_frame, send_frame, socket_path, subcommand,
+)
+from ga_cli.session import Session
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_frames_round_trip():
+    """Test frames survive the socket, including empty payloads"""
+    left, right = socket.socketpair()
+    with left, right:
+        send_frame(left, STDOUT, b'x' * 100000)
+        send_frame(left, EXIT, b'')
+        assert recv_frame(right) == (STDOUT, b'x' * 100000)
+        assert recv_frame(right) == (EXIT, b'')
+        left.close()
+        assert recv_frame(right) == (None, None)
+
+
+def test_forward_without_daemon_runs_locally():
+    """Test commands fall back to in-process execution without a daemon"""
+    assert forward(['accounts', 'list']) is None
+    assert control('status') is None
+
+
+def test_forward_skips_daemon_commands_and_opt_out(monkeypatch):
+    """Test daemon management and GA_CLI_NO_DAEMON never reach the socket"""
+    monkeypatch.setattr(daemon, 'connect', lambda path=None: pytest.fail('connected'))
+    assert forward(['daemon', 'status']) is None
+
+    assert forward(['--no-cache', 'daemon', 'status']) is None
+    assert forward(['--credentials', 'x.json', '--log-level=debug', 'daemon', 'stop']) is None
+
+    monkeypatch.setenv(DISABLE_ENV, '1')
+    assert forward(['accounts', 'list']) is None
+
+
+def test_subcommand_skips_global_options():
+    """Test the subcommand is found past global options and their values"""
+    assert subcommand(['--timeout', '5', '--profile', 'shell']) == 'shell'
+    assert subcommand(['--credentials=run', 'accounts', 'list']) == 'accounts'
+    assert subcommand(['--engine', 'async']) is None
+    assert subcommand(['--', 'run', 'ops.txt']) == 'run'
+
+
+def test_global_value_options_match_cli():
+    """Test the daemon's option table covers every global option taking a value"""
+    options = {
+        opt for param in cli.params
+        if isinstance(param, click.Option) and not param.is_flag
+        for opt in param.opts
+    }
+    assert options == set(GLOBAL_VALUE_OPTIONS)
+
+
+def _serve_one(request):
+    """Send one request to a DaemonServer and return the frames it answers with"""
+    server = DaemonServer(Session(), path='/unused')
+    left, right = socket.socketpair()
+    with left, right:
+        send_frame(left, REQUEST, json.dumps(request).encode('utf-8'))
+        server.handle(right)
+        right.close()
+        frames = []
+        while True:
+            kind, payload = recv_frame(left)
+            if kind is None:
+                return frames
+            frames.append((kind, payload))
+
+
+def test_server_refuses_local_commands_after_global_options():
+    """Test the daemon never runs daemon/shell/run, even behind global options"""
+    frames = _serve_one({'version': __version__, 'argv': ['--no-cache', 'daemon', 'stop']})
+
+    assert frames == [(STDERR, b"Error: 'daemon' cannot run in the daemon\n"), (EXIT, b'2')]
+
+
+def test_server_refuses_other_versions():
+    """Test a client of another version is told to run the command itself"""
+    frames = _serve_one({'version': '0.0.1', 'argv': ['--version']})
+
+    assert frames == [(VERSION, __version__.encode('utf-8'))]
+
+
+def test_session_reports_exit_codes(capsys):
+    """Test usage errors and successful commands map to CLI exit codes"""
+    session = Session()
+
+    assert session.run(['--version']) == 0
+    assert session.run(['no-such-command']) == 2
+    assert "No such command" in capsys.readouterr().err
+    assert session.commands_run == 2
+
+
+def _ga_cli(args, home, **kwargs):
+    env = dict(os.environ, HOME=str(home), PYTHONPATH=REPO_ROOT)
+    env.pop(DISABLE_ENV, None)
+    env.pop('GOOGLE_APPLICATION_CREDENTIALS', None)
+    return subprocess.run(
+        [sys.executable, '-m', 'ga_cli'] + args, env=env, capture_output=True, text=True,
+        **kwargs
+    )
+
+
+@pytest.mark.integration
+def test_commands_are_served_by_running_daemon(isolated_home):
+    """Test a started daemon serves commands and stops cleanly"""
+    assert _ga_cli(['daemon', 'start'], isolated_home, timeout=30).returncode == 0
+    try:
+        result = _ga_cli(['config', 'show'], isolated_home, timeout=30)
+        assert result.returncode == 0
+        assert "No configuration found" in result.stdout
+
+        result = _ga_cli(['no-such-command'], isolated_home, timeout=30)
+        assert result.returncode == 2
+
+        status = _ga_cli(['daemon', 'status'], isolated_home, timeout=30)
+        assert "Commands served: 2" in status.stdout
+    finally:
+        _ga_cli(['daemon', 'stop'], isolated_home, timeout=30)
+
+    for _ in range(50):
+        if not socket_path().exists():
+            break
+        time.sleep(0.1)
+    assert not socket_path().exists()
@@ -0,0 +1,126 @@
+"""Tests for output formatters"""
+
+import json
+from collections import namedtuple
+from ga_cli.formatters.json import format_json, format_ndjson
+from ga_cli.formatters.plain import format_csv, format_tsv
+from ga_cli.output import output_rows, resolve_list_format
+
+
+ROWS = [{'id': '1', 'name': 'One'}, {'id': '2', 'name': 'Two'}]
+
+Row = namedtuple('Row', ('id', 'name'))
+TUPLE_ROWS = [Row('1', 'One'), Row('2', 'Two')]
+
+
+class TestFormatJson:
+    """Test JSON formatter"""
+
+    def test_compact_list(self, capsys):
+        """Test compact mode writes a single line"""
+        assert format_json(iter(ROWS), compact=True) == 2
+        out = capsys.readouterr().out
+        assert out == json.dumps(ROWS, separators=(',', ':')) + '\n'
+
+    def test_compact_empty(self, capsys):
+        """Test compact mode with no rows"""
+        assert format_json(iter([]), compact=True) == 0
+        assert capsys.readouterr().out == '[]\n'
+
+    def test_single_record(self, capsys):
+        """Test dicts are written as one object"""
+        assert format_json(ROWS[0]) == 1
+        assert json.loads(capsys.readouterr().out) == ROWS[0]
+
+    def test_namedtuple_rows(self, capsys):
+        """Test row tuples are written as objects, not arrays"""
+        assert format_json(iter(TUPLE_ROWS)) == 2
+        assert json.loads(capsys.readouterr().out) == ROWS
+        assert format_json(TUPLE_ROWS[0]) == 1
+        assert json.loads(capsys.readouterr().out) == ROWS[0]
+
+
+class TestFormatNdjson:
+    """Test NDJSON formatter"""
+
+    def test_one_record_per_line(self, capsys):
+        """Test each record is written on its own line"""
+        assert format_ndjson(iter(ROWS)) == 2
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == ROWS
+
+    def test_consumes_lazily(self, capsys):
+        """Test records are written before the source is exhausted"""
+        seen = []
+
+        def rows():
+            for row in ROWS:
+                yield row
+                seen.append(capsys.readouterr().out)
+
+        format_ndjson(rows())
+        assert seen[0] == json.dumps(ROWS[0], separators=(',', ':')) + '\n'
+
+    def test_empty(self, capsys):
+        """Test no output for no records"""
+        assert format_ndjson(iter([])) == 0
+        assert capsys.readouterr().out == ''
+
+
+def test_output_rows_dispatches_ndjson(capsys):
+    """Test output_rows selects the NDJSON formatter"""
+    assert output_rows(iter(ROWS), 'ndjson') == 2
+    assert len(capsys.readouterr().out.splitlines()) == 2
+
+
+class TestFormatDelimited:
+    """Test TSV/CSV formatters"""
+
+    def test_tsv_with_header(self, capsys):
+        """Test TSV output starts with the column names"""
+        assert format_tsv(iter(ROWS)) == 2
+        assert capsys.readouterr().out == 'id\tname\n1\tOne\n2\tTwo\n'
+
+    def test_tsv_sanitises_separators(self, capsys):
+        """Test tabs and newlines inside values do not break rows"""
+        format_tsv([{'id': '1', 'name': 'a\tb\nc'}])
+        assert capsys.readouterr().out.splitlines()[1] == '1\ta b c'
+
+    def test_column_order_from_first_row(self, capsys):
+        """Test later rows follow the first row's columns"""
+        format_tsv([{'id': '1', 'url': 'u'}, {'package_name': 'p', 'id': '2'}])
+        assert capsys.readouterr().out.splitlines()[1:] == ['1\tu', '2\t']
+
+    def test_namedtuple_rows(self, capsys):
+        """Test row tuples, including ones of another type, follow the first row's columns"""
+        Other = namedtuple('Other', ('id', 'bundle_id'))
+        format_tsv(TUPLE_ROWS + [Other('3', 'b')])
+        assert capsys.readouterr().out == 'id\tname\n1\tOne\n2\tTwo\n3\t\n'
+
+    def test_csv_quotes_fields(self, capsys):
+        """Test CSV output quotes fields containing commas"""
+        assert format_csv([{'id': '1', 'name': 'a,b'}]) == 1
+        assert capsys.readouterr().out == 'id,name\n1,"a,b"\n'
+
+    def test_empty(self, capsys):
+        """Test no output for no rows"""
+        assert format_tsv(iter([])) == 0
+        assert capsys.readouterr().out == ''
+
+
+class TestResolveListFormat:
+    """Test automatic list format selection"""
+
+    def test_explicit_format_wins(self):
+        """Test an explicit format is kept"""
+        assert resolve_list_format('table') == 'table'
+
+    def test_pipe_defaults_to_tsv(self, monkeypatch):
+        """Test non-TTY stdout selects TSV"""
+        monkeypatch.setattr('sys.stdout.isatty', lambda: False)
+        assert resolve_list_format(None) == 'tsv'
+
+    def test_terminal_defaults_to_table(self, monkeypatch):
+        """Test TTY stdout selects the Rich table"""
+        monkeypatch.setattr('sys.stdout.isatty', lambda: True)
+        assert resolve_list_format(None) == 'table'
@@ -0,0 +1,148 @@
+"""Tests for inventory commands"""
+
+import json
+from unittest.mock import Mock, patch
+from click.testing import CliRunner
+from google.api_core import exceptions
+from ga_cli.cli import cli
+
+
+def _resource(name, display_name):
+    resource = Mock()
+    resource.name = name
+    resource.display_name = display_name
+    resource.region_code = 'US'
+    resource.create_time = None
+    resource.property_type.name = 'PROPERTY_TYPE_ORDINARY'
+    resource.time_zone = 'UTC'
+    resource.currency_code = 'USD'
+    resource.type_.name = 'WEB_DATA_STREAM'
+    resource.web_stream_data.measurement_id = f"G-{name.split('/')[-1]}"
+    resource.web_stream_data.default_uri = 'https://example.com'
+    return resource
+
+
+def _client(failing_property=None):
+    client = Mock()
+    client.list_accounts.return_value = [
+        _resource('accounts/1', 'One'), _resource('accounts/2', 'Two'),
+    ]
+
+    def list_properties(request=None, **kwargs):
+        account_id = request['filter'].split('/')[-1]
+        return [_resource(f"properties/{account_id}{i}", f"P{i}") for i in range(2)]
+
+    def list_data_streams(request=None, **kwargs):
+        property_id = request['parent'].split('/')[-1]
+        if property_id == failing_property:
+            raise exceptions.PermissionDenied('denied')
+        return [_resource(f"{request['parent']}/dataStreams/{property_id}9", 'Web')]
+
+    client.list_properties.side_effect = list_properties
+    client.list_data_streams.side_effect = list_data_streams
+    return client
+
+
+class _AsyncClient:
+    """Async facade over a sync test client, like the async GAPIC client"""
+
+    def __init__(self, client):
+        self._client = client
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+        return call
+
+
+def _records(output):
+    return [json.loads(line) for line in output.splitlines() if line.startswith('{')]
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_crawl_emits_every_level(mock_auth):
+    """Test crawl emits accounts, properties and streams with parent IDs"""
+    mock_auth.return_value.get_client.return_value = _client()
+
+    result = CliRunner().invoke(
+        cli, ['--credentials', '/tmp/creds.json', 'inventory', 'crawl', '--concurrency', '4'])
+
+    assert result.exit_code == 0
+    records = _records(result.output)
+    kinds = [r['kind'] for r in records]
+    assert kinds.count('account') == 2
+    assert kinds.count('property') == 4
+    assert kinds.count('data_stream') == 4
+
+    streams = {r['property_id']: r for r in records if r['kind'] == 'data_stream'}
+    assert streams['11']['account_id'] == '1'
+    assert streams['11']['measurement_id'] == 'G-119'
+    assert 'Crawled 2 accounts, 4 properties, 4 data streams' in result.output
+    assert '(7 RPCs, 0 retries)' in result.output
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_crawl_continues_past_failures(mock_auth):
+    """Test a failing listing is reported while the rest completes"""
+    mock_auth.return_value.get_client.return_value = _client(failing_property='20')
+
+    result = CliRunner().invoke(
+        cli, ['--credentials', '/tmp/creds.json', 'inventory', 'crawl'])
+
+    assert result.exit_code == 1
+    assert 'properties/20: Permission denied' in result.output
+    assert len([r for r in _records(result.output) if r['kind'] == 'data_stream']) == 3
+    assert '1 listings failed during the crawl' in result.output
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_crawl_single_worker(mock_auth):
+    """Test one worker completes the crawl, since tasks never wait on their children"""
+    mock_auth.return_value.get_client.return_value = _client()
+
+    result = CliRunner().invoke(
+        cli, ['--credentials', '/tmp/creds.json', 'inventory', 'crawl', '--concurrency', '1'])
+
+    assert result.exit_code == 0
+    assert 'Crawled 2 accounts, 4 properties, 4 data streams' in result.output
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_crawl_without_streams(mock_auth):
+    """Test --no-streams stops at properties"""
+    client = _client()
+    mock_auth.return_value.get_client.return_value = client
+
+    result = CliRunner().invoke(
+        cli, ['--credentials', '/tmp/creds.json', 'inventory', 'crawl', '--no-streams'])
+
+    assert result.exit_code == 0
+    assert 'data_stream' not in {r['kind'] for r in _records(result.output)}
+    client.list_data_streams.assert_not_called()
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_crawl_async_engine(mock_auth):
+    """Test the async engine produces the same inventory"""
+    client = _client(failing_property='20')
+    mock_auth.return_value.get_async_client.side_effect = lambda: _AsyncClient(client)
+
+    result = CliRunner().invoke(
+        cli, ['--credentials', '/tmp/creds.json', '--engine', 'async', 'inventory', 'crawl',
+              '--concurrency', '200'])
+
+    assert result.exit_code == 1
+    kinds = [r['kind'] for r in _records(result.output)]
+    assert kinds.count('account') == 2
+    assert kinds.count('property') == 4
+    assert kinds.count('data_stream') == 3
+    assert 'properties/20: Permission denied' in result.output
+    assert '(7 RPCs, 0 retries)' in result.output
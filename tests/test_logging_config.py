@@ -0,0 +1,119 @@
+"""Tests for logging configuration"""
+
+import json
+import logging
+import subprocess
+import sys
+import pytest
+from ga_cli import logging_config
+from ga_cli.config import ConfigManager
+from ga_cli.logging_config import JsonFormatter, SharedRotatingFileHandler, logger, setup_logging
+
+
+@pytest.fixture
+def fresh_logger(monkeypatch):
+    """Let setup_logging attach handlers, and detach them afterwards"""
+    monkeypatch.setattr(logging_config, '_configured', False)
+    monkeypatch.setattr(logging_config, '_listener', None)
+    handlers, level = list(logger.handlers), logger.level
+    logger.handlers.clear()
+    yield logger
+    logging_config._stop_listener()
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+
+
+def _record(message, level=logging.INFO):
+    return logging.LogRecord('ga_cli', level, __file__, 1, message, None, None)
+
+
+def test_import_attaches_no_handlers():
+    """Test importing the package does not open the log file"""
+    code = (
+        "import ga_cli.logging_config as c, ga_cli.commands.accounts; "
+        "print(len(c.logger.handlers))"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == '0'
+
+
+def test_json_formatter():
+    """Test JSON lines carry level, logger and message"""
+    entry = json.loads(JsonFormatter().format(_record('Found 3 accounts')))
+
+    assert entry['level'] == 'INFO'
+    assert entry['logger'] == 'ga_cli'
+    assert entry['message'] == 'Found 3 accounts'
+    assert entry['time'].endswith('+00:00')
+
+
+def test_rotation_by_another_handler_is_followed(tmp_path):
+    """Test a handler reopens the log file after another one rotated it"""
+    path = tmp_path / 'ga-cli.log'
+    first = SharedRotatingFileHandler(path, max_bytes=200, backup_count=2)
+    second = SharedRotatingFileHandler(path, max_bytes=200, backup_count=2)
+    try:
+        second.emit(_record('before rotation'))
+        for i in range(10):
+            first.emit(_record(f"filler line {i:02d} " + 'x' * 40))
+        second.emit(_record('after rotation'))
+    finally:
+        first.close()
+        second.close()
+
+    assert (tmp_path / 'ga-cli.log.1').exists()
+    assert 'after rotation' in path.read_text()
+
+
+def test_setup_logging_writes_through_queue(fresh_logger, isolated_home):
+    """Test records reach the log file once handlers are attached"""
+    setup_logging()
+    fresh_logger.info("Executing command: %s", 'accounts_list')
+    logging_config._stop_listener()
+
+    log_file = isolated_home / '.ga-cli' / 'ga-cli.log'
+    assert 'Executing command: accounts_list' in log_file.read_text()
+
+
+def test_setup_logging_json_format(fresh_logger, isolated_home):
+    """Test [logging] format = json switches the file to JSON lines"""
+    config_manager = ConfigManager()
+    config_manager.config['logging'] = {'format': 'json'}
+    config_manager.save()
+
+    setup_logging()
+    fresh_logger.warning("Retrying")
+    logging_config._stop_listener()
+
+    lines = (isolated_home / '.ga-cli' / 'ga-cli.log').read_text().splitlines()
+    assert json.loads(lines[-1])['message'] == 'Retrying'
+
+
+def test_log_level_flag_overrides_config(fresh_logger):
+    """Test --log-level wins over [logging] level"""
+    config_manager = ConfigManager()
+    config_manager.config['logging'] = {'level': 'error'}
+    config_manager.save()
+
+    setup_logging()
+    assert fresh_logger.level == logging.ERROR
+
+    setup_logging('debug')
+    assert fresh_logger.level == logging.DEBUG
+    assert len(fresh_logger.handlers) == 2
+
+
+def test_console_follows_stderr(fresh_logger, capsys):
+    """Test warnings go to the current sys.stderr, without info records"""
+    setup_logging('info')
+    fresh_logger.info("quiet")
+    fresh_logger.warning("loud")
+
+    err = capsys.readouterr().err
+    assert 'loud' in err
+    assert 'quiet' not in err
@@ -0,0 +1,49 @@
+"""Tests for manifest parsing"""
+
+import io
+import click
+import pytest
+from ga_cli.manifest import read_manifest
+
+
+def _file(text, name='<stdin>'):
+    file = io.StringIO(text)
+    file.name = name
+    return file
+
+
+def test_read_csv_manifest():
+    """Test CSV headers are normalised and blank rows skipped"""
+    records = read_manifest(_file('Account_ID, Name\n1, Site\n\n,\n2,Other\n'))
+
+    assert records == [
+        ('line 2', {'account_id': '1', 'name': 'Site'}),
+        ('line 5', {'account_id': '2', 'name': 'Other'}),
+    ]
+
+
+def test_read_json_manifest():
+    """Test a JSON array is read with record numbers"""
+    records = read_manifest(_file('[{"account_id": 1, "name": "Site", "industry": null}]'))
+
+    assert records == [('record 1', {'account_id': '1', 'name': 'Site', 'industry': ''})]
+
+
+def test_read_ndjson_manifest():
+    """Test one JSON object per line is read by line number"""
+    records = read_manifest(_file('{"name": "A"}\n\n{"name": "B"}\n'))
+
+    assert records == [('line 1', {'name': 'A'}), ('line 3', {'name': 'B'})]
+
+
+def test_extension_wins_over_content():
+    """Test a .csv file is parsed as CSV even if it starts like JSON"""
+    records = read_manifest(_file('{name}\nx\n', name='manifest.csv'))
+
+    assert records == [('line 2', {'{name}': 'x'})]
+
+
+def test_invalid_json_manifest():
+    """Test malformed JSON is reported as a bad parameter"""
+    with pytest.raises(click.BadParameter, match='array of objects'):
+        read_manifest(_file('{"a": 1}', name='manifest.json'))
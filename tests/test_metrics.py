@@ -0,0 +1,106 @@
+"""Tests for Prometheus textfile metrics"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+import pytest
+from click.testing import CliRunner
+from google.api_core import exceptions
+from ga_cli.cache import ResponseCache
+from ga_cli.cli import cli
+from ga_cli.config import ConfigManager
+from ga_cli.metrics import Metrics, metrics, render, sample_key
+
+
+@pytest.fixture
+def textfile(isolated_home):
+    """Switch metrics on in the config file and return the textfile"""
+    path = isolated_home / 'textfile' / 'ga_cli.prom'
+    config_manager = ConfigManager()
+    config_manager.config['metrics'] = {'textfile': str(path)}
+    config_manager.save()
+    yield path
+    metrics.enabled = False
+
+
+def _samples(path):
+    samples = {}
+    for line in path.read_text().splitlines():
+        if not line.startswith('#'):
+            key, value = line.rsplit(' ', 1)
+            samples[key] = float(value)
+    return samples
+
+
+def _invoke(args):
+    return CliRunner().invoke(cli, ['--credentials', '/tmp/creds.json', '--no-cache'] + args)
+
+
+def test_disabled_by_default(isolated_home):
+    """Test nothing is recorded or written without [metrics] textfile"""
+    m = Metrics()
+    m.configure()
+    m.record_rpc('get_account', 'OK', 0.1)
+    m.flush()
+
+    assert not m.enabled
+    assert m._samples == {}
+
+
+def test_render_orders_histogram_buckets():
+    """Test families get HELP/TYPE lines and buckets ascend to +Inf"""
+    name = 'ga_cli_rpc_duration_seconds_bucket'
+    totals = {
+        sample_key(name, rpc='get_account', le='+Inf'): 2,
+        sample_key(name, rpc='get_account', le='10'): 2,
+        sample_key(name, rpc='get_account', le='0.5'): 1,
+        sample_key('ga_cli_rpc_requests_total', rpc='get_account', status='OK'): 2,
+    }
+
+    lines = render(totals).splitlines()
+
+    assert lines[:3] == [
+        '# HELP ga_cli_rpc_requests_total Admin API requests sent, by RPC and status '
+        '(retried attempts included)',
+        '# TYPE ga_cli_rpc_requests_total counter',
+        'ga_cli_rpc_requests_total{rpc="get_account",status="OK"} 2',
+    ]
+    assert '# TYPE ga_cli_rpc_duration_seconds histogram' in lines
+    buckets = [line for line in lines if line.startswith(name)]
+    assert [b.split('le=')[1].split('}')[0] for b in buckets] == ['"0.5"', '"10"', '"+Inf"']
+
+
+@patch('ga_cli.retry.time.sleep')
+@patch('ga_cli.decorators.AuthManager')
+def test_counters_accumulate_across_runs(mock_auth, mock_sleep, textfile):
+    """Test requests, retries and latency add up over invocations"""
+    account = SimpleNamespace(name='accounts/1', display_name='A', region_code='US',
+                              create_time=None, update_time=None)
+    client = mock_auth.return_value.get_client.return_value
+    client.get_account.side_effect = [exceptions.ServiceUnavailable('down'), account, account]
+
+    assert _invoke(['accounts', 'get', '1', '--format', 'ids']).exit_code == 0
+    assert _invoke(['accounts', 'get', '1', '--format', 'ids']).exit_code == 0
+
+    samples = _samples(textfile)
+    assert samples['ga_cli_rpc_requests_total{rpc="get_account",status="OK"}'] == 2
+    assert samples['ga_cli_rpc_requests_total{rpc="get_account",status="ServiceUnavailable"}'] == 1
+    assert samples['ga_cli_rpc_retries_total{rpc="get_account"}'] == 1
+    assert samples['ga_cli_rpc_duration_seconds_count{rpc="get_account"}'] == 3
+    assert samples['ga_cli_rpc_duration_seconds_bucket{rpc="get_account",le="+Inf"}'] == 3
+    assert samples['ga_cli_last_run_timestamp_seconds'] > 0
+    assert [p.name for p in textfile.parent.iterdir()] == ['ga_cli.prom']
+
+
+def test_cache_lookups_are_counted(textfile, tmp_path):
+    """Test response cache misses and hits are counted by RPC"""
+    metrics.configure()
+    cache = ResponseCache(cache_dir=tmp_path / 'cache')
+    cache.configure(enabled=True)
+
+    assert cache.get('list_properties', '123') is None
+    metrics.record_cache('list_properties', True)
+    metrics.flush()
+
+    samples = _samples(textfile)
+    assert samples['ga_cli_cache_requests_total{rpc="list_properties",result="miss"}'] == 1
+    assert samples['ga_cli_cache_requests_total{rpc="list_properties",result="hit"}'] == 1
@@ -0,0 +1,114 @@
+"""Tests for page-by-page listing"""
+
+import json
+from unittest.mock import Mock, patch
+from click.testing import CliRunner
+from google.api_core import exceptions
+from ga_cli.cli import cli
+from ga_cli.formatters.json import format_json
+from ga_cli.pagination import first_page, iter_pages
+from ga_cli.commands.accounts import _list_accounts_page
+from ga_cli.commands.properties import _list_properties_with_retry
+
+
+def _account(i):
+    account = Mock()
+    account.name = f"accounts/{i}"
+    account.display_name = f"Account {i}"
+    account.region_code = "US"
+    account.create_time = None
+    return account
+
+
+class TestIterPages:
+    """Test iter_pages helper"""
+
+    def test_follows_page_tokens(self, paged_response):
+        """Test all pages are fetched in order"""
+        list_method = paged_response(list(range(5)), 'items', page_size=2)
+        fetch = Mock(side_effect=lambda token: first_page(
+            list_method(request={'page_token': token}), 'items'))
+
+        assert list(iter_pages(fetch, 'items')) == [0, 1, 2, 3, 4]
+        assert [c.args[0] for c in fetch.call_args_list] == ['', '1', '2']
+
+    def test_yields_before_later_pages_are_fetched(self, paged_response):
+        """Test items are produced as each page arrives"""
+        list_method = paged_response(list(range(4)), 'items', page_size=2)
+        fetch = Mock(side_effect=lambda token: first_page(
+            list_method(request={'page_token': token}), 'items'))
+
+        stream = iter_pages(fetch, 'items')
+        assert next(stream) == 0
+        assert fetch.call_count == 1
+
+    def test_plain_iterable_is_single_page(self):
+        """Test plain lists are treated as one final page"""
+        page = first_page([1, 2], 'items')
+        assert page.items == [1, 2]
+        assert page.next_page_token == ''
+
+
+@patch('ga_cli.retry.time.sleep')
+def test_transient_error_retries_only_failed_page(mock_sleep, paged_response):
+    """Test a failure on a later page resumes from that page's token"""
+    accounts = [_account(i) for i in range(6)]
+    list_method = paged_response(accounts, 'accounts', page_size=2)
+    calls = []
+
+    def flaky(request=None, **kwargs):
+        calls.append(request['page_token'])
+        if request['page_token'] == '2' and calls.count('2') == 1:
+            raise exceptions.ServiceUnavailable('blip')
+        return list_method(request=request)
+
+    client = Mock()
+    client.list_accounts.side_effect = flaky
+
+    page_fetch = lambda token: _list_accounts_page(client, token)  # noqa: E731
+    names = [a.name for a in iter_pages(page_fetch, 'accounts')]
+
+    assert names == [f"accounts/{i}" for i in range(6)]
+    assert calls == ['', '1', '2', '2']
+
+
+def test_list_properties_streams_all_pages(paged_response):
+    """Test properties listing walks every page with the account filter"""
+    client = Mock()
+    client.list_properties.side_effect = paged_response(list(range(5)), 'properties')
+
+    assert list(_list_properties_with_retry(client, '42')) == [0, 1, 2, 3, 4]
+    request = client.list_properties.call_args_list[0].kwargs['request']
+    assert request['filter'] == 'ancestor:accounts/42'
+
+
+class TestFormatJsonStreaming:
+    """Test incremental JSON output"""
+
+    def test_matches_indented_dump(self, capsys):
+        """Test streamed output equals json.dumps(indent=2)"""
+        rows = [{'id': '1', 'name': 'a'}, {'id': '2', 'name': 'b\nc'}]
+        count = format_json(iter(rows))
+
+        assert count == 2
+        assert capsys.readouterr().out == json.dumps(rows, indent=2) + '\n'
+
+    def test_empty_iterable(self, capsys):
+        """Test empty listings print an empty array"""
+        assert format_json(iter([])) == 0
+        assert capsys.readouterr().out == '[]\n'
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_accounts_list_json_across_pages(mock_auth, paged_response):
+    """Test accounts list emits every page as JSON"""
+    mock_client = Mock()
+    mock_client.list_accounts.side_effect = paged_response(
+        [_account(i) for i in range(5)], 'accounts')
+    mock_auth.return_value.get_client.return_value = mock_client
+
+    result = CliRunner().invoke(
+        cli, ['--credentials', '/tmp/creds.json', 'accounts', 'list', '--format', 'json'])
+
+    assert result.exit_code == 0
+    assert [row['id'] for row in json.loads(result.output)] == ['0', '1', '2', '3', '4']
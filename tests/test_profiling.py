@@ -0,0 +1,112 @@
+"""Tests for --profile timing"""
+
+import pstats
+import threading
+import pytest
+from click.testing import CliRunner
+from unittest.mock import patch
+from ga_cli.cli import cli
+from ga_cli.profiling import Profiler, profiler
+
+
+@pytest.fixture(autouse=True)
+def profiler_off():
+    """Leave the process-wide profiler switched off after each test"""
+    yield
+    profiler.configure()
+
+
+def test_disabled_phase_is_a_no_op():
+    """Test nothing is recorded until the profiler is configured"""
+    p = Profiler()
+    with p.phase('rpc', 'list_accounts'):
+        pass
+
+    assert p.phases == {}
+
+
+def test_nested_phases_count_self_time():
+    """Test an outer phase excludes the time of phases nested in it"""
+    p = Profiler()
+    p.configure(enabled=True)
+    clock = iter([0.0, 1.0, 3.0, 4.0])
+    with patch('ga_cli.profiling.time.perf_counter', lambda: next(clock)):
+        with p.phase('output'):
+            with p.phase('rpc', 'list_accounts'):
+                pass
+
+    assert p.phases['output'] == (1, 2.0)
+    assert p.phases['rpc'] == (1, 2.0)
+    assert p.details[('rpc', 'list_accounts')] == (1, 2.0, 2.0)
+
+
+def test_worker_thread_phases_are_marked_concurrent():
+    """Test phases timed off the main thread are not added to the total"""
+    p = Profiler()
+    p.configure(enabled=True)
+
+    def work():
+        with p.phase('rpc', 'list_properties'):
+            pass
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    thread.join()
+
+    lines = p.summary(wall=1.0)
+    assert 'rpc' in p.concurrent
+    assert any(line.strip().startswith('rpc *') for line in lines)
+
+
+def test_startup_only_reported_for_first_run():
+    """Test later commands of a shell or daemon do not report start-up"""
+    p = Profiler()
+    p.configure(enabled=True, startup=0.5)
+    assert p.startup == 0.5
+
+    p.configure(enabled=True, startup=9.0)
+    assert p.startup is None
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_profile_flag_prints_phases(mock_auth, mock_credentials_path, paged_response):
+    """Test --profile reports auth, RPC pages and output on stderr"""
+    accounts = [type('Account', (), {'name': f"accounts/{i}", 'display_name': f"A{i}",
+                                     'region_code': 'US', 'create_time': None})()
+                for i in range(3)]
+    client = mock_auth.return_value.get_client.return_value
+    client.list_accounts.side_effect = paged_response(accounts, 'accounts')
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        '--credentials', mock_credentials_path, '--profile', 'accounts', 'list', '--format', 'ids',
+    ])
+
+    assert result.exit_code == 0
+    assert result.stdout.split() == ['0', '1', '2']
+    report = result.stderr
+    assert 'Profile:' in report
+    for phase in ('config', 'auth', 'rpc', 'output', 'other'):
+        assert phase in report
+    assert any(line.split()[:2] == ['list_accounts', '2'] for line in report.splitlines())
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_profile_out_writes_dump_and_allocations(mock_auth, mock_credentials_path,
+                                                 paged_response, tmp_path):
+    """Test --profile-out writes a loadable cProfile dump and an allocation report"""
+    client = mock_auth.return_value.get_client.return_value
+    client.list_accounts.side_effect = paged_response([], 'accounts')
+    output = tmp_path / 'run.prof'
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        '--credentials', mock_credentials_path, '--profile-out', str(output),
+        'accounts', 'list', '--format', 'ids',
+    ])
+
+    assert result.exit_code == 0
+    assert pstats.Stats(str(output)).total_calls > 0
+    report = (tmp_path / 'run.prof.alloc.txt').read_text()
+    assert report.startswith('Traced memory:')
+    assert '#1' in report
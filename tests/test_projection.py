@@ -0,0 +1,61 @@
+"""Tests for field projections"""
+
+from unittest.mock import Mock
+import click
+import pytest
+from ga_cli.projection import (
+    Projection, as_dict, is_row, parse_fields, resource_id, row_builder, timestamp,
+)
+
+
+def test_projection_only_computes_requested_fields():
+    """Test extractors of fields that were not requested never run"""
+    expensive = Mock(return_value='x')
+    extractors = {'id': lambda r: r['id'], 'name': lambda r: r['name'], 'slow': expensive}
+
+    project = Projection(extractors, ('name', 'id'))
+
+    row = project({'id': '1', 'name': 'One'})
+    assert row == ('One', '1')
+    assert row._asdict() == {'name': 'One', 'id': '1'}
+    expensive.assert_not_called()
+
+
+def test_projection_rejects_unknown_fields():
+    """Test unknown fields are reported with the available ones"""
+    with pytest.raises(click.BadParameter, match='unknown field colour.*id, name'):
+        Projection({'id': str, 'name': str}, ('id', 'colour'))
+
+
+def test_parse_fields():
+    """Test --fields is split, trimmed and de-duplicated"""
+    assert parse_fields(None, None, ' id, name,,id ') == ('id', 'name')
+    assert parse_fields(None, None, None) is None
+    with pytest.raises(click.BadParameter):
+        parse_fields(None, None, ' , ')
+
+
+def test_row_builder():
+    """Test the ids format projects the ID and no fields keeps the default"""
+    extractors = {'id': lambda r: r['id'], 'name': lambda r: r['name']}
+    default = Mock()
+
+    assert row_builder(extractors, ('name',), 'ids', default)({'id': '1', 'name': 'a'}).id == '1'
+    assert row_builder(extractors, None, 'json', default) is default
+
+
+def test_helpers():
+    """Test resource name and timestamp rendering"""
+    assert resource_id('properties/1/dataStreams/2') == '2'
+    assert resource_id('123') == '123'
+    assert timestamp('2023-01-01 00:00:00.123456') == '2023-01-01 00:00:00'
+    assert timestamp(None) == 'N/A'
+
+
+def test_as_dict():
+    """Test rows convert to dicts and dicts pass through"""
+    row = Projection({'id': lambda r: r}, ('id',))('7')
+
+    assert is_row(row) and not is_row({'id': '7'}) and not is_row(('7',))
+    assert as_dict(row) == {'id': '7'}
+    assert as_dict({'id': '7'}) == {'id': '7'}
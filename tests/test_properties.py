@@ -0,0 +1,361 @@
+"""Tests for property commands"""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+from click.testing import CliRunner
+from google.api_core import exceptions
+from ga_cli.cli import cli
+
+
+def _property(property_id, name):
+    prop = Mock()
+    prop.name = f"properties/{property_id}"
+    prop.display_name = name
+    prop.property_type.name = "PROPERTY_TYPE_ORDINARY"
+    prop.time_zone = "UTC"
+    prop.currency_code = "USD"
+    return prop
+
+
+def _account(account_id):
+    account = Mock()
+    account.name = f"accounts/{account_id}"
+    return account
+
+
+def _properties_by_account(request=None, **kwargs):
+    account_id = request['filter'].split('/')[-1]
+    if account_id == '2':
+        raise exceptions.PermissionDenied('no access')
+    return [_property(f"{account_id}0{i}", f"Prop {i}") for i in range(2)]
+
+
+def _invoke(args, input=None):
+    return CliRunner().invoke(cli, ['--credentials', '/tmp/creds.json'] + args, input=input)
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_list_single_account(mock_auth):
+    """Test properties list for one account"""
+    client = mock_auth.return_value.get_client.return_value
+    client.list_properties.return_value = [_property('987654', 'Test Property')]
+
+    result = _invoke(['properties', 'list', '123', '--format', 'json'])
+
+    assert result.exit_code == 0
+    assert json.loads(result.output)[0]['id'] == '987654'
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_list_all_accounts(mock_auth):
+    """Test --all-accounts merges results in account order"""
+    client = mock_auth.return_value.get_client.return_value
+    client.list_accounts.return_value = [_account('1'), _account('3')]
+    client.list_properties.side_effect = _properties_by_account
+
+    result = _invoke(['properties', 'list', '--all-accounts', '--format', 'ndjson'])
+
+    assert result.exit_code == 0
+    rows = [json.loads(line) for line in result.output.splitlines()]
+    assert [(r['account'], r['id']) for r in rows] == [
+        ('1', '100'), ('1', '101'), ('3', '300'), ('3', '301'),
+    ]
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_list_fields(mock_auth):
+    """Test --fields selects and orders the columns"""
+    client = mock_auth.return_value.get_client.return_value
+    client.list_accounts.return_value = [_account('1')]
+    client.list_properties.side_effect = _properties_by_account
+
+    result = _invoke([
+        'properties', 'list', '--all-accounts', '--fields', 'name,id', '--format', 'tsv'
+    ])
+
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ['name\tid', 'Prop 0\t100', 'Prop 1\t101']
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_get_fields(mock_auth):
+    """Test get honors --fields"""
+    client = mock_auth.return_value.get_client.return_value
+    client.get_property.return_value = _property('987654', 'Test Property')
+
+    result = _invoke(['properties', 'get', '987654', '--fields', 'id,currency', '--format', 'json'])
+
+    assert result.exit_code == 0
+    assert json.loads(result.output) == {'id': '987654', 'currency': 'USD'}
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_list_reports_failed_accounts(mock_auth):
+    """Test a failing account is reported without aborting the others"""
+    client = mock_auth.return_value.get_client.return_value
+    client.list_properties.side_effect = _properties_by_account
+
+    result = _invoke(
+        ['properties', 'list', '--accounts-from', '-', '--format', 'ndjson', '--concurrency', '2'],
+        input='1\n# comment\naccounts/2\n\n3\n',
+    )
+
+    assert result.exit_code == 1
+    assert 'Account 2: Permission denied' in result.output
+    assert 'Failed to list properties for 1 of 3 accounts' in result.output
+    accounts = [json.loads(line)['account'] for line in result.output.splitlines()
+                if line.startswith('{')]
+    assert accounts == ['1', '1', '3', '3']
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_list_requires_one_source(mock_auth):
+    """Test account sources are mutually exclusive"""
+    result = _invoke(['properties', 'list', '123', '--all-accounts'])
+
+    assert result.exit_code == 2
+    assert 'Specify exactly one of' in result.output
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_list_async_engine(mock_auth):
+    """Test the async engine keeps account order and per-account failures"""
+    client = AsyncMock()
+    client.list_properties.side_effect = _properties_by_account
+    mock_auth.return_value.get_async_client.return_value = client
+
+    result = _invoke(
+        ['--engine', 'async', 'properties', 'list', '--accounts-from', '-',
+         '--format', 'ndjson', '--concurrency', '100'],
+        input='3\n2\n1\n',
+    )
+
+    assert result.exit_code == 1
+    assert 'Account 2: Permission denied' in result.output
+    accounts = [json.loads(line)['account'] for line in result.output.splitlines()
+                if line.startswith('{')]
+    assert accounts == ['3', '3', '1', '1']
+
+
+def _created(property=None, request=None, **kwargs):
+    prop = _property(f"9{property.display_name[-1]}", property.display_name)
+    if property.display_name == 'Fail 3':
+        raise exceptions.PermissionDenied('no access')
+    return prop
+
+
+MANIFEST = (
+    'account_id,name,timezone,currency\n'
+    '1,Site 1,Europe/Berlin,EUR\n'
+    '2,Site 2,,\n'
+    '1,Fail 3,UTC,USD\n'
+    '3,Site 4,UTC,GBP\n'
+)
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_create_from_manifest(mock_auth):
+    """Test every manifest row is created and reported as NDJSON"""
+    client = mock_auth.return_value.get_client.return_value
+    client.create_property.side_effect = _created
+
+    result = _invoke(
+        ['properties', 'create', '--from-file', '-', '--concurrency', '4'],
+        input=MANIFEST.replace('Fail 3', 'Site 3'),
+    )
+
+    assert result.exit_code == 0
+    rows = [json.loads(line) for line in result.output.splitlines() if line.startswith('{')]
+    assert [(r['row'], r['status'], r['property_id']) for r in rows] == [
+        ('line 2', 'created', '91'), ('line 3', 'created', '92'),
+        ('line 4', 'created', '93'), ('line 5', 'created', '94'),
+    ]
+    assert 'Created 4 of 4 properties' in result.output
+    defaulted = [c.kwargs['property'] for c in client.create_property.call_args_list
+                 if c.kwargs['property'].display_name == 'Site 2'][0]
+    assert defaulted.time_zone == 'America/Los_Angeles'
+    assert defaulted.currency_code == 'USD'
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_create_manifest_validated_up_front(mock_auth):
+    """Test an invalid manifest creates nothing and lists every problem"""
+    client = mock_auth.return_value.get_client.return_value
+
+    result = _invoke(
+        ['properties', 'create', '--from-file', '-'],
+        input='account_id,name,currency,industry\nabc,Site,USD,\n1,,usd,ROCKETS\n',
+    )
+
+    assert result.exit_code == 1
+    assert 'line 2: Account ID must be numeric' in result.output
+    assert 'line 3: missing name' in result.output
+    assert 'line 3: Currency must be 3-letter code' in result.output
+    assert 'line 3: Invalid industry category: ROCKETS' in result.output
+    assert 'no properties were created' in result.output
+    client.create_property.assert_not_called()
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_create_manifest_stops_on_error(mock_auth):
+    """Test rows not yet started are skipped after a failure"""
+    client = mock_auth.return_value.get_client.return_value
+    client.create_property.side_effect = _created
+
+    result = _invoke(
+        ['properties', 'create', '--from-file', '-', '--concurrency', '1'], input=MANIFEST)
+
+    assert result.exit_code == 1
+    statuses = [json.loads(line)['status'] for line in result.output.splitlines()
+                if line.startswith('{')]
+    assert statuses == ['created', 'created', 'failed', 'skipped']
+    assert '1 of 4 properties failed to create, 1 skipped' in result.output
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_create_manifest_continue_on_error(mock_auth):
+    """Test --continue-on-error creates the rows after a failure"""
+    client = mock_auth.return_value.get_client.return_value
+    client.create_property.side_effect = _created
+
+    result = _invoke(
+        ['properties', 'create', '--from-file', '-', '--concurrency', '1',
+         '--continue-on-error'],
+        input=MANIFEST,
+    )
+
+    assert result.exit_code == 1
+    assert 'Permission denied' in result.output
+    statuses = [json.loads(line)['status'] for line in result.output.splitlines()
+                if line.startswith('{')]
+    assert statuses == ['created', 'created', 'failed', 'created']
+    assert '1 of 4 properties failed to create' in result.output
+
+
+@patch('ga_cli.retry.time.sleep')
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_create_manifest_retries_only_rejected_rows(mock_auth, mock_sleep):
+    """Test bulk creates retry quota errors but never resend after an internal error"""
+    client = mock_auth.return_value.get_client.return_value
+    attempts = {}
+
+    def created(property=None, **kwargs):
+        name = property.display_name
+        attempts[name] = attempts.get(name, 0) + 1
+        if name == 'Site 1' and attempts[name] == 1:
+            raise exceptions.ResourceExhausted('quota')
+        if name == 'Site 2':
+            raise exceptions.InternalServerError('internal')
+        return _property(f"9{name[-1]}", name)
+
+    client.create_property.side_effect = created
+
+    result = _invoke(
+        ['properties', 'create', '--from-file', '-', '--concurrency', '2',
+         '--continue-on-error'],
+        input='account_id,name\n1,Site 1\n1,Site 2\n',
+    )
+
+    assert result.exit_code == 1
+    assert attempts == {'Site 1': 2, 'Site 2': 1}
+    statuses = [json.loads(line)['status'] for line in result.output.splitlines()
+                if line.startswith('{')]
+    assert statuses == ['created', 'failed']
+
+
+@patch('ga_cli.retry.time.sleep')
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_create_not_resent_after_timeout(mock_auth, mock_sleep):
+    """Test a create that timed out is not sent again, since it may have been applied"""
+    client = mock_auth.return_value.get_client.return_value
+    client.create_property.side_effect = exceptions.DeadlineExceeded('deadline')
+
+    result = _invoke(['properties', 'create', '123', '--name', 'Site'])
+
+    assert result.exit_code == 1
+    client.create_property.assert_called_once()
+    assert 'timeout' not in client.create_property.call_args.kwargs
+    mock_sleep.assert_not_called()
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_delete_single(mock_auth):
+    """Test deleting one property keeps the original prompt and message"""
+    client = mock_auth.return_value.get_client.return_value
+
+    result = _invoke(['properties', 'delete', '123'], input='y\n')
+
+    assert result.exit_code == 0
+    assert 'Are you sure you want to delete this property?' in result.output
+    assert 'Property 123 deleted successfully' in result.output
+    client.delete_property.assert_called_once_with(name='properties/123')
+    client.get_property.assert_not_called()
+
+
+def _get_property(name=None, **kwargs):
+    property_id = name.split('/')[-1]
+    if property_id == '404':
+        raise exceptions.NotFound('missing')
+    return _property(property_id, f"Site {property_id}")
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_delete_many_confirms_once(mock_auth):
+    """Test a consolidated plan is confirmed once and deleted per ID"""
+    client = mock_auth.return_value.get_client.return_value
+    client.get_property.side_effect = _get_property
+
+    result = _invoke(
+        ['properties', 'delete', '1', 'properties/2', '404', '--concurrency', '2'], input='y\n')
+
+    assert result.exit_code == 1
+    assert '2 properties will be deleted:' in result.output
+    assert '  2  Site 2' in result.output
+    assert result.output.count('Delete 2 properties?') == 1
+    rows = [json.loads(line) for line in result.output.splitlines() if line.startswith('{')]
+    assert {r['property_id']: r['status'] for r in rows} == {
+        '1': 'deleted', '2': 'deleted', '404': 'failed',
+    }
+    assert client.delete_property.call_count == 2
+    assert '1 of 3 properties failed to delete' in result.output
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_delete_from_file_dry_run(mock_auth):
+    """Test --dry-run shows the plan without deleting"""
+    client = mock_auth.return_value.get_client.return_value
+    client.get_property.side_effect = _get_property
+
+    result = _invoke(
+        ['properties', 'delete', '--from-file', '-', '--dry-run'],
+        input='# decommission\n7\nproperties/8\n7\n',
+    )
+
+    assert result.exit_code == 0
+    assert '2 properties will be deleted:' in result.output
+    assert 'Dry run: nothing was deleted' in result.output
+    client.delete_property.assert_not_called()
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_delete_from_stdin_requires_yes(mock_auth):
+    """Test deleting IDs read from stdin needs --yes, as stdin cannot confirm"""
+    client = mock_auth.return_value.get_client.return_value
+    client.get_property.side_effect = _get_property
+
+    refused = _invoke(['properties', 'delete', '--from-file', '-'], input='7\n8\n')
+    result = _invoke(['properties', 'delete', '--from-file', '-', '--yes'], input='7\n8\n')
+
+    assert refused.exit_code == 2
+    assert '--yes is required' in refused.output
+    assert result.exit_code == 0
+    assert client.delete_property.call_count == 2
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_properties_delete_requires_ids(mock_auth):
+    """Test delete without IDs is a usage error"""
+    result = _invoke(['properties', 'delete'])
+
+    assert result.exit_code == 2
+    assert 'Specify PROPERTY_IDS or --from-file' in result.output
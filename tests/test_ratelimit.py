@@ -0,0 +1,118 @@
+"""Tests for the client-side rate limiter"""
+
+import multiprocessing
+from unittest.mock import patch
+import pytest
+from ga_cli.config import ConfigManager
+from ga_cli.ratelimit import RateLimiter, rate_limiter
+from ga_cli.retry import retry_on_transient_error
+
+
+@pytest.fixture
+def limiter(tmp_path):
+    return RateLimiter(state_path=tmp_path / 'ratelimit.json')
+
+
+def test_disabled_by_default(limiter):
+    """Test no limits are applied and no state is written without config"""
+    for _ in range(100):
+        assert limiter.try_acquire() == 0
+    assert not limiter.state_path.exists()
+
+
+def test_configured_from_config_file():
+    """Test budgets are read from the [rate_limit] section"""
+    config_manager = ConfigManager()
+    config_manager.config['rate_limit'] = {'per_minute': '120', 'per_day': 'lots'}
+    config_manager.save()
+
+    limiter = RateLimiter()
+    limiter.configure()
+
+    assert limiter._limits == {'minute': 120.0}
+
+
+def test_minute_budget_allows_burst_then_waits(limiter):
+    """Test a full bucket admits its budget, then asks to wait for a refill"""
+    limiter.configure(per_minute=60)
+
+    with patch('ga_cli.ratelimit.time.time', return_value=1000.0):
+        assert all(limiter.try_acquire() == 0 for _ in range(60))
+        assert limiter.try_acquire() == pytest.approx(1.0)
+
+    with patch('ga_cli.ratelimit.time.time', return_value=1001.0):
+        assert limiter.try_acquire() == 0
+        assert limiter.try_acquire() > 0
+
+
+def test_day_budget_caps_the_wait(limiter):
+    """Test long waits are split so the shared state is re-checked"""
+    limiter.configure(per_day=1)
+
+    with patch('ga_cli.ratelimit.time.time', return_value=1000.0):
+        assert limiter.try_acquire() == 0
+        assert limiter.try_acquire() == 5.0
+
+
+def test_state_is_shared_through_the_file(tmp_path):
+    """Test two limiters on the same file draw from one budget"""
+    first = RateLimiter(state_path=tmp_path / 'ratelimit.json')
+    second = RateLimiter(state_path=tmp_path / 'ratelimit.json')
+    first.configure(per_minute=2)
+    second.configure(per_minute=2)
+
+    with patch('ga_cli.ratelimit.time.time', return_value=1000.0):
+        assert first.try_acquire() == 0
+        assert second.try_acquire() == 0
+        assert first.try_acquire() > 0
+    assert oct(first.state_path.stat().st_mode & 0o777) == '0o600'
+
+
+def _take_tokens(path, count, results):
+    limiter = RateLimiter(state_path=path)
+    limiter.configure(per_minute=50)
+    results.put(sum(1 for _ in range(count) if limiter.try_acquire() == 0))
+
+
+def test_budget_is_shared_across_processes(tmp_path):
+    """Test concurrent processes never exceed the shared budget"""
+    path = tmp_path / 'ratelimit.json'
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=_take_tokens, args=(path, 40, results)) for _ in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    granted = sum(results.get() for _ in processes)
+    # 50 tokens, plus whatever refilled (~0.83/s) while the processes ran
+    assert 50 <= granted <= 52
+
+
+def test_retry_takes_a_token_per_attempt():
+    """Test every attempt, including retries, is paced by the limiter"""
+    from google.api_core import exceptions
+
+    attempts = []
+
+    @retry_on_transient_error(max_retries=3, backoff_factor=0)
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise exceptions.ServiceUnavailable('unavailable')
+        return 'ok'
+
+    with patch.object(rate_limiter, 'acquire') as acquire:
+        assert flaky() == 'ok'
+    assert acquire.call_count == 3
+
+
+def test_acquire_sleeps_until_granted(limiter):
+    """Test acquire blocks for the advised wait"""
+    with patch.object(limiter, 'try_acquire', side_effect=[0.5, 0.25, 0]), \
+            patch('ga_cli.ratelimit.time.sleep') as sleep:
+        limiter.acquire()
+
+    assert [c.args[0] for c in sleep.call_args_list] == [0.5, 0.25]
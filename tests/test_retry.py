@@ -0,0 +1,134 @@
+"""Tests for the retry policy"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+import pytest
+from google.api_core import exceptions
+from ga_cli.config import ConfigManager
+from ga_cli.retry import RetryPolicy, retry_on_transient_error, server_retry_delay
+from ga_cli.stats import rpc_stats
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    rpc_stats.reset()
+    yield
+    rpc_stats.reset()
+
+
+def _quota_error(retry_seconds=None):
+    details = []
+    if retry_seconds is not None:
+        details.append(SimpleNamespace(retry_delay=SimpleNamespace(seconds=retry_seconds, nanos=0)))
+    return exceptions.ResourceExhausted('quota', details=details)
+
+
+def test_full_jitter_stays_below_capped_bound():
+    """Test regular delays are drawn below min(max_delay, factor ** attempt)"""
+    policy = RetryPolicy(backoff_factor=2, max_delay=5)
+    error = exceptions.ServiceUnavailable('unavailable')
+
+    with patch('ga_cli.retry.random.uniform', side_effect=lambda low, high: high) as uniform:
+        assert policy.delay(1, error) == 2
+        assert policy.delay(2, error) == 4
+        assert policy.delay(5, error) == 5
+    assert all(c.args[0] == 0 for c in uniform.call_args_list)
+
+
+def test_quota_error_waits_longer():
+    """Test quota errors wait at least half the quota backoff bound"""
+    policy = RetryPolicy(quota_delay=10, quota_max_delay=60)
+
+    delays = [policy.delay(1, _quota_error()) for _ in range(50)]
+
+    assert all(5 <= d <= 10 for d in delays)
+    assert policy.delay(4, _quota_error()) >= 30
+
+
+def test_quota_error_honors_server_retry_delay():
+    """Test the RetryInfo delay sent by the server is a lower bound"""
+    policy = RetryPolicy()
+    error = _quota_error(retry_seconds=7)
+
+    assert server_retry_delay(error) == 7
+    assert all(7 <= policy.delay(1, error) <= 10.5 for _ in range(50))
+
+
+@patch('ga_cli.retry.time.sleep')
+def test_quota_errors_are_retried(mock_sleep):
+    """Test ResourceExhausted is retried instead of failing at once"""
+    attempts = []
+
+    @retry_on_transient_error()
+    def _list_things_page():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise _quota_error(retry_seconds=1)
+        return 'ok'
+
+    assert _list_things_page() == 'ok'
+    assert mock_sleep.call_args.args[0] >= 1
+    assert rpc_stats.retry_snapshot() == {'list_things': 1}
+    assert rpc_stats.snapshot() == {'list_things': 2}
+
+
+@patch('ga_cli.retry.time.sleep')
+def test_deadline_stops_retrying(mock_sleep):
+    """Test a retry that would overrun the time budget is not attempted"""
+    attempts = []
+    policy = RetryPolicy(max_retries=10, deadline=5, quota_delay=10)
+
+    @retry_on_transient_error(policy=policy)
+    def exhausted():
+        attempts.append(1)
+        raise _quota_error()
+
+    with pytest.raises(exceptions.ResourceExhausted):
+        exhausted()
+    assert len(attempts) == 1
+    mock_sleep.assert_not_called()
+
+
+@patch('ga_cli.retry.time.sleep')
+def test_max_retries_counts_attempts(mock_sleep):
+    """Test max_retries bounds the total number of attempts"""
+    attempts = []
+
+    @retry_on_transient_error(max_retries=3)
+    def unavailable():
+        attempts.append(1)
+        raise exceptions.ServiceUnavailable('unavailable')
+
+    with pytest.raises(exceptions.ServiceUnavailable):
+        unavailable()
+    assert len(attempts) == 3
+    assert mock_sleep.call_count == 2
+    assert rpc_stats.total_retries() == 2
+
+
+def test_permanent_errors_are_not_retried():
+    """Test non-retryable errors propagate on the first attempt"""
+    attempts = []
+
+    @retry_on_transient_error()
+    def denied():
+        attempts.append(1)
+        raise exceptions.PermissionDenied('denied')
+
+    with pytest.raises(exceptions.PermissionDenied):
+        denied()
+    assert len(attempts) == 1
+
+
+def test_configured_from_config_file():
+    """Test settings are read from the [retry] section"""
+    config_manager = ConfigManager()
+    config_manager.config['retry'] = {'max_retries': '5', 'deadline': '0', 'max_delay': 'soon'}
+    config_manager.save()
+
+    policy = RetryPolicy()
+    policy.configure()
+
+    assert policy.max_retries == 5
+    assert policy.deadline == 0
+    assert policy.max_delay == 30.0
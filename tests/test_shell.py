@@ -0,0 +1,131 @@
+"""Tests for the interactive shell and batch scripts"""
+
+import json
+import pytest
+from unittest.mock import Mock, patch
+from click.testing import CliRunner
+from ga_cli.cache import response_cache
+from ga_cli.cli import cli
+from ga_cli.commands.shell import _batches, is_mutating, parse_line
+
+
+@pytest.fixture(autouse=True)
+def no_memory_cache():
+    """Sessions switch on the process-wide memory tier; reset it afterwards"""
+    yield
+    response_cache._memory = None
+
+
+@pytest.fixture
+def auth(mock_property):
+    """AuthManager double shared by the session warm-up and with_client"""
+    client = Mock()
+    client.list_properties.return_value = [mock_property]
+    client.get_property.return_value = mock_property
+    auth_class = Mock()
+    auth_class.return_value.get_client.return_value = client
+    with patch('ga_cli.decorators.AuthManager', auth_class), \
+            patch('ga_cli.auth.AuthManager', auth_class):
+        yield auth_class
+
+
+def test_parse_line():
+    """Test comments, quoting and the optional program name"""
+    assert parse_line('  # just a comment') == []
+    assert parse_line('ga-cli properties create 1 --name "My Site"  # new') == [
+        'properties', 'create', '1', '--name', 'My Site',
+    ]
+
+
+def test_parse_line_rejects_nested_sessions():
+    """Test shell, run and daemon cannot run inside a session"""
+    with pytest.raises(Exception, match='cannot run inside'):
+        parse_line('shell')
+    with pytest.raises(Exception, match="'run' cannot run inside"):
+        parse_line('ga-cli --no-cache --timeout 5 run other.txt')
+
+
+def test_mutating_lines_run_alone():
+    """Test create/delete lines split the parallel batches"""
+    lines = [(1, ['accounts', 'list']), (2, ['properties', 'list', '1']),
+             (3, ['properties', 'delete', '9', '--yes']), (4, ['accounts', 'list'])]
+
+    assert is_mutating(lines[2][1])
+    assert [[n for n, _ in batch] for batch in _batches(lines, 4)] == [[1, 2], [3], [4]]
+    assert len(list(_batches(lines, 1))) == 4
+
+
+def test_run_reuses_one_client(auth, tmp_path, mock_credentials_path):
+    """Test every line of a script shares a single AuthManager"""
+    script = tmp_path / 'script.txt'
+    script.write_text('properties list 1 --format ndjson\nproperties get 2 --format json\n')
+
+    result = CliRunner().invoke(cli, ['--credentials', mock_credentials_path, 'run', str(script)])
+
+    assert result.exit_code == 0, result.output
+    assert auth.call_count == 1
+    assert result.output.count('Test Property') == 2
+
+
+def test_run_parallel_keeps_script_order(auth, tmp_path, mock_credentials_path):
+    """Test parallel lines print their output in script order"""
+    script = tmp_path / 'script.txt'
+    script.write_text(''.join(f'properties list {i} --format ndjson\n' for i in range(1, 7)))
+
+    result = CliRunner().invoke(
+        cli, ['--credentials', mock_credentials_path, '--no-cache', 'run', '--parallel', '4',
+              str(script)]
+    )
+
+    assert result.exit_code == 0, result.output
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert [r['name'] for r in records] == ['Test Property'] * 6
+    assert auth.return_value.get_client.return_value.list_properties.call_count == 6
+
+
+def test_run_parallel_rejects_per_line_global_options(tmp_path):
+    """Test parallel lines cannot change the settings they share"""
+    script = tmp_path / 'script.txt'
+    script.write_text('accounts list\n--no-cache properties list 1\n')
+
+    result = CliRunner().invoke(cli, ['run', '--parallel', '2', str(script)])
+
+    assert result.exit_code == 2
+    assert 'line 2: global options such as --no-cache' in result.output
+
+
+@patch('ga_cli.cli.response_cache')
+def test_run_parallel_configures_settings_once(mock_cache, auth, tmp_path, mock_credentials_path):
+    """Test concurrent lines do not reconfigure the process-wide singletons"""
+    script = tmp_path / 'script.txt'
+    script.write_text(''.join(f'properties list {i} --format ids\n' for i in range(1, 5)))
+
+    result = CliRunner().invoke(
+        cli, ['--credentials', mock_credentials_path, 'run', '--parallel', '4', str(script)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert mock_cache.configure.call_count == 1
+
+
+def test_run_stops_at_first_failure(tmp_path):
+    """Test a failing line stops the script unless --keep-going is given"""
+    script = tmp_path / 'script.txt'
+    script.write_text('no-such-command\n--version\n')
+
+    result = CliRunner().invoke(cli, ['run', str(script)])
+    assert result.exit_code == 1
+    assert 'Stopped at line 1' in result.output
+    assert 'version' not in result.output
+
+    result = CliRunner().invoke(cli, ['run', '--keep-going', str(script)])
+    assert 'version' in result.output
+    assert '1 of 2 commands failed' in result.output
+
+
+def test_shell_reads_commands_until_exit():
+    """Test the shell runs each line and stops at exit"""
+    result = CliRunner().invoke(cli, ['shell'], input='--version\nexit\n--version\n')
+
+    assert result.exit_code == 0
+    assert result.output.count('version') == 1
@@ -0,0 +1,135 @@
+"""Tests for the on-disk access token cache"""
+
+import datetime
+import multiprocessing
+import time
+from unittest.mock import Mock, patch
+from ga_cli.auth import ADMIN_SCOPES, AuthManager
+from ga_cli.config import ConfigManager
+from ga_cli.token_cache import (
+    CachedTokenCredentials, TokenCache, cache_key, token_cache_enabled, with_token_cache,
+)
+
+
+def _inner(token='fresh-token', lifetime=3600):
+    """Credentials double whose refresh mints a token"""
+    inner = Mock()
+
+    def refresh(request):
+        inner.token = token
+        inner.expiry = datetime.datetime.utcnow() + datetime.timedelta(seconds=lifetime)
+    inner.refresh.side_effect = refresh
+    return inner
+
+
+def test_disabled_by_default():
+    """Test the cache is opt-in"""
+    assert not token_cache_enabled()
+
+
+def test_key_depends_on_path_and_scopes():
+    """Test entries are not shared across credentials or scopes"""
+    assert cache_key('/a.json', ['x', 'y']) == cache_key('/a.json', ['y', 'x'])
+    assert cache_key('/a.json', ['x']) != cache_key('/b.json', ['x'])
+    assert cache_key('/a.json', ['x']) != cache_key('/a.json', ['y'])
+
+
+def test_refresh_stores_token(tmp_path):
+    """Test a refresh writes the token to a private cache file"""
+    cache = TokenCache(tmp_path / 'tokens.json')
+    inner = _inner()
+
+    credentials = CachedTokenCredentials(inner, 'key', cache=cache)
+    credentials.refresh(Mock())
+
+    assert credentials.token == 'fresh-token'
+    assert credentials.valid
+    assert oct(cache.path.stat().st_mode & 0o777) == '0o600'
+
+
+def test_fresh_token_is_reused_across_instances(tmp_path):
+    """Test a second process-like instance reuses the stored token"""
+    cache = TokenCache(tmp_path / 'tokens.json')
+    CachedTokenCredentials(_inner(), 'key', cache=cache).refresh(Mock())
+
+    other = _inner('other-token')
+    credentials = CachedTokenCredentials(other, 'key', cache=cache)
+    credentials.refresh(Mock())
+
+    assert credentials.token == 'fresh-token'
+    other.refresh.assert_not_called()
+
+
+def test_token_near_expiry_is_refreshed(tmp_path):
+    """Test tokens within the refresh margin are not reused"""
+    cache = TokenCache(tmp_path / 'tokens.json')
+    CachedTokenCredentials(_inner(lifetime=60), 'key', cache=cache).refresh(Mock())
+
+    other = _inner('other-token')
+    credentials = CachedTokenCredentials(other, 'key', cache=cache)
+    credentials.refresh(Mock())
+
+    assert credentials.token == 'other-token'
+    other.refresh.assert_called_once()
+
+
+def test_store_drops_expired_entries():
+    """Test expired tokens are pruned when another is written"""
+    state = {'old': {'token': 't', 'expiry': 100}}
+
+    TokenCache.store(state, 'new', 'u', 10000, now=200)
+
+    assert list(state) == ['new']
+    assert TokenCache.lookup(state, 'new', now=200) == ('u', 10000)
+    assert TokenCache.lookup(state, 'new', now=9800) is None
+
+
+def _refresh_in_process(path, results):
+    refreshes = []
+    inner = _inner()
+    inner.refresh.side_effect = lambda request: (
+        refreshes.append(1), time.sleep(0.2),
+        setattr(inner, 'token', 'shared'),
+        setattr(inner, 'expiry', datetime.datetime.utcnow() + datetime.timedelta(hours=1)),
+    )
+    CachedTokenCredentials(inner, 'key', cache=TokenCache(path)).refresh(Mock())
+    results.put(len(refreshes))
+
+
+def test_concurrent_processes_refresh_once(tmp_path):
+    """Test parallel processes wait for one refresh instead of each refreshing"""
+    path = tmp_path / 'tokens.json'
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=_refresh_in_process, args=(path, results)) for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert sum(results.get() for _ in processes) == 1
+
+
+def test_with_token_cache_scopes_credentials():
+    """Test the wrapped credentials are scoped for the Admin API"""
+    credentials = Mock()
+
+    wrapped = with_token_cache(credentials, '/a.json', ADMIN_SCOPES)
+
+    credentials.with_scopes.assert_called_once_with(list(ADMIN_SCOPES))
+    assert isinstance(wrapped, CachedTokenCredentials)
+
+
+@patch('ga_cli.auth.service_account')
+@patch('ga_cli.auth.AnalyticsAdminServiceClient')
+def test_auth_manager_uses_cache_when_enabled(mock_client_class, mock_service_account):
+    """Test AuthManager wraps credentials only when [auth] token_cache is set"""
+    config_manager = ConfigManager()
+    config_manager.config['auth'] = {'token_cache': 'true'}
+    config_manager.save()
+
+    AuthManager(credentials_path='/path/to/creds.json').get_client()
+
+    credentials = mock_client_class.call_args.kwargs['credentials']
+    assert isinstance(credentials, CachedTokenCredentials)
@@ -0,0 +1,140 @@
+"""Tests for tracing spans"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+import pytest
+from click.testing import CliRunner
+from google.api_core import exceptions
+from ga_cli.cli import cli
+from ga_cli.concurrency import map_bounded
+from ga_cli.config import ConfigManager
+from ga_cli.tracing import Tracer, resource_getter, tracer
+
+
+@pytest.fixture
+def trace_file(isolated_home):
+    """Switch tracing on in the config file and return the trace file"""
+    path = isolated_home / 'trace.ndjson'
+    config_manager = ConfigManager()
+    config_manager.config['tracing'] = {'enabled': 'true', 'file': str(path)}
+    config_manager.save()
+    yield path
+    tracer.enabled = False
+    tracer.otel = None
+    tracer.close()
+
+
+def _spans(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _invoke(args):
+    return CliRunner().invoke(cli, ['--credentials', '/tmp/creds.json', '--no-cache'] + args)
+
+
+def test_disabled_by_default():
+    """Test no spans are recorded without [tracing] enabled"""
+    t = Tracer()
+    t.configure()
+
+    assert not t.enabled
+    assert t.span('rpc', 'get_property').__class__.__name__ == 'nullcontext'
+
+
+def test_resource_getter():
+    """Test ID arguments are joined into a resource name"""
+    def _get_datastream_with_retry(client, property_id, stream_id, timeout=None):
+        pass
+
+    get = resource_getter(_get_datastream_with_retry)
+
+    assert get(('client', '1', '2'), {}) == 'properties/1/dataStreams/2'
+    assert get(('client',), {'property_id': '1', 'stream_id': '2'}) == 'properties/1/dataStreams/2'
+    assert resource_getter(lambda client, page_token: None)(('client', ''), {}) is None
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_list_spans_carry_pages_and_parent(mock_auth, trace_file, paged_response):
+    """Test each page is a child span of the command, numbered in order"""
+    properties = [SimpleNamespace(name=f"properties/{i}", display_name='P', property_type=None,
+                                  time_zone='UTC', currency_code='USD', parent='accounts/7')
+                  for i in range(5)]
+    client = mock_auth.return_value.get_client.return_value
+    client.list_properties.side_effect = paged_response(properties, 'properties')
+
+    result = _invoke(['properties', 'list', '7', '--format', 'ids'])
+
+    assert result.exit_code == 0
+    (command,) = [s for s in _spans(trace_file) if s['kind'] == 'command']
+    rpcs = [s for s in _spans(trace_file) if s['kind'] == 'rpc']
+    assert command['operation'] == 'properties list'
+    assert command['status'] == 'OK'
+    assert [s['page'] for s in rpcs] == [1, 2, 3]
+    assert {s['operation'] for s in rpcs} == {'list_properties'}
+    assert {s['resource'] for s in rpcs} == {'accounts/7'}
+    assert {s['parent_id'] for s in rpcs} == {command['span_id']}
+    assert {s['trace_id'] for s in rpcs} == {command['trace_id']}
+
+
+@patch('ga_cli.retry.time.sleep')
+@patch('ga_cli.decorators.AuthManager')
+def test_retried_attempts_and_error_status(mock_auth, mock_sleep, trace_file):
+    """Test every attempt is a span and the command records the final error"""
+    client = mock_auth.return_value.get_client.return_value
+    client.get_property.side_effect = [
+        exceptions.ServiceUnavailable('down'), exceptions.NotFound('gone'),
+    ]
+
+    result = _invoke(['properties', 'get', '123'])
+
+    assert result.exit_code == 1
+    spans = _spans(trace_file)
+    assert [(s['attempt'], s['status']) for s in spans if s['kind'] == 'rpc'] == [
+        (1, 'ServiceUnavailable'), (2, 'NotFound'),
+    ]
+    assert spans[-1]['kind'] == 'command'
+    assert spans[-1]['status'] == 'NotFound'
+    assert spans[0]['resource'] == 'properties/123'
+    assert spans[0]['duration_ms'] >= 0
+
+
+def test_worker_threads_keep_the_parent_span(trace_file):
+    """Test spans opened on fan-out workers are children of the caller's span"""
+    tracer.configure()
+
+    def work(item):
+        with tracer.span('rpc', 'list_properties', f"accounts/{item}"):
+            return item
+
+    with tracer.span('command', 'properties list') as command:
+        list(map_bounded(work, range(4), max_workers=2))
+
+    children = [s for s in _spans(trace_file) if s['kind'] == 'rpc']
+    assert len(children) == 4
+    assert {s['parent_id'] for s in children} == {command.span_id}
+
+
+def test_opentelemetry_bridge(trace_file):
+    """Test spans are mirrored onto the OpenTelemetry API when asked for"""
+    config_manager = ConfigManager()
+    config_manager.config['tracing'] = {
+        'enabled': 'true', 'file': str(trace_file), 'opentelemetry': 'true',
+    }
+    config_manager.save()
+    otel_span = Mock()
+    trace_api = Mock()
+    trace_api.get_tracer.return_value.start_span.return_value = otel_span
+
+    with patch.dict('sys.modules', {'opentelemetry': Mock(trace=trace_api)}):
+        tracer.configure()
+
+    with pytest.raises(RuntimeError):
+        with tracer.span('rpc', 'get_account', 'accounts/1', attempt=1):
+            raise RuntimeError('boom')
+
+    started = trace_api.get_tracer.return_value.start_span.call_args
+    assert started.args == ('get_account',)
+    assert started.kwargs['attributes']['ga_cli.resource'] == 'accounts/1'
+    otel_span.set_status.assert_called_once()
+    otel_span.end.assert_called_once()
@@ -0,0 +1,115 @@
+"""Tests for transport and per-RPC timeout settings"""
+
+import functools
+from unittest.mock import Mock, patch
+from google.analytics.admin import AnalyticsAdminServiceAsyncClient, AnalyticsAdminServiceClient
+from ga_cli.cli import cli
+from ga_cli.config import ConfigManager
+from ga_cli.retry import RetryPolicy, retry_on_transient_error
+from ga_cli.transport import TimeoutClient, TransportSettings, transport_settings
+
+
+def test_configured_from_config_file():
+    """Test settings are read from the [transport] section"""
+    config_manager = ConfigManager()
+    config_manager.config['transport'] = {
+        'transport': 'rest', 'timeout': '12.5', 'keepalive_time': 'often',
+    }
+    config_manager.save()
+
+    settings = TransportSettings()
+    settings.configure()
+
+    assert settings.transport == 'rest'
+    assert settings.timeout == 12.5
+    assert settings.keepalive_time == 0
+
+
+def test_flags_override_config_file():
+    """Test --transport and --timeout win over the config file"""
+    config_manager = ConfigManager()
+    config_manager.config['transport'] = {'transport': 'carrier-pigeon', 'timeout': '12'}
+    config_manager.save()
+
+    settings = TransportSettings()
+    settings.configure(transport='grpc', timeout=5)
+
+    assert settings.transport == 'grpc'
+    assert settings.timeout == 5
+
+
+def test_client_transport_names():
+    """Test plain transports are passed by name and async clients use gRPC"""
+    assert TransportSettings(transport='rest').client_transport(AnalyticsAdminServiceClient) == 'rest'
+    assert TransportSettings().client_transport(AnalyticsAdminServiceClient) == 'grpc'
+    assert TransportSettings(transport='rest').client_transport(
+        AnalyticsAdminServiceAsyncClient
+    ) == 'grpc_asyncio'
+
+
+def test_keepalive_reaches_the_channel():
+    """Test keepalive settings become gRPC channel options"""
+    settings = TransportSettings(keepalive_time=60, keepalive_timeout=5)
+
+    transport = settings.client_transport(AnalyticsAdminServiceClient)
+    assert isinstance(transport, functools.partial)
+
+    transport_class = transport.func
+    with patch.object(transport_class, 'create_channel') as create_channel:
+        transport.keywords['channel']('example.com', options=[('grpc.max_send_message_length', -1)])
+
+    options = dict(create_channel.call_args.kwargs['options'])
+    assert options['grpc.keepalive_time_ms'] == 60000
+    assert options['grpc.keepalive_timeout_ms'] == 5000
+    assert options['grpc.max_send_message_length'] == -1
+
+
+def test_attempt_timeout_capped_by_deadline(monkeypatch):
+    """Test each attempt gets the RPC timeout, or what is left of the budget"""
+    monkeypatch.setattr(transport_settings, 'timeout', 30.0)
+    timeouts = []
+
+    @retry_on_transient_error(policy=RetryPolicy(deadline=10))
+    def fetch(timeout=None):
+        timeouts.append(timeout)
+        return 'ok'
+
+    @retry_on_transient_error(policy=RetryPolicy(deadline=0))
+    def fetch_unbounded(timeout=None):
+        timeouts.append(timeout)
+
+    fetch()
+    fetch_unbounded()
+
+    assert 9 < timeouts[0] <= 10
+    assert timeouts[1] == 30.0
+
+
+def test_timeout_client_overrides_configured_timeout(monkeypatch):
+    """Test a TimeoutClient's timeout is used for its requests only"""
+    monkeypatch.setattr(transport_settings, 'timeout', 30.0)
+    client = Mock()
+
+    @retry_on_transient_error(policy=RetryPolicy(deadline=0))
+    def _get_property_with_retry(client, property_id, timeout=None):
+        return client.get_property(name=property_id, timeout=timeout)
+
+    _get_property_with_retry(TimeoutClient(client, 5), '1')
+    _get_property_with_retry(client, '2')
+
+    assert [c.kwargs['timeout'] for c in client.get_property.call_args_list] == [5, 30.0]
+
+
+@patch('ga_cli.decorators.AuthManager')
+def test_timeout_flag_reaches_rpcs(mock_auth, cli_runner, mock_property, mock_credentials_path):
+    """Test --timeout is passed to the client with every request"""
+    mock_client = Mock()
+    mock_client.get_property.return_value = mock_property
+    mock_auth.return_value.get_client.return_value = mock_client
+
+    result = cli_runner.invoke(cli, [
+        '--credentials', mock_credentials_path, '--timeout', '5', 'properties', 'get', '987654'
+    ])
+
+    assert result.exit_code == 0
+    assert mock_client.get_property.call_args.kwargs['timeout'] == 5
@@ -5,10 +5,13 @@ import click
 from ga_cli.validators import (
     validate_account_id,
     validate_property_id,
+    validate_property_ids,
     validate_url,
     validate_timezone,
     validate_currency,
+    validate_industry,
     validate_stream_id,
+    parse_id_list,
 )
 
 
@@ -45,6 +48,19 @@ class TestValidatePropertyId:
             validate_property_id(None, None, "prop-123")
 
 
+class TestValidatePropertyIds:
+    """Test validation of several property IDs"""
+
+    def test_strips_resource_prefix(self):
+        """Test properties/ prefixes are accepted and stripped"""
+        assert validate_property_ids(None, None, ("1", "properties/2")) == ("1", "2")
+
+    def test_rejects_any_invalid_id(self):
+        """Test one bad ID fails the whole argument"""
+        with pytest.raises(click.BadParameter, match="Property ID must be numeric"):
+            validate_property_ids(None, None, ("1", "abc"))
+
+
 class TestValidateUrl:
     """Test URL validation"""
 
@@ -92,6 +108,10 @@ class TestValidateTimezone:
         with pytest.raises(click.BadParameter, match="Invalid timezone"):
             validate_timezone(None, None, "Invalid/Timezone")
 
+    def test_canonical_spelling(self):
+        """Test timezone names are matched case-insensitively"""
+        assert validate_timezone(None, None, "america/new_york") == "America/New_York"
+
     def test_empty_timezone(self):
         """Test validation with empty value"""
         result = validate_timezone(None, None, None)
@@ -126,12 +146,31 @@ class TestValidateCurrency:
         with pytest.raises(click.BadParameter, match="Currency must be 3-letter code"):
             validate_currency(None, None, "usd")
 
+    def test_unknown_currency(self):
+        """Test codes outside ISO 4217 are rejected"""
+        with pytest.raises(click.BadParameter, match="Unknown currency code: ABC"):
+            validate_currency(None, None, "ABC")
+
     def test_empty_currency(self):
         """Test validation with empty value"""
         result = validate_currency(None, None, None)
         assert result is None
 
 
+class TestValidateIndustry:
+    """Test industry category validation"""
+
+    def test_valid_industry(self):
+        """Test categories are accepted in any case and upper-cased"""
+        assert validate_industry(None, None, "technology") == "TECHNOLOGY"
+
+    def test_invalid_industry(self):
+        """Test unknown and unspecified categories are rejected"""
+        for value in ("ROCKETS", "INDUSTRY_CATEGORY_UNSPECIFIED"):
+            with pytest.raises(click.BadParameter, match="Invalid industry category"):
+                validate_industry(None, None, value)
+
+
 class TestValidateStreamId:
     """Test stream ID validation"""
 
@@ -144,3 +183,21 @@ class TestValidateStreamId:
         """Test validation rejects non-numeric stream ID"""
         with pytest.raises(click.BadParameter, match="Stream ID must be numeric"):
             validate_stream_id(None, None, "stream-123")
+
+
+class TestParseIdList:
+    """Test ID list parsing"""
+
+    def test_skips_blanks_comments_and_duplicates(self):
+        """Test parsing ignores noise and keeps first occurrences in order"""
+        lines = ['123\n', '\n', '# header\n', '456  # trailing\n', '123\n']
+        assert parse_id_list(lines, validate_account_id) == ['123', '456']
+
+    def test_strips_resource_prefix(self):
+        """Test resource names are reduced to IDs"""
+        assert parse_id_list(['accounts/789'], validate_account_id, prefix='accounts/') == ['789']
+
+    def test_reports_line_number(self):
+        """Test invalid IDs name the offending line"""
+        with pytest.raises(click.BadParameter, match="line 2: Account ID must be numeric"):
+            parse_id_list(['1', 'abc'], validate_account_id)